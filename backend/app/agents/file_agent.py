@@ -1,22 +1,32 @@
-from groq import Groq
-import requests
-from typing import Dict, Any
-import aiohttp
+from typing import Dict, Any, Optional
+import asyncio
 import base64
-import google.generativeai as genai
-import io
-from PyPDF2 import PdfReader
-from googletrans import Translator
+from ..services.llm import LLMClient
+from ..services.pdf import PDFExtractor
+from ..services.http import HTTPClient, http_client as default_http_client
+from .summarizer import MapReduceSummarizer
 
 class FileAgent:
-    def __init__(self, groq_api_key: str, gemini_api_key: str = None):
-        self.groq_client = Groq(api_key=groq_api_key)
-        self.translator = Translator()
-        if gemini_api_key:
-            genai.configure(api_key=gemini_api_key)
-            self.gemini_model = genai.GenerativeModel('gemini-pro')
-        else:
-            self.gemini_model = None
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        summarizer: MapReduceSummarizer = None,
+        pdf_extractor: PDFExtractor = None,
+        http_client: HTTPClient = None
+    ):
+        self.llm = llm_client
+        self.http_client = http_client or default_http_client
+        self.summarizer = summarizer or MapReduceSummarizer(llm_client)
+        self.pdf_extractor = pdf_extractor or PDFExtractor()
+        self._translator = None
+
+    @property
+    def translator(self):
+        """Google Translate client, created (and its module imported) on first use."""
+        if self._translator is None:
+            from googletrans import Translator
+            self._translator = Translator()
+        return self._translator
         
     async def split_content(self, content: str, chunk_size: int = 4000) -> list[str]:
         """Split content into chunks of approximately chunk_size characters."""
@@ -43,109 +53,51 @@ class FileAgent:
 
     async def extract_text_from_pdf(self, content: bytes) -> str:
         """Extract text from PDF content."""
-        pdf_file = io.BytesIO(content)
-        pdf_reader = PdfReader(pdf_file)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        return text
+        return await self.pdf_extractor.extract_text(content)
+
+    async def download_file(self, firebase_url: str) -> bytes:
+        """Download raw file bytes from a Firebase URL."""
+        response = await self.http_client.get(firebase_url)
+        if response.status == 200:
+            return response.body
+            
+        raise Exception(f"Failed to read file: {response.status}")
+
+    async def parse_file_content(self, content: bytes, content_type: str = None) -> tuple[bytes | str, bool]:
+        """Turn raw file bytes into text where the content type allows it."""
+        # Handle different content types
+        if content_type:
+            if content_type.startswith('text/'):
+                return content.decode('utf-8'), True
+            elif content_type == 'application/pdf':
+                text = await self.extract_text_from_pdf(content)
+                return text, True
+        
+        # For other binary files
+        return content, False
+
+    async def parse_file(self, path: str, content_type: str = None) -> tuple[Optional[str], bool]:
+        """Like ``parse_file_content`` for a file on disk; binary files are not read."""
+        if content_type:
+            if content_type.startswith('text/'):
+                with open(path, encoding='utf-8') as f:
+                    return await asyncio.to_thread(f.read), True
+            elif content_type == 'application/pdf':
+                return await self.pdf_extractor.extract_text(path), True
+        return None, False
 
     async def read_file_content(self, firebase_url: str, content_type: str = None) -> tuple[bytes | str, bool]:
         """Read file content from Firebase URL."""
-        async with aiohttp.ClientSession() as session:
-            async with session.get(firebase_url) as response:
-                if response.status == 200:
-                    content = await response.read()
-                    
-                    # Handle different content types
-                    if content_type:
-                        if content_type.startswith('text/'):
-                            return content.decode('utf-8'), True
-                        elif content_type == 'application/pdf':
-                            text = await self.extract_text_from_pdf(content)
-                            return text, True
-                    
-                    # For other binary files
-                    return content, False
-                    
-                raise Exception(f"Failed to read file: {response.status}")
+        content = await self.download_file(firebase_url)
+        return await self.parse_file_content(content, content_type)
 
     async def summarize_content(self, content: str, max_length: int = 500) -> str:
-        """Summarize content using Groq with fallback to Gemini."""
-        chunks = await self.split_content(content)
-        summaries = []
-        
-        for chunk in chunks:
-            try:
-                # Try Groq first
-                prompt = f"""Summarize the following content in a clear and concise way:
-
-                {chunk}
-                """
-                
-                response = self.groq_client.chat.completions.create(
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a skilled summarizer that creates clear, accurate summaries."
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    model="mixtral-8x7b-32768",
-                    temperature=0.3,
-                    max_tokens=1000
-                )
-                
-                summaries.append(response.choices[0].message.content)
-                
-            except Exception as e:
-                if "rate_limit_exceeded" in str(e) and self.gemini_model:
-                    # Fallback to Gemini if Groq hits token limit
-                    try:
-                        response = self.gemini_model.generate_content(prompt)
-                        summaries.append(response.text)
-                    except Exception as gemini_error:
-                        raise Exception(f"Both Groq and Gemini failed: {str(e)} | {str(gemini_error)}")
-                else:
-                    raise e
-    
-        # If we have multiple summaries, combine them
-        if len(summaries) > 1:
-            combined_summary = "\n\n".join(summaries)
-            # Create a final summary of the combined summaries
-            final_prompt = f"""Create a final summary under {max_length} characters from these section summaries:
+        """Summarize content with a concurrent map-reduce over token-sized chunks."""
+        return await self.summarizer.summarize(content, max_length)
 
-            {combined_summary}
-            """
-            
-            try:
-                final_response = self.groq_client.chat.completions.create(
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a skilled summarizer that creates clear, accurate summaries."
-                        },
-                        {
-                            "role": "user",
-                            "content": final_prompt
-                        }
-                    ],
-                    model="mixtral-8x7b-32768",
-                    temperature=0.3,
-                    max_tokens=1000
-                )
-                return final_response.choices[0].message.content
-                
-            except Exception as e:
-                if "rate_limit_exceeded" in str(e) and self.gemini_model:
-                    response = self.gemini_model.generate_content(final_prompt)
-                    return response.text
-                raise e
-        
-        return summaries[0][:max_length]
+    def summarize_content_stream(self, content: str, max_length: int = 500):
+        """Stream chunk summaries as they finish, followed by the final summary."""
+        return self.summarizer.stream(content, max_length)
 
     async def translate_content(self, content: str, target_language: str) -> str:
         """Translate content using Google Translate."""
@@ -155,7 +107,7 @@ class FileAgent:
             translated_chunks = []
             
             for chunk in chunks:
-                translation = self.translator.translate(chunk, dest=target_language)
+                translation = await self.translator.translate(chunk, dest=target_language)
                 translated_chunks.append(translation.text)
             
             return '\n\n'.join(translated_chunks)
@@ -170,7 +122,7 @@ class FileAgent:
                 Provide only the translated text without any additional comments or explanations.
                 """
                 
-                response = self.groq_client.chat.completions.create(
+                response = await self.llm.chat(
                     messages=[
                         {
                             "role": "system",
@@ -186,10 +138,10 @@ class FileAgent:
                     max_tokens=2000
                 )
                 
-                return response.choices[0].message.content
+                return response
                 
             except Exception as groq_error:
-                if "rate_limit_exceeded" in str(groq_error) and self.gemini_model:
-                    response = self.gemini_model.generate_content(prompt)
-                    return response.text
+                if "rate_limit_exceeded" in str(groq_error) and self.llm.gemini_model:
+                    response = await self.llm.generate(prompt)
+                    return response
                 raise Exception(f"Translation failed: {str(e)} | Groq fallback failed: {str(groq_error)}")
\ No newline at end of file
@@ -1,53 +1,241 @@
-from groq import Groq
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+import asyncio
+import json
+import logging
+from ..services.llm import LLMClient, parse_json_response
+
+logger = logging.getLogger(__name__)
+
+SENTIMENT_LABELS = ("positive", "negative", "neutral")
+
+# What the LLM is asked for, with and without a local sentiment backend
+FULL_ANALYSIS_STEPS = """1. A sentiment score between 0 and 5 (0 being most negative, 5 being most positive)
+        2. A sentiment label (positive, negative, or neutral)
+        3. Key topics mentioned
+        4. A brief summary"""
+TOPIC_ANALYSIS_STEPS = """1. Key topics mentioned
+        2. A brief summary"""
+SENTIMENT_FIELDS = """"sentiment_score": <score>,
+            "sentiment_label": "<label>",
+            """
+
+def default_feedback_analysis(sentiment: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    if sentiment:
+        # Sentiment came from the local backend; only topics and summary are missing
+        return {**sentiment, "topics": [], "summary": ""}
+    return {
+        "sentiment_score": 0.5,
+        "sentiment_label": "neutral",
+        "topics": ["error in analysis"],
+        "summary": "Error analyzing feedback"
+    }
+
+def clean_feedback_analysis(raw: Any, sentiment: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """Validate one feedback analysis, or return None if it is unusable.
+
+    A ``sentiment`` from the local backend takes the place of the LLM's.
+    """
+    if not isinstance(raw, dict):
+        return None
+    if sentiment:
+        score, label = sentiment["sentiment_score"], sentiment["sentiment_label"]
+    else:
+        try:
+            score = min(max(float(raw["sentiment_score"]), 0.0), 5.0)
+        except (KeyError, TypeError, ValueError):
+            return None
+        label = str(raw.get("sentiment_label", "")).strip().lower()
+        if label not in SENTIMENT_LABELS:
+            label = "positive" if score > 3 else "negative" if score < 2 else "neutral"
+
+    topics = raw.get("topics")
+    if not isinstance(topics, list):
+        topics = []
+
+    return {
+        "sentiment_score": score,
+        "sentiment_label": label,
+        # Topics are stored comma-separated, so they cannot contain commas
+        "topics": [str(topic).replace(",", " ").strip() for topic in topics if str(topic).strip()],
+        "summary": str(raw.get("summary") or "")
+    }
 
 class GroqAnalyzer:
-    def __init__(self, api_key: str):
-        self.client = Groq(api_key=api_key)
-        
-    def analyze_feedback(self, text: str) -> Dict[str, Any]:
+    """Feedback analysis with Groq.
+
+    With a local ``sentiment_backend`` (see ``sentiment_analysis``), sentiment
+    is scored on the CPU and Groq is only asked for topics and a summary; if
+    Groq fails, items still get their sentiment.
+    """
+
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        batch_size: int = 20,
+        batch_max_chars: int = 12000,
+        max_concurrency: int = 4,
+        sentiment_backend=None
+    ):
+        self.llm = llm_client
+        self.batch_size = batch_size
+        self.batch_max_chars = batch_max_chars
+        self.max_concurrency = max_concurrency
+        self.sentiment_backend = sentiment_backend
+
+    async def _local_sentiments(self, texts: List[str]) -> List[Optional[Dict[str, Any]]]:
+        if self.sentiment_backend is None:
+            return [None] * len(texts)
+        # Model inference is CPU-bound, so keep it off the event loop
+        return await asyncio.to_thread(self.sentiment_backend.analyze_batch, texts)
+
+    def _prompt_parts(self):
+        if self.sentiment_backend is None:
+            return FULL_ANALYSIS_STEPS, SENTIMENT_FIELDS
+        return TOPIC_ANALYSIS_STEPS, ""
+
+    async def analyze_feedback(self, text: str) -> Dict[str, Any]:
         """Analyze feedback using Groq LLM API."""
+        sentiment = (await self._local_sentiments([text]))[0]
+        steps, sentiment_fields = self._prompt_parts()
         prompt = f"""Analyze the following feedback and provide:
-        1. A sentiment score between 0 and 5 (0 being most negative, 5 being most positive)
-        2. A sentiment label (positive, negative, or neutral)
-        3. Key topics mentioned
-        4. A brief summary
-        
+        {steps}
+
         Feedback: "{text}"
-        
+
         Provide the response in this exact format:
         {{
-            "sentiment_score": <score>,
-            "sentiment_label": "<label>",
-            "topics": ["topic1", "topic2"],
+            {sentiment_fields}"topics": ["topic1", "topic2"],
             "summary": "<brief summary>"
         }}
         """
-        
-        response = self.client.chat.completions.create(
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are an AI trained to analyze feedback and provide structured analysis."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            model="mixtral-8x7b-32768",  # or any other Groq model
-            temperature=0.1,
-            max_tokens=500
-        )
-        
-        # Parse the response
+
         try:
-            analysis = eval(response.choices[0].message.content)
-            return analysis
+            response = await self.llm.chat(
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are an AI trained to analyze feedback and provide structured analysis."
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                model="mixtral-8x7b-32768",  # or any other Groq model
+                temperature=0.1,
+                max_tokens=500,
+                validate=lambda content: clean_feedback_analysis(parse_json_response(content), sentiment) is not None
+            )
+            # Parse the response as data; never evaluate model output
+            analysis = clean_feedback_analysis(parse_json_response(response), sentiment)
         except Exception as e:
-            return {
-                "sentiment_score": 0.5,
-                "sentiment_label": "neutral",
-                "topics": ["error in analysis"],
-                "summary": "Error analyzing feedback"
-            } 
\ No newline at end of file
+            logger.warning("Feedback analysis error: %s", e)
+            analysis = None
+        return analysis or default_feedback_analysis(sentiment)
+
+    def _batches(self, texts: List[str]) -> List[List[int]]:
+        """Group item indexes so each prompt stays within the item and size limits."""
+        batches, current, size = [], [], 0
+        for index, text in enumerate(texts):
+            if current and (len(current) >= self.batch_size or size + len(text) > self.batch_max_chars):
+                batches.append(current)
+                current, size = [], 0
+            current.append(index)
+            size += len(text)
+        if current:
+            batches.append(current)
+        return batches
+
+    async def _analyze_batch(
+        self,
+        texts: List[str],
+        sentiments: List[Optional[Dict[str, Any]]],
+        use_cache: bool = True
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Analyze several feedback items in one LLM call; None marks a missing result."""
+        items = "\n".join(f"[{index}] {json.dumps(text)}" for index, text in enumerate(texts))
+        steps, sentiment_fields = self._prompt_parts()
+        prompt = f"""Analyze each numbered piece of public feedback below. For every item provide:
+        {steps}
+
+        Feedback items:
+        {items}
+
+        Respond with a JSON object in this exact format, with one result per item:
+        {{
+            "results": [
+                {{
+                    "index": <item number>,
+                    {sentiment_fields}"topics": ["topic1", "topic2"],
+                    "summary": "<brief summary>"
+                }}
+            ]
+        }}
+        """
+        try:
+            response = await self.llm.chat(
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are an AI trained to analyze feedback and provide structured analysis. Always respond with valid JSON."
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                model="mixtral-8x7b-32768",
+                temperature=0.1,
+                max_tokens=150 * len(texts) + 100,
+                response_format={"type": "json_object"},
+                use_cache=use_cache,
+                validate=lambda content: isinstance(parse_json_response(content).get("results"), list)
+            )
+            results = parse_json_response(response).get("results", [])
+        except Exception as e:
+            logger.warning("Batch feedback analysis error: %s", e)
+            return [None] * len(texts)
+
+        analyses: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        for result in results if isinstance(results, list) else []:
+            index = result.get("index") if isinstance(result, dict) else None
+            if isinstance(index, int) and 0 <= index < len(texts) and analyses[index] is None:
+                analyses[index] = clean_feedback_analysis(result, sentiments[index])
+        return analyses
+
+    async def analyze_feedback_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Analyze many feedback items, packing several into each LLM prompt.
+
+        Prompts run concurrently up to ``max_concurrency``. Items the model
+        skipped or answered malformed are retried once and otherwise get the
+        default analysis, so results always line up with ``texts``.
+        """
+        sentiments = await self._local_sentiments(texts)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(indexes: List[int], use_cache: bool) -> List[Optional[Dict[str, Any]]]:
+            async with semaphore:
+                return await self._analyze_batch(
+                    [texts[index] for index in indexes],
+                    [sentiments[index] for index in indexes],
+                    use_cache=use_cache
+                )
+
+        analyses: List[Optional[Dict[str, Any]]] = [None] * len(texts)
+        pending = list(range(len(texts)))
+        for attempt in range(2):
+            batches = self._batches([texts[index] for index in pending])
+            batches = [[pending[position] for position in batch] for batch in batches]
+            # A retried prompt can repeat an earlier one exactly, so it must reach the model
+            batch_results = await asyncio.gather(*[run(batch, use_cache=attempt == 0) for batch in batches])
+            for indexes, results in zip(batches, batch_results):
+                for index, result in zip(indexes, results):
+                    analyses[index] = result
+            pending = [index for index in pending if analyses[index] is None]
+            if not pending:
+                break
+
+        return [
+            analysis or default_feedback_analysis(sentiment)
+            for analysis, sentiment in zip(analyses, sentiments)
+        ]
@@ -1,41 +1,133 @@
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+from collections import Counter
 from datetime import datetime
+import asyncio
+import hashlib
 import json
-import speech_recognition as sr
-from pydub import AudioSegment
-import io
+import logging
+import re
+from ..services.llm import LLMClient, has_json_fields, is_json, parse_json_response
+from ..services.transcription import Transcriber, create_recognizer, format_transcript
+from .summarizer import split_into_token_chunks
+
+logger = logging.getLogger(__name__)
+
+LEVELS = {"low": 0, "medium": 1, "high": 2}
+ANALYSIS_FIELDS = (
+    "summary", "key_topics", "action_items",
+    "participants", "follow_up_needed", "sentiment_analysis"
+)
+
+def normalize_key(text: Any) -> str:
+    """Comparison key that ignores case, punctuation and spacing."""
+    return " ".join(re.findall(r"\w+", str(text).lower()))
+
+def _merge_unique(*lists: List[Any]) -> List[Any]:
+    """Concatenate lists, dropping items that normalize to one already seen."""
+    seen = set()
+    merged = []
+    for items in lists:
+        for item in items or []:
+            key = normalize_key(item)
+            if key and key not in seen:
+                seen.add(key)
+                merged.append(item)
+    return merged
+
+def _higher_level(a: Optional[str], b: Optional[str]) -> Optional[str]:
+    if not a:
+        return b
+    if not b:
+        return a
+    return a if LEVELS.get(str(a).lower(), -1) >= LEVELS.get(str(b).lower(), -1) else b
+
+def _merge_by(items: List[Dict[str, Any]], key_field: str, merge) -> List[Dict[str, Any]]:
+    """Group dict items by a normalized field, folding duplicates together."""
+    merged: Dict[str, Dict[str, Any]] = {}
+    for item in items:
+        if not isinstance(item, dict) or not item.get(key_field):
+            continue
+        key = normalize_key(item[key_field])
+        if key in merged:
+            merge(merged[key], item)
+        else:
+            merged[key] = dict(item)
+    return list(merged.values())
+
+def _merge_topic(topic: Dict[str, Any], other: Dict[str, Any]):
+    topic["key_points"] = _merge_unique(topic.get("key_points"), other.get("key_points"))
+    topic["decisions_made"] = _merge_unique(topic.get("decisions_made"), other.get("decisions_made"))
+    # Leave a level neither window gave unset, so the stored default applies
+    level = _higher_level(topic.get("importance_level"), other.get("importance_level"))
+    if level:
+        topic["importance_level"] = level
+
+def _merge_action_item(item: Dict[str, Any], other: Dict[str, Any]):
+    for field, value in other.items():
+        if value and not item.get(field):
+            item[field] = value
+    priority = _higher_level(item.get("priority"), other.get("priority"))
+    if priority:
+        item["priority"] = priority
+
+def _merge_participant(participant: Dict[str, Any], other: Dict[str, Any]):
+    participant["contributions"] = _merge_unique(participant.get("contributions"), other.get("contributions"))
+    if not participant.get("role") and other.get("role"):
+        participant["role"] = other["role"]
+
+def merge_analyses(analyses: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine per-window analyses into one, deduplicating repeated entries.
+
+    Topics, action items, participants and follow-ups seen in several windows
+    are merged by name; the overall tone is the most common window tone. The
+    summary is left for the caller to combine.
+    """
+    def collect(field: str) -> List[Any]:
+        return [item for analysis in analyses for item in analysis.get(field) or []]
+
+    sentiments = [analysis.get("sentiment_analysis") or {} for analysis in analyses]
+    tones = Counter(
+        str(sentiment.get("overall_tone", "neutral")).lower() for sentiment in sentiments
+    )
+
+    return {
+        "summary": " ".join(analysis.get("summary", "") for analysis in analyses).strip(),
+        "key_topics": _merge_by(collect("key_topics"), "topic", _merge_topic),
+        "action_items": _merge_by(collect("action_items"), "task", _merge_action_item),
+        "participants": _merge_by(collect("participants"), "name", _merge_participant),
+        "follow_up_needed": _merge_by(collect("follow_up_needed"), "item", _merge_action_item),
+        "sentiment_analysis": {
+            "overall_tone": tones.most_common(1)[0][0] if tones else "neutral",
+            "key_concerns": _merge_unique(*[sentiment.get("key_concerns") for sentiment in sentiments]),
+            "positive_highlights": _merge_unique(*[sentiment.get("positive_highlights") for sentiment in sentiments])
+        }
+    }
 
 class MeetingAnalyzer:
-    def __init__(self, groq_api_key: str, gemini_api_key: str):
-        """Initialize the meeting analyzer with necessary API keys."""
-        from groq import Groq
-        import google.generativeai as genai
-        
-        self.groq_client = Groq(api_key=groq_api_key)
-        genai.configure(api_key=gemini_api_key)
-        self.gemini_model = genai.GenerativeModel('gemini-pro')
-        self.recognizer = sr.Recognizer()
-
-    async def transcribe_audio(self, audio_file: bytes, file_format: str) -> str:
-        """Convert audio to text using speech recognition."""
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        transcriber: Transcriber = None,
+        window_tokens: int = 3000,
+        max_concurrency: int = 4
+    ):
+        """Initialize the meeting analyzer with the shared LLM client."""
+        self.llm = llm_client
+        self.transcriber = transcriber or Transcriber(create_recognizer("google"))
+        self.window_tokens = window_tokens
+        self.max_concurrency = max_concurrency
+
+    async def transcribe_audio(self, audio_path: str, file_format: str) -> str:
+        """Convert an audio file to a timestamped transcript using speech recognition."""
         try:
-            # Convert audio file to WAV format if needed
-            audio = AudioSegment.from_file(io.BytesIO(audio_file), format=file_format)
-            wav_data = io.BytesIO()
-            audio.export(wav_data, format="wav")
-            wav_data.seek(0)
-            
-            # Use speech recognition
-            with sr.AudioFile(wav_data) as source:
-                audio_data = self.recognizer.record(source)
-                transcript = self.recognizer.recognize_google(audio_data)
-                return transcript
+            segments = await self.transcriber.transcribe(audio_path, file_format)
+            return format_transcript(segments)
         except Exception as e:
             print(f"Transcription error: {str(e)}")
             return ""
 
-    async def analyze_meeting(self, transcript: str) -> Dict[str, Any]:
-        """Analyze meeting transcript using Groq with Gemini fallback."""
+    async def _analyze_window(self, transcript: str) -> Optional[Dict[str, Any]]:
+        """Analyze one transcript window using Groq with Gemini fallback."""
         prompt = f"""Analyze this meeting transcript and provide a structured summary:
 
         Transcript: "{transcript}"
@@ -83,7 +175,7 @@ class MeetingAnalyzer:
 
         try:
             # Try Groq first
-            response = self.groq_client.chat.completions.create(
+            response = await self.llm.chat(
                 messages=[
                     {
                         "role": "system",
@@ -96,55 +188,115 @@ class MeetingAnalyzer:
                 ],
                 model="mixtral-8x7b-32768",
                 temperature=0.2,
-                max_tokens=2000
+                max_tokens=2000,
+                validate=has_json_fields(*ANALYSIS_FIELDS)
             )
             
-            content = response.choices[0].message.content.strip()
+            content = response.strip()
             
         except Exception as groq_error:
             print(f"Groq analysis error: {str(groq_error)}")
             try:
                 print("Falling back to Gemini...")
                 # Fallback to Gemini
-                response = self.gemini_model.generate_content([
+                response = await self.llm.generate([
                     {
                         "role": "user",
                         "parts": [prompt]
                     }
-                ])
-                content = response.text.strip()
+                ], validate=has_json_fields(*ANALYSIS_FIELDS))
+                content = response.strip()
                 print("Gemini analysis successful")
             except Exception as gemini_error:
                 print(f"Gemini analysis error: {str(gemini_error)}")
-                return self._get_default_analysis()
+                return None
 
         try:
-            # Clean response if needed
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].strip()
-            
-            # Parse JSON
-            result = json.loads(content)
+            # Parse JSON, without any surrounding code fence
+            result = parse_json_response(content)
             
             # Validate required fields
-            required_fields = [
-                "summary", "key_topics", "action_items", 
-                "participants", "follow_up_needed", "sentiment_analysis"
-            ]
-            
-            for field in required_fields:
+            for field in ANALYSIS_FIELDS:
                 if field not in result:
                     print(f"Missing field {field} in response")
-                    return self._get_default_analysis()
+                    return None
             
             return result
             
         except json.JSONDecodeError as e:
             print(f"JSON Parse Error: {str(e)}")
             print(f"Raw Content: {content}")
-            return self._get_default_analysis()
+            return None
+
+    async def _combine_summaries(self, summaries: List[str]) -> str:
+        """Merge window summaries into one overview, or join them if the LLM fails."""
+        summary_list = "\n".join(f"- {summary}" for summary in summaries)
+        prompt = f"""These are summaries of consecutive parts of one meeting, in order.
+        Combine them into a single brief meeting overview:
+
+        {summary_list}
+        """
+        try:
+            response = await self.llm.chat(
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are an expert meeting analyst who writes concise meeting overviews."
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                model="mixtral-8x7b-32768",
+                temperature=0.2,
+                max_tokens=500
+            )
+            return response.strip()
+        except Exception as e:
+            logger.warning("Summary merge error: %s", e)
+            return " ".join(summaries)
+
+    async def analyze_transcript(
+        self,
+        transcript: str,
+        cached_segments: Optional[List[Dict[str, Any]]] = None
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """Analyze a transcript window by window and merge the results.
+
+        Windows are analyzed concurrently. Each window's analysis is returned
+        in ``segments`` keyed by a hash of its text; passing those back as
+        ``cached_segments`` after the transcript is extended re-analyzes only
+        the windows that changed, normally just the new tail.
+        """
+        windows = split_into_token_chunks(transcript, self.window_tokens) or [transcript]
+        cache = {segment["hash"]: segment["analysis"] for segment in cached_segments or []}
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def analyze(window: str):
+            digest = hashlib.sha256(window.encode()).hexdigest()
+            if digest in cache:
+                return digest, cache[digest]
+            async with semaphore:
+                return digest, await self._analyze_window(window)
+
+        results = await asyncio.gather(*[analyze(window) for window in windows])
+        segments = [{"hash": digest, "analysis": analysis} for digest, analysis in results if analysis]
+        analyses = [segment["analysis"] for segment in segments]
+
+        if not analyses:
+            return self._get_default_analysis(), segments
+        if len(analyses) == 1:
+            return analyses[0], segments
+
+        merged = merge_analyses(analyses)
+        merged["summary"] = await self._combine_summaries([analysis["summary"] for analysis in analyses])
+        return merged, segments
+
+    async def analyze_meeting(self, transcript: str) -> Dict[str, Any]:
+        """Analyze meeting transcript using Groq with Gemini fallback."""
+        analysis, _ = await self.analyze_transcript(transcript)
+        return analysis
 
     async def extract_entities(self, transcript: str) -> Dict[str, List[str]]:
         """Extract named entities from the transcript."""
@@ -162,7 +314,7 @@ class MeetingAnalyzer:
         }}"""
 
         try:
-            response = self.groq_client.chat.completions.create(
+            response = await self.llm.chat(
                 messages=[
                     {
                         "role": "system",
@@ -175,10 +327,11 @@ class MeetingAnalyzer:
                 ],
                 model="mixtral-8x7b-32768",
                 temperature=0.1,
-                max_tokens=1000
+                max_tokens=1000,
+                validate=is_json
             )
             
-            return json.loads(response.choices[0].message.content)
+            return parse_json_response(response)
         except Exception as e:
             print(f"Entity extraction error: {str(e)}")
             return {
@@ -221,7 +374,7 @@ class MeetingAnalyzer:
 
         try:
             # Try Groq first
-            response = self.groq_client.chat.completions.create(
+            response = await self.llm.chat(
                 messages=[
                     {
                         "role": "system",
@@ -237,19 +390,19 @@ class MeetingAnalyzer:
                 max_tokens=1500
             )
             
-            return response.choices[0].message.content
+            return response
             
         except Exception as groq_error:
             print(f"Groq minutes generation error: {str(groq_error)}")
             try:
                 print("Falling back to Gemini for minutes generation...")
-                response = self.gemini_model.generate_content([
+                response = await self.llm.generate([
                     {
                         "role": "user",
                         "parts": [prompt]
                     }
                 ])
-                return response.text
+                return response
             except Exception as gemini_error:
                 print(f"Gemini minutes generation error: {str(gemini_error)}")
                 return "Error generating meeting minutes. Please review the analysis directly." 
\ No newline at end of file
@@ -1,16 +1,103 @@
-from groq import Groq
-import google.generativeai as genai
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Awaitable, Callable, Optional
 from datetime import datetime
+import asyncio
 import json
+import logging
+import secrets
+import time
+from ..services.llm import LLMClient, has_json_fields, is_json, parse_json_response
+
+logger = logging.getLogger(__name__)
+
+ANALYSIS_FIELDS = (
+    "main_category", "sub_categories", "severity_level",
+    "entities_involved", "recommended_authorities", "risk_assessment",
+    "priority_level", "potential_evidence", "summary"
+)
+INVESTIGATION_FIELDS = (
+    "immediate_actions", "key_witnesses", "required_documents",
+    "investigation_timeline", "potential_challenges", "success_criteria"
+)
+
+def valid_credibility(response: str) -> bool:
+    """``validate`` callback for assess_credibility: a JSON object with a numeric score."""
+    result = parse_json_response(response)
+    float(result.get("credibility_score", 50.0))
+    return True
 
 class ReportAnalyzer:
-    def __init__(self, groq_api_key: str, gemini_api_key: str = None):
-        self.groq_client = Groq(api_key=groq_api_key)
-        if gemini_api_key:
-            genai.configure(api_key=gemini_api_key)
-            self.gemini_model = genai.GenerativeModel('gemini-pro')
-        
+    def __init__(self, llm_client: LLMClient):
+        self.llm = llm_client
+
+    async def _timed_stage(
+        self,
+        name: str,
+        stage: Awaitable,
+        timeout: float,
+        timings: Dict[str, float],
+        on_stage: Optional[Callable[[str, Any], Awaitable[None]]] = None
+    ):
+        """Await a pipeline stage with a timeout, recording its latency in milliseconds."""
+        start = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(stage, timeout)
+        finally:
+            timings[name] = round((time.perf_counter() - start) * 1000, 1)
+        if on_stage:
+            await on_stage(name, result)
+        return result
+
+    async def run_pipeline(
+        self,
+        report_content: str,
+        stage_timeout: float = 30.0,
+        on_stage: Optional[Callable[[str, Any], Awaitable[None]]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run the independent analysis stages concurrently, then derive the report ID.
+
+        The full analysis is required; sensitive-info detection and credibility
+        assessment degrade to partial results if they fail or time out.
+        ``on_stage`` is awaited with each stage's name and result as it finishes.
+        """
+        timings: Dict[str, float] = {}
+        start = time.perf_counter()
+
+        analysis, sensitive_info, credibility = await asyncio.gather(
+            self._timed_stage("analysis", self.analyze_report(report_content), stage_timeout, timings, on_stage),
+            self._timed_stage("sensitive_info", self.detect_sensitive_info(report_content), stage_timeout, timings, on_stage),
+            self._timed_stage("credibility", self.assess_credibility(report_content), stage_timeout, timings, on_stage),
+            return_exceptions=True
+        )
+
+        errors = {}
+        if isinstance(analysis, BaseException):
+            raise Exception(f"Report analysis failed: {str(analysis) or type(analysis).__name__}")
+        if isinstance(sensitive_info, BaseException):
+            errors["sensitive_info"] = str(sensitive_info) or type(sensitive_info).__name__
+            sensitive_info = None
+        if isinstance(credibility, BaseException):
+            errors["credibility"] = str(credibility) or type(credibility).__name__
+            credibility = {"credibility_score": 50.0}
+            if on_stage:
+                await on_stage("credibility", credibility)
+
+        report_id = await self._timed_stage("report_id", self.generate_report_id(analysis), stage_timeout, timings, on_stage)
+        timings["total"] = round((time.perf_counter() - start) * 1000, 1)
+
+        logger.info("Report pipeline timings (ms): %s", timings)
+        if errors:
+            logger.warning("Report pipeline partial results: %s", errors)
+
+        return {
+            "report_id": report_id,
+            "analysis": analysis,
+            "sensitive_info": sensitive_info,
+            "credibility": credibility,
+            "errors": errors,
+            "timings": timings
+        }
+
     async def analyze_report(self, report_content: str) -> Dict[str, Any]:
         """
         Analyze corruption report content using AI to extract key information,
@@ -41,7 +128,7 @@ class ReportAnalyzer:
         """
         
         try:
-            response = self.groq_client.chat.completions.create(
+            response = await self.llm.chat(
                 messages=[
                     {
                         "role": "system",
@@ -54,20 +141,16 @@ class ReportAnalyzer:
                 ],
                 model="mixtral-8x7b-32768",
                 temperature=0.2,
-                max_tokens=1500
+                max_tokens=1500,
+                validate=has_json_fields(*ANALYSIS_FIELDS)
             )
             
             # Parse and validate response
             try:
-                analysis = json.loads(response.choices[0].message.content)
-                required_fields = [
-                    "main_category", "sub_categories", "severity_level",
-                    "entities_involved", "recommended_authorities", "risk_assessment",
-                    "priority_level", "potential_evidence", "summary"
-                ]
+                analysis = parse_json_response(response)
                 
                 # Ensure all required fields exist
-                for field in required_fields:
+                for field in ANALYSIS_FIELDS:
                     if field not in analysis:
                         raise ValueError(f"Missing required field: {field}")
                 
@@ -77,10 +160,10 @@ class ReportAnalyzer:
                 raise Exception("Invalid JSON response from AI model")
                 
         except Exception as e:
-            if self.gemini_model:
+            if self.llm.gemini_model:
                 try:
-                    response = self.gemini_model.generate_content(prompt)
-                    analysis = json.loads(response.text)
+                    response = await self.llm.generate(prompt, validate=has_json_fields(*ANALYSIS_FIELDS))
+                    analysis = parse_json_response(response)
                     return analysis
                 except:
                     raise Exception(f"Both Groq and Gemini analysis failed: {str(e)}")
@@ -105,7 +188,7 @@ class ReportAnalyzer:
         """
         
         try:
-            response = self.groq_client.chat.completions.create(
+            response = await self.llm.chat(
                 messages=[
                     {
                         "role": "system",
@@ -118,14 +201,15 @@ class ReportAnalyzer:
                 ],
                 model="mixtral-8x7b-32768",
                 temperature=0.1,
-                max_tokens=1000
+                max_tokens=1000,
+                validate=is_json
             )
             
-            return json.loads(response.choices[0].message.content)
+            return parse_json_response(response)
         except Exception as e:
-            if self.gemini_model:
-                response = self.gemini_model.generate_content(prompt)
-                return json.loads(response.text)
+            if self.llm.gemini_model:
+                response = await self.llm.generate(prompt, validate=is_json)
+                return parse_json_response(response)
             raise e
 
     async def generate_report_id(self, analysis: Dict[str, Any]) -> str:
@@ -136,8 +220,10 @@ class ReportAnalyzer:
         category_code = analysis['main_category'][:3].upper()
         severity = str(analysis['severity_level'])
         priority = analysis['priority_level'][:1].upper()
+        # The metadata alone repeats for similar reports filed on the same day
+        suffix = secrets.token_hex(4).upper()
         
-        return f"RPT-{timestamp}-{category_code}-S{severity}-P{priority}"
+        return f"RPT-{timestamp}-{category_code}-S{severity}-P{priority}-{suffix}"
 
     async def generate_investigation_steps(self, report_content: str) -> Dict[str, Any]:
         """
@@ -175,7 +261,7 @@ class ReportAnalyzer:
                 "success_criteria": ["criterion1", "criterion2"]
             }}"""
 
-            response = self.groq_client.chat.completions.create(
+            response = await self.llm.chat(
                 messages=[
                     {
                         "role": "system",
@@ -188,24 +274,16 @@ class ReportAnalyzer:
                 ],
                 model="mixtral-8x7b-32768",
                 temperature=0.1,
-                max_tokens=2000
+                max_tokens=2000,
+                validate=has_json_fields(*INVESTIGATION_FIELDS)
             )
 
-            content = response.choices[0].message.content.strip()
-            
-            # Remove any markdown formatting
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0].strip()
-            elif "```" in content:
-                content = content.split("```")[1].strip()
+            content = response
 
             try:
-                result = json.loads(content)
+                result = parse_json_response(content)
                 # Validate the response has required fields
-                required_fields = ["immediate_actions", "key_witnesses", "required_documents", 
-                                 "investigation_timeline", "potential_challenges", "success_criteria"]
-                
-                for field in required_fields:
+                for field in INVESTIGATION_FIELDS:
                     if field not in result:
                         print(f"Missing field {field} in response")
                         return default_response
@@ -219,10 +297,10 @@ class ReportAnalyzer:
 
         except Exception as e:
             print(f"Error in generate_investigation_steps: {str(e)}")
-            if self.gemini_model:
+            if self.llm.gemini_model:
                 try:
-                    response = self.gemini_model.generate_content(prompt)
-                    result = json.loads(response.text)
+                    response = await self.llm.generate(prompt, validate=has_json_fields(*INVESTIGATION_FIELDS))
+                    result = parse_json_response(response)
                     return result
                 except:
                     return default_response
@@ -248,7 +326,7 @@ class ReportAnalyzer:
         """
         
         try:
-            response = self.groq_client.chat.completions.create(
+            response = await self.llm.chat(
                 messages=[
                     {
                         "role": "system",
@@ -261,14 +339,15 @@ class ReportAnalyzer:
                 ],
                 model="mixtral-8x7b-32768",
                 temperature=0.3,
-                max_tokens=1000
+                max_tokens=1000,
+                validate=is_json
             )
             
-            return json.loads(response.choices[0].message.content)
+            return parse_json_response(response)
         except Exception as e:
-            if self.gemini_model:
-                response = self.gemini_model.generate_content(prompt)
-                return json.loads(response.text)
+            if self.llm.gemini_model:
+                response = await self.llm.generate(prompt, validate=is_json)
+                return parse_json_response(response)
             raise e
 
     async def assess_credibility(self, report_content: str) -> Dict[str, Any]:
@@ -297,7 +376,7 @@ class ReportAnalyzer:
             """
             
             try:
-                response = self.groq_client.chat.completions.create(
+                response = await self.llm.chat(
                     messages=[
                         {
                             "role": "system",
@@ -310,7 +389,8 @@ class ReportAnalyzer:
                     ],
                     model="mixtral-8x7b-32768",
                     temperature=0.1,  # Lower temperature for more consistent output
-                    max_tokens=1000
+                    max_tokens=1000,
+                    validate=valid_credibility
                 )
                 
                 # Default response in case of parsing failure
@@ -329,15 +409,10 @@ class ReportAnalyzer:
                 
                 try:
                     # Get the response content
-                    content = response.choices[0].message.content
-                    
-                    # Clean the response if needed
-                    content = content.strip()
-                    if content.startswith("```json"):
-                        content = content[7:-3]  # Remove ```json and ``` markers
+                    content = response
                     
-                    # Parse the JSON
-                    result = json.loads(content)
+                    # Parse the JSON, without any surrounding code fence
+                    result = parse_json_response(content)
                     
                     # Ensure all required fields exist
                     for key in default_response.keys():
@@ -357,10 +432,10 @@ class ReportAnalyzer:
                 
             except Exception as groq_error:
                 print(f"Groq API error: {str(groq_error)}")
-                if self.gemini_model:
+                if self.llm.gemini_model:
                     try:
-                        response = self.gemini_model.generate_content(prompt)
-                        result = json.loads(response.text)
+                        response = await self.llm.generate(prompt, validate=valid_credibility)
+                        result = parse_json_response(response)
                         if "credibility_score" not in result:
                             result["credibility_score"] = 50.0
                         return result
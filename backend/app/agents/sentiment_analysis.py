@@ -1,21 +1,220 @@
-from transformers import pipeline
-from googletrans import Translator
-import spacy
+import logging
+import math
+import re
+import threading
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Feedback sentiment is reported on a 0-5 scale (0 most negative, 5 most
+# positive) with a positive/negative/neutral label, matching GroqAnalyzer.
+
+POSITIVE_WORDS = {
+    "good": 1.0, "great": 1.5, "excellent": 2.0, "amazing": 2.0, "awesome": 2.0,
+    "helpful": 1.0, "happy": 1.5, "glad": 1.0, "love": 2.0, "like": 0.5,
+    "appreciate": 1.5, "thank": 1.0, "thanks": 1.0, "improved": 1.0, "improve": 0.5,
+    "better": 1.0, "best": 1.5, "clean": 0.5, "safe": 1.0, "fair": 0.5,
+    "efficient": 1.0, "responsive": 1.0, "transparent": 1.0, "support": 0.5,
+    "satisfied": 1.0, "pleased": 1.0, "well": 0.5, "nice": 1.0, "fixed": 1.0,
+    "progress": 1.0, "success": 1.5, "successful": 1.5, "honest": 1.0, "quick": 0.5,
+}
+
+NEGATIVE_WORDS = {
+    "bad": -1.0, "poor": -1.0, "terrible": -2.0, "awful": -2.0, "horrible": -2.0,
+    "worst": -2.0, "worse": -1.0, "hate": -2.0, "angry": -1.5, "upset": -1.0,
+    "disappointed": -1.5, "disappointing": -1.5, "broken": -1.0, "dirty": -1.0,
+    "unsafe": -1.5, "dangerous": -1.5, "corrupt": -2.0, "corruption": -2.0,
+    "bribe": -2.0, "fraud": -2.0, "slow": -0.5, "delay": -0.5, "delayed": -1.0,
+    "ignored": -1.5, "unfair": -1.5, "waste": -1.5, "wasted": -1.5, "problem": -0.5,
+    "problems": -0.5, "failure": -1.5, "failed": -1.5, "expensive": -0.5,
+    "unacceptable": -2.0, "complaint": -1.0, "frustrated": -1.5, "frustrating": -1.5,
+    "neglected": -1.5, "lack": -0.5, "crime": -1.0, "unresponsive": -1.5,
+}
+
+NEGATORS = {"not", "no", "never", "none", "nobody", "nothing", "neither", "nor", "without", "hardly"}
+INTENSIFIERS = {"very": 1.5, "really": 1.3, "extremely": 1.8, "so": 1.3, "too": 1.3, "totally": 1.5, "absolutely": 1.6}
+
+TOKEN_PATTERN = re.compile(r"[a-z]+(?:'[a-z]+)?")
+
+# Polarity of the labels sentiment classifiers commonly emit. Models with
+# other labels (e.g. LABEL_0/LABEL_1) need an explicit ``label_map``.
+LABEL_POLARITY = {
+    "negative": -1.0, "neg": -1.0,
+    "neutral": 0.0, "neu": 0.0,
+    "positive": 1.0, "pos": 1.0,
+}
+
+class UnknownSentimentLabel(ValueError):
+    """The model emitted a label with no known polarity."""
+
+def parse_label_map(spec: str) -> Dict[str, str]:
+    """Parse ``"LABEL_0:negative,LABEL_1:positive"`` into a label map."""
+    label_map = {}
+    for pair in filter(None, (part.strip() for part in spec.split(","))):
+        label, _, sentiment = pair.partition(":")
+        if sentiment.strip().lower() not in LABEL_POLARITY:
+            raise ValueError(f"Invalid sentiment label mapping: {pair}")
+        label_map[label.strip()] = sentiment.strip().lower()
+    return label_map
+
+def to_feedback_sentiment(polarity: float) -> Dict[str, object]:
+    """Map a polarity in [-1, 1] to the feedback score and label."""
+    polarity = max(-1.0, min(1.0, polarity))
+    label = "positive" if polarity >= 0.05 else "negative" if polarity <= -0.05 else "neutral"
+    return {"sentiment_score": round(2.5 + 2.5 * polarity, 2), "sentiment_label": label}
+
+class LexiconSentimentBackend:
+    """Dependency-free word-list sentiment with negation and intensifiers.
+
+    Less accurate than a model, but takes microseconds per item and never
+    fails, so it also serves as the fallback when no model is available.
+    """
+
+    name = "lexicon"
+
+    def polarity(self, text: str) -> float:
+        tokens = TOKEN_PATTERN.findall(text.lower())
+        total = 0.0
+        for position, token in enumerate(tokens):
+            valence = POSITIVE_WORDS.get(token) or NEGATIVE_WORDS.get(token)
+            if valence is None:
+                continue
+            window = tokens[max(0, position - 3):position]
+            for previous in window:
+                valence *= INTENSIFIERS.get(previous, 1.0)
+            if any(previous in NEGATORS or previous.endswith("n't") for previous in window):
+                valence *= -0.75
+            total += valence
+        # Squash the unbounded sum into [-1, 1]
+        return total / math.sqrt(total * total + 15) if total else 0.0
+
+    def analyze_batch(self, texts: List[str]) -> List[Dict[str, object]]:
+        return [to_feedback_sentiment(self.polarity(text)) for text in texts]
+
+class TransformersSentimentBackend:
+    """Local transformer classifier, batched, loaded once per process.
+
+    ``runtime="onnx"`` exports the model to ONNX Runtime through
+    ``optimum`` for faster CPU inference; otherwise PyTorch runs on the CPU.
+    The model is loaded on first use, not at construction. ``label_map``
+    maps model labels to negative/neutral/positive for models whose labels
+    are not self-describing; an unmapped unknown label raises
+    UnknownSentimentLabel rather than being guessed.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "distilbert-base-uncased-finetuned-sst-2-english",
+        runtime: str = "torch",
+        batch_size: int = 32,
+        neutral_confidence: float = 0.6,
+        label_map: Optional[Dict[str, str]] = None
+    ):
+        self.model_name = model_name
+        self.runtime = runtime
+        self.batch_size = batch_size
+        self.neutral_confidence = neutral_confidence
+        self.label_map = label_map or {}
+        self.name = "onnx" if runtime == "onnx" else "transformers"
+        self._pipeline = None
+        self._lock = threading.Lock()
+
+    def _get_pipeline(self):
+        with self._lock:
+            if self._pipeline is None:
+                from transformers import AutoTokenizer, pipeline
+
+                if self.runtime == "onnx":
+                    from optimum.onnxruntime import ORTModelForSequenceClassification
+                    model = ORTModelForSequenceClassification.from_pretrained(self.model_name, export=True)
+                else:
+                    model = self.model_name
+                self._pipeline = pipeline(
+                    "sentiment-analysis",
+                    model=model,
+                    tokenizer=AutoTokenizer.from_pretrained(self.model_name),
+                    device=-1
+                )
+            return self._pipeline
+
+    def label_polarity(self, label: str) -> float:
+        """-1, 0 or 1 for a model label."""
+        name = self.label_map.get(label, label).lower()
+        if name not in LABEL_POLARITY:
+            raise UnknownSentimentLabel(
+                f"Sentiment model label {label!r} has no known polarity; map it with SENTIMENT_LABEL_MAP"
+            )
+        return LABEL_POLARITY[name]
+
+    def analyze_batch(self, texts: List[str]) -> List[Dict[str, object]]:
+        results = self._get_pipeline()(texts, batch_size=self.batch_size, truncation=True)
+        sentiments = []
+        for result in results:
+            confidence = float(result["score"])
+            sign = self.label_polarity(result["label"])
+            if sign == 0 or confidence < self.neutral_confidence:
+                sentiments.append(to_feedback_sentiment(0.0))
+                continue
+            # Rescale confidence from [neutral_confidence, 1] to a polarity in [0, 1]
+            strength = (confidence - self.neutral_confidence) / (1 - self.neutral_confidence)
+            sentiments.append(to_feedback_sentiment(sign * max(strength, 0.05)))
+        return sentiments
+
+class FallbackSentimentBackend:
+    """Use the primary backend, falling back to the lexicon if it fails."""
+
+    def __init__(self, primary, fallback: Optional[LexiconSentimentBackend] = None):
+        self.primary = primary
+        self.fallback = fallback or LexiconSentimentBackend()
+        self.name = primary.name
+        self._primary_unavailable = False
+
+    def analyze_batch(self, texts: List[str]) -> List[Dict[str, object]]:
+        if not self._primary_unavailable:
+            try:
+                return self.primary.analyze_batch(texts)
+            except (ImportError, UnknownSentimentLabel) as e:
+                # The model's packages are missing or its labels are not mapped; stop retrying
+                logger.warning("%s sentiment backend unavailable, using lexicon: %s", self.primary.name, e)
+                self._primary_unavailable = True
+            except Exception as e:
+                logger.warning("%s sentiment backend failed, using lexicon: %s", self.primary.name, e)
+        return self.fallback.analyze_batch(texts)
+
+def create_sentiment_backend(
+    backend: str = "lexicon",
+    model_name: str = "",
+    batch_size: int = 32,
+    label_map: str = ""
+):
+    """Build the configured local sentiment backend, or None to leave sentiment to the LLM."""
+    if backend == "llm":
+        return None
+    if backend == "lexicon":
+        return LexiconSentimentBackend()
+    if backend in ("transformers", "onnx"):
+        return FallbackSentimentBackend(TransformersSentimentBackend(
+            **({"model_name": model_name} if model_name else {}),
+            runtime="onnx" if backend == "onnx" else "torch",
+            batch_size=batch_size,
+            label_map=parse_label_map(label_map)
+        ))
+    raise ValueError(f"Unknown sentiment backend: {backend}")
 
 class SentimentAnalysisAgent:
-    def __init__(self):
-        self.sentiment_analyzer = pipeline("sentiment-analysis")
-        self.translator = Translator()
-        
+    def __init__(self, backend=None):
+        self.backend = backend or create_sentiment_backend("transformers")
+        self._translator = None
+
     def analyze_sentiment(self, text: str) -> dict:
         """Analyze sentiment of the given text."""
-        result = self.sentiment_analyzer(text)[0]
-        return {
-            "sentiment_label": result["label"],
-            "sentiment_score": result["score"]
-        }
-    
-    def translate_document(self, text: str, target_language: str) -> str:
+        return self.backend.analyze_batch([text])[0]
+
+    async def translate_document(self, text: str, target_language: str) -> str:
         """Translate text to target language."""
-        translated = self.translator.translate(text, dest=target_language)
-        return translated.text 
\ No newline at end of file
+        if self._translator is None:
+            from googletrans import Translator
+            self._translator = Translator()
+        # googletrans 4 translates asynchronously
+        translated = await self._translator.translate(text, dest=target_language)
+        return translated.text
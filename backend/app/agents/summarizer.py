@@ -0,0 +1,196 @@
+import asyncio
+import logging
+import math
+from typing import Any, AsyncIterator, Dict, List
+from ..services.llm import LLMClient
+
+logger = logging.getLogger(__name__)
+
+SYSTEM_PROMPT = "You are a skilled summarizer that creates clear, accurate summaries."
+
+# Split on the coarsest boundary that still fits, falling back to finer ones
+SEPARATORS = ["\n\n", "\n", ". ", " "]
+
+# Reduce levels before the remaining summaries are combined in one prompt
+MAX_REDUCE_DEPTH = 10
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of text without a model-specific tokenizer.
+
+    Uses the larger of ~4 characters per token and ~0.75 words per token,
+    which tracks BPE tokenizers closely enough for chunk budgeting.
+    """
+    return math.ceil(max(len(text) / 4, len(text.split()) * 4 / 3))
+
+def split_into_token_chunks(text: str, max_tokens: int, level: int = 0) -> List[str]:
+    """Split text into chunks of at most max_tokens estimated tokens."""
+    if estimate_tokens(text) <= max_tokens:
+        return [text] if text.strip() else []
+    if level >= len(SEPARATORS):
+        # No natural boundary left; hard-split by characters
+        step = max_tokens * 4
+        return [text[i:i + step] for i in range(0, len(text), step)]
+
+    separator = SEPARATORS[level]
+    chunks = []
+    current = []
+    current_tokens = 0
+
+    for part in text.split(separator):
+        part_tokens = estimate_tokens(part)
+        if part_tokens > max_tokens:
+            if current:
+                chunks.append(separator.join(current))
+                current, current_tokens = [], 0
+            chunks.extend(split_into_token_chunks(part, max_tokens, level + 1))
+            continue
+        if current and current_tokens + part_tokens > max_tokens:
+            chunks.append(separator.join(current))
+            current, current_tokens = [], 0
+        current.append(part)
+        current_tokens += part_tokens
+
+    if current:
+        chunks.append(separator.join(current))
+
+    return [chunk for chunk in chunks if chunk.strip()]
+
+class MapReduceSummarizer:
+    """Summarize arbitrarily large text with a concurrent map and a reduce tree.
+
+    Chunks are summarized concurrently (bounded by ``max_concurrency``), then
+    the chunk summaries are repeatedly grouped and summarized until a single
+    summary remains.
+    """
+
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        chunk_tokens: int = 3000,
+        max_concurrency: int = 4,
+        reduce_fan_in: int = 8
+    ):
+        self.llm = llm_client
+        self.chunk_tokens = chunk_tokens
+        self.max_concurrency = max_concurrency
+        self.reduce_fan_in = reduce_fan_in
+
+    async def _complete(self, prompt: str) -> str:
+        """Summarize with Groq, falling back to Gemini when rate limited."""
+        try:
+            return await self.llm.chat(
+                messages=[
+                    {
+                        "role": "system",
+                        "content": SYSTEM_PROMPT
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                model="mixtral-8x7b-32768",
+                temperature=0.3,
+                max_tokens=1000
+            )
+        except Exception as e:
+            if "rate_limit_exceeded" in str(e) and self.llm.gemini_model:
+                try:
+                    return await self.llm.generate(prompt)
+                except Exception as gemini_error:
+                    raise Exception(f"Both Groq and Gemini failed: {str(e)} | {str(gemini_error)}")
+            raise e
+
+    async def _summarize_chunk(self, chunk: str, semaphore: asyncio.Semaphore) -> str:
+        async with semaphore:
+            return await self._complete(f"""Summarize the following content in a clear and concise way:
+
+            {chunk}
+            """)
+
+    async def _summarize_final(self, text: str, max_length: int) -> str:
+        return await self._complete(f"""Create a final summary under {max_length} characters from the following content:
+
+        {text}
+        """)
+
+    def _group(self, summaries: List[str]) -> List[List[str]]:
+        """Group summaries so each group fits in one reduce prompt.
+
+        Every group takes at least two summaries, even past the token budget,
+        so each reduce level at least halves the count and the reduce ends.
+        """
+        fan_in = max(self.reduce_fan_in, 2)
+        groups = []
+        current = []
+        current_tokens = 0
+        for summary in summaries:
+            tokens = estimate_tokens(summary)
+            if len(current) >= 2 and (current_tokens + tokens > self.chunk_tokens or len(current) >= fan_in):
+                groups.append(current)
+                current, current_tokens = [], 0
+            current.append(summary)
+            current_tokens += tokens
+        if len(current) == 1 and groups:
+            groups[-1].extend(current)
+        elif current:
+            groups.append(current)
+        return groups
+
+    async def _reduce(self, summaries: List[str], max_length: int) -> str:
+        """Collapse summaries level by level until one final summary remains."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        groups = self._group(summaries)
+        depth = 0
+        while len(groups) > 1:
+            if depth >= MAX_REDUCE_DEPTH:
+                logger.warning("Summary reduce stopped at depth %d with %d groups", depth, len(groups))
+                groups = [[summary for group in groups for summary in group]]
+                break
+            summaries = await asyncio.gather(*[
+                self._summarize_chunk("\n\n".join(group), semaphore) for group in groups
+            ])
+            groups = self._group(summaries)
+            depth += 1
+        return await self._summarize_final("\n\n".join(groups[0]), max_length)
+
+    async def summarize(self, content: str, max_length: int = 500) -> str:
+        chunks = split_into_token_chunks(content, self.chunk_tokens)
+        if not chunks:
+            return ""
+        if len(chunks) == 1:
+            return await self._summarize_final(chunks[0], max_length)
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        summaries = await asyncio.gather(*[
+            self._summarize_chunk(chunk, semaphore) for chunk in chunks
+        ])
+        return await self._reduce(list(summaries), max_length)
+
+    async def stream(self, content: str, max_length: int = 500) -> AsyncIterator[Dict[str, Any]]:
+        """Yield each chunk summary as it finishes, then the final summary."""
+        chunks = split_into_token_chunks(content, self.chunk_tokens)
+        if not chunks:
+            yield {"event": "final", "summary": ""}
+            return
+        if len(chunks) == 1:
+            yield {"event": "final", "summary": await self._summarize_final(chunks[0], max_length)}
+            return
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def summarize_indexed(index: int, chunk: str):
+            return index, await self._summarize_chunk(chunk, semaphore)
+
+        tasks = [asyncio.create_task(summarize_indexed(i, chunk)) for i, chunk in enumerate(chunks)]
+        summaries = [None] * len(chunks)
+        try:
+            for completed in asyncio.as_completed(tasks):
+                index, summary = await completed
+                summaries[index] = summary
+                yield {"event": "chunk", "index": index, "total": len(chunks), "summary": summary}
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        yield {"event": "final", "summary": await self._reduce(summaries, max_length)}
@@ -0,0 +1,107 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, Hashable, Optional
+from jose import jwt
+from .. import models
+from ..config import settings
+
+class TTLCache:
+    """Thread-safe in-process LRU cache with a per-entry expiry."""
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 30.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, expires_at: Optional[float] = None):
+        """Store a value for the cache TTL, or until ``expires_at`` if that is sooner."""
+        deadline = time.time() + self.ttl_seconds
+        if expires_at is not None:
+            deadline = min(deadline, expires_at)
+        with self._lock:
+            self._entries[key] = (deadline, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard_where(self, predicate):
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+@dataclass(frozen=True)
+class CachedUser:
+    """Read-only snapshot of an authenticated user, safe to share between requests."""
+
+    id: int
+    email: str
+    is_active: bool
+    auth_provider: str
+    role: str
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_model(cls, user: models.User) -> "CachedUser":
+        return cls(
+            id=user.id,
+            email=user.email,
+            is_active=user.is_active,
+            auth_provider=user.auth_provider,
+            role=user.role,
+            created_at=user.created_at,
+            updated_at=user.updated_at
+        )
+
+# Verified token payloads, so hot tokens skip the signature check
+token_cache = TTLCache(settings.AUTH_CACHE_MAX_ENTRIES, settings.AUTH_CACHE_TTL_SECONDS)
+# Users keyed by (token subject, token expiry)
+user_cache = TTLCache(settings.AUTH_CACHE_MAX_ENTRIES, settings.AUTH_CACHE_TTL_SECONDS)
+
+def decode_token(token: str) -> Dict[str, Any]:
+    """Verify a JWT and return its payload; raises JWTError like ``jwt.decode``."""
+    payload = token_cache.get(token)
+    if payload is None:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        # Never cache a token past its own expiry
+        token_cache.set(token, payload, expires_at=payload.get("exp"))
+    return payload
+
+def principal_key(payload: Dict[str, Any]) -> tuple:
+    return payload.get("sub"), payload.get("exp")
+
+def get_cached_user(payload: Dict[str, Any]) -> Optional[CachedUser]:
+    return user_cache.get(principal_key(payload))
+
+def cache_user(payload: Dict[str, Any], user: models.User) -> CachedUser:
+    cached = CachedUser.from_model(user)
+    user_cache.set(principal_key(payload), cached, expires_at=payload.get("exp"))
+    return cached
+
+def invalidate_user(email: str):
+    """Drop cached users for an email, e.g. after its role changes.
+
+    Only this process's cache is cleared; other workers pick up the change
+    within AUTH_CACHE_TTL_SECONDS.
+    """
+    user_cache.discard_where(lambda key: key[0] == email)
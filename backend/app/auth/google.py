@@ -0,0 +1,95 @@
+import asyncio
+import json
+import re
+import time
+from typing import Any, Dict, Optional
+from fastapi import HTTPException
+from jose import JWTError, jwt
+from ..config import settings
+from ..services.http import HTTPClient, http_client
+
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
+DEFAULT_MAX_AGE_SECONDS = 3600
+# Lower bound between refreshes forced by an unknown key id
+MIN_REFRESH_INTERVAL_SECONDS = 60
+
+def parse_max_age(cache_control: Optional[str]) -> int:
+    match = re.search(r"max-age=(\d+)", cache_control or "")
+    return int(match.group(1)) if match else DEFAULT_MAX_AGE_SECONDS
+
+class GoogleKeySet:
+    """Google's ID token signing keys, cached for as long as Google allows.
+
+    Keys are fetched from the JWKS endpoint and kept until the response's
+    Cache-Control max-age runs out, so logins verify tokens locally instead of
+    calling tokeninfo. A token signed with an unknown key id triggers an early
+    refresh, for key rotation. With ``path`` set, keys are read from a local
+    JWKS file instead (for tests and offline development).
+    """
+
+    def __init__(self, client: HTTPClient, url: str, path: str = ""):
+        self.client = client
+        self.url = url
+        self.path = path
+        self._keys: Dict[str, Dict[str, Any]] = {}
+        self._expires_at = 0.0
+        self._fetched_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def _fetch(self):
+        if self.path:
+            with open(self.path) as f:
+                jwks, max_age = json.load(f), DEFAULT_MAX_AGE_SECONDS
+        else:
+            response = await self.client.get(self.url)
+            if response.status != 200:
+                raise HTTPException(status_code=503, detail="Could not fetch Google signing keys")
+            jwks, max_age = response.json(), parse_max_age(response.headers.get("Cache-Control"))
+
+        now = time.time()
+        self._keys = {key["kid"]: key for key in jwks.get("keys", [])}
+        self._fetched_at = now
+        self._expires_at = now + max_age
+
+    async def get_key(self, kid: str) -> Optional[Dict[str, Any]]:
+        key = self._keys.get(kid) if time.time() < self._expires_at else None
+        if key is not None:
+            return key
+
+        async with self._lock:
+            # Another request may have refreshed the keys while we waited
+            now = time.time()
+            stale = now >= self._expires_at
+            unknown = kid not in self._keys and now - self._fetched_at >= MIN_REFRESH_INTERVAL_SECONDS
+            if stale or unknown:
+                await self._fetch()
+            return self._keys.get(kid)
+
+    def verify(self, token: str, key: Dict[str, Any]) -> Dict[str, Any]:
+        return jwt.decode(
+            token,
+            key,
+            algorithms=[key.get("alg", "RS256")],
+            audience=settings.GOOGLE_CLIENT_ID,
+            issuer=GOOGLE_ISSUERS,
+            # Google ID tokens carry at_hash only alongside an access token
+            options={"verify_at_hash": False}
+        )
+
+# Shared instance; keys are fetched on the first Google login
+google_keys = GoogleKeySet(http_client, settings.GOOGLE_JWKS_URL, settings.GOOGLE_JWKS_PATH)
+
+async def verify_google_id_token(token: str, keys: GoogleKeySet = google_keys) -> Dict[str, Any]:
+    """Check a Google ID token's signature, audience, issuer and expiry locally."""
+    try:
+        kid = jwt.get_unverified_header(token).get("kid")
+    except JWTError:
+        raise HTTPException(status_code=400, detail="Invalid Google token")
+
+    key = await keys.get_key(kid) if kid else None
+    if key is None:
+        raise HTTPException(status_code=400, detail="Invalid Google token")
+    try:
+        return keys.verify(token, key)
+    except JWTError:
+        raise HTTPException(status_code=400, detail="Invalid Google token")
@@ -1,29 +1,25 @@
 from fastapi import HTTPException, status, Depends
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from jose import JWTError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
-import aiohttp
 from typing import Optional
 from .. import models, schemas, database
-from ..config import settings
+from .cache import cache_user, decode_token, get_cached_user
+from .google import verify_google_id_token
 from .utils import create_access_token
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token", auto_error=False)
 
 async def verify_google_token(token: str):
-    async with aiohttp.ClientSession() as session:
-        async with session.get(
-            f"https://oauth2.googleapis.com/tokeninfo?id_token={token}"
-        ) as response:
-            if response.status != 200:
-                raise HTTPException(status_code=400, detail="Invalid Google token")
-            user_data = await response.json()
-            return user_data
+    # Verified locally against Google's cached signing keys; no tokeninfo round trip
+    return await verify_google_id_token(token)
 
-async def get_or_create_user(db: Session, email: str, auth_provider: str = "google") -> models.User:
+async def get_or_create_user(db: AsyncSession, email: str, auth_provider: str = "google") -> models.User:
     # Check if user exists
-    user = db.query(models.User).filter(models.User.email == email).first()
+    result = await db.execute(select(models.User).where(models.User.email == email))
+    user = result.scalars().first()
     
     if not user:
         # Create new user
@@ -36,12 +32,12 @@ async def get_or_create_user(db: Session, email: str, auth_provider: str = "goog
             updated_at=datetime.utcnow()
         )
         db.add(user)
-        db.commit()
-        db.refresh(user)
+        await db.commit()
+        await db.refresh(user)
     
     return user
 
-async def authenticate_google_user(token: str, db: Session):
+async def authenticate_google_user(token: str, db: AsyncSession):
     # Verify Google token
     user_data = await verify_google_token(token)
     email = user_data.get("email")
@@ -69,29 +65,29 @@ async def authenticate_google_user(token: str, db: Session):
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(database.get_db)
+    db: AsyncSession = Depends(database.get_async_db)
 ) -> Optional[models.User]:
     if not token:
         return None
         
     try:
-        payload = jwt.decode(
-            token, 
-            settings.SECRET_KEY, 
-            algorithms=[settings.ALGORITHM]
-        )
+        payload = decode_token(token)
         email: str = payload.get("sub")
         if email is None:
             return None
-            
-        user = db.query(models.User).filter(models.User.email == email).first()
-        return user
+
+        cached = get_cached_user(payload)
+        if cached is not None:
+            return cached
+        result = await db.execute(select(models.User).where(models.User.email == email))
+        user = result.scalars().first()
+        return cache_user(payload, user) if user else None
     except JWTError:
         return None
 
 # Add this function for optional authentication
 async def get_current_user_optional(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(database.get_db)
+    db: AsyncSession = Depends(database.get_async_db)
 ) -> Optional[models.User]:
     return await get_current_user(token, db)
\ No newline at end of file
@@ -1,15 +1,48 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from typing import Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from ..config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Hashes made with another cost factor still verify and are upgraded on login
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
 
-def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+# bcrypt is deliberately slow; a small dedicated pool keeps a login burst from
+# tying up the threads that serve every other sync endpoint
+_hash_executor: Optional[ThreadPoolExecutor] = None
 
-def get_password_hash(password):
-    return pwd_context.hash(password)
+def _get_hash_executor() -> ThreadPoolExecutor:
+    global _hash_executor
+    if _hash_executor is None:
+        _hash_executor = ThreadPoolExecutor(
+            max_workers=settings.PASSWORD_HASH_WORKERS,
+            thread_name_prefix="bcrypt"
+        )
+    return _hash_executor
+
+def shutdown_hash_executor():
+    global _hash_executor
+    if _hash_executor is not None:
+        _hash_executor.shutdown(wait=False, cancel_futures=True)
+        _hash_executor = None
+
+async def hash_password(password: str) -> str:
+    """Hash a password on the bcrypt pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_hash_executor(), pwd_context.hash, password)
+
+async def verify_and_update_password(plain_password: str, hashed_password: Optional[str]) -> Tuple[bool, Optional[str]]:
+    """Verify a password on the bcrypt pool.
+
+    Returns ``(valid, new_hash)``; ``new_hash`` is set when the stored hash
+    uses an outdated cost factor and should be replaced.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_hash_executor(), pwd_context.verify_and_update, plain_password, hashed_password
+    )
 
 def create_access_token(data: dict):
     to_encode = data.copy()
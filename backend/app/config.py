@@ -7,10 +7,69 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int
     GOOGLE_CLIENT_ID: str
     GOOGLE_CLIENT_SECRET: str
+    GOOGLE_JWKS_URL: str = "https://www.googleapis.com/oauth2/v3/certs"
+    GOOGLE_JWKS_PATH: str = ""  # local JWKS file to use instead of fetching Google's keys
     GROQ_API_KEY: str
-    FIREBASE_STORAGE_BUCKET: str
-    FIREBASE_CREDENTIALS_PATH: str
+    FIREBASE_STORAGE_BUCKET: str = ""
+    FIREBASE_CREDENTIALS_PATH: str = ""
     GEMINI_API_KEY: str = ""
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT_SECONDS: float = 30.0
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_STATEMENT_TIMEOUT_MS: int = 30000
+    DB_STATEMENT_BUDGET: int = 0  # log requests that run more SQL statements than this; 0 disables
+    PAGE_SIZE_DEFAULT: int = 50
+    PAGE_SIZE_MAX: int = 200
+    AUTH_CACHE_TTL_SECONDS: float = 30.0  # how long a role change can take to reach other workers
+    AUTH_CACHE_MAX_ENTRIES: int = 10000
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024
+    LLM_MAX_CONNECTIONS: int = 20
+    LLM_TIMEOUT_SECONDS: float = 60.0
+    REPORT_STAGE_TIMEOUT_SECONDS: float = 30.0
+    LLM_CACHE_BACKEND: str = "memory"  # "memory", "sqlite" or "none"
+    LLM_CACHE_PATH: str = "llm_cache.db"
+    LLM_CACHE_MAX_ENTRIES: int = 1024
+    LLM_CACHE_TTL_SECONDS: int = 86400
+    SUMMARY_CHUNK_TOKENS: int = 3000
+    SUMMARY_MAX_CONCURRENCY: int = 4
+    SUMMARY_REDUCE_FAN_IN: int = 8
+    FEEDBACK_BATCH_SIZE: int = 20  # feedback items packed into one LLM prompt
+    FEEDBACK_BATCH_MAX_CHARS: int = 12000
+    FEEDBACK_MAX_CONCURRENCY: int = 4
+    FEEDBACK_INGEST_CHUNK: int = 500  # items analyzed and stored per round of a bulk upload
+    FEEDBACK_BATCH_MAX_ITEMS: int = 50000
+    SENTIMENT_BACKEND: str = "lexicon"  # "lexicon", "transformers", "onnx" or "llm"
+    SENTIMENT_MODEL: str = ""  # Hugging Face model for transformers/onnx; empty uses the default
+    SENTIMENT_LABEL_MAP: str = ""  # e.g. "LABEL_0:negative,LABEL_1:neutral,LABEL_2:positive"
+    SENTIMENT_BATCH_SIZE: int = 32
+    DOCUMENT_BLOB_CHECK_SECONDS: int = 300  # how often stored document text is checked against its blob; 0 checks every read
+    PDF_MAX_WORKERS: int = 2
+    PDF_PAGE_BATCH_SIZE: int = 25
+    PDF_MAX_BYTES: int = 100 * 1024 * 1024
+    TRANSCRIPTION_BACKEND: str = "google"  # "google" or "offline"
+    TRANSCRIPTION_LANGUAGE: str = "en-US"
+    TRANSCRIPTION_WINDOW_SECONDS: float = 30.0
+    TRANSCRIPTION_SILENCE_SEARCH_SECONDS: float = 3.0
+    TRANSCRIPTION_MAX_WORKERS: int = 4
+    MEETING_WINDOW_TOKENS: int = 3000
+    MEETING_ANALYSIS_MAX_CONCURRENCY: int = 4
+    STORAGE_BACKEND: str = "firebase"  # "firebase" or "local"
+    STORAGE_CHUNK_SIZE: int = 8 * 1024 * 1024
+    STORAGE_LOCAL_ROOT: str = "storage"
+    STORAGE_LOCAL_BASE_URL: str = "http://localhost:8000/storage"
+    HTTP_POOL_LIMIT: int = 100
+    HTTP_POOL_LIMIT_PER_HOST: int = 20
+    HTTP_TIMEOUT_SECONDS: float = 30.0
+    HTTP_RETRIES: int = 2
+    JOB_WORKERS: int = 4
+    JOB_QUEUE_MAX_SIZE: int = 100
+    JOB_LEASE_SECONDS: float = 60.0  # running jobs whose worker stops renewing this are run again
+    JOB_MAX_ATTEMPTS: int = 3  # after this many lapsed leases a job is failed instead
+    JOB_UPLOAD_DIR: str = "job_uploads"
+    PRELOAD_SERVICES: bool = False  # build agents at startup instead of on first use
 
     class Config:
         env_file = ".env"
@@ -1,13 +1,132 @@
-from sqlalchemy import create_engine
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from .config import settings
 
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+# Async drivers used for each dialect by the AsyncSession engine
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg"
+}
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+    cursor.execute(f"PRAGMA busy_timeout={int(settings.DB_STATEMENT_TIMEOUT_MS)}")
+    cursor.close()
+
+def to_async_url(url: str) -> URL:
+    """Swap the sync driver in a database URL for its async counterpart."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend in ASYNC_DRIVERS:
+        parsed = parsed.set(drivername=ASYNC_DRIVERS[backend])
+    return parsed
+
+def create_db_engine(url: str):
+    """Create an engine tuned for the database dialect in the URL."""
+    backend = make_url(url).get_backend_name()
+
+    if backend == "sqlite":
+        engine = create_engine(url, connect_args={"check_same_thread": False})
+        event.listen(engine, "connect", set_sqlite_pragmas)
+        return engine
+
+    connect_args = {}
+    if backend == "postgresql":
+        connect_args["options"] = f"-c statement_timeout={int(settings.DB_STATEMENT_TIMEOUT_MS)}"
+
+    return create_engine(
+        url,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=True,
+        connect_args=connect_args
+    )
+
+def create_async_db_engine(url: str):
+    """Create an async engine with the same per-dialect tuning as create_db_engine."""
+    async_url = to_async_url(url)
+    backend = async_url.get_backend_name()
+
+    if backend == "sqlite":
+        options = {}
+        if async_url.database not in (None, "", ":memory:"):
+            # aiosqlite defaults to NullPool for files, which opens a new
+            # connection (and thread) for every session
+            options = {
+                "poolclass": AsyncAdaptedQueuePool,
+                "pool_size": settings.DB_POOL_SIZE,
+                "max_overflow": settings.DB_MAX_OVERFLOW,
+                "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS
+            }
+        engine = create_async_engine(async_url, **options)
+        event.listen(engine.sync_engine, "connect", set_sqlite_pragmas)
+        return engine
+
+    connect_args = {}
+    if backend == "postgresql":
+        connect_args["server_settings"] = {"statement_timeout": str(int(settings.DB_STATEMENT_TIMEOUT_MS))}
+
+    return create_async_engine(
+        async_url,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=True,
+        connect_args=connect_args
+    )
+
+class StatementCounter:
+    """Number of SQL statements executed while the counter is active."""
+
+    def __init__(self):
+        self.count = 0
+
+_statement_counter: ContextVar[Optional[StatementCounter]] = ContextVar("statement_counter", default=None)
+
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    counter = _statement_counter.get()
+    if counter is not None:
+        counter.count += 1
+
+@contextmanager
+def count_statements():
+    """Count the SQL statements run by the current request or task.
+
+    Used to keep endpoints within a fixed query budget, e.g.
+    ``with count_statements() as counter: ...; assert counter.count <= 3``.
+    """
+    counter = StatementCounter()
+    token = _statement_counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _statement_counter.reset(token)
+
+engine = create_db_engine(SQLALCHEMY_DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_async_db_engine(SQLALCHEMY_DATABASE_URL)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+for _engine in (engine, async_engine.sync_engine):
+    event.listen(_engine, "before_cursor_execute", _count_statement)
+
 Base = declarative_base()
 
 def get_db():
@@ -16,3 +135,57 @@ def get_db():
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+async def bulk_insert(db: AsyncSession, model, rows: list[dict]):
+    """Insert many rows of one model in a single batched statement.
+
+    Skips building ORM objects and the unit of work; the rows join the
+    session's current transaction and are committed with it.
+    """
+    if rows:
+        await db.execute(insert(model), rows)
+
+async def insert_ignoring_conflicts(db: AsyncSession, model, row: dict, conflict_columns: list[str]):
+    """Insert one row unless it would violate the unique key on ``conflict_columns``.
+
+    Uses INSERT ... ON CONFLICT DO NOTHING where the dialect has it, so
+    concurrent get-or-insert callers cannot create duplicates or fail on each
+    other's rows. Other dialects insert inside a SAVEPOINT and roll back just
+    that insert on a unique violation.
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect in ("postgresql", "sqlite"):
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        await db.execute(dialect_insert(model).values(**row).on_conflict_do_nothing(index_elements=conflict_columns))
+        return
+
+    try:
+        async with db.begin_nested():
+            await db.execute(insert(model).values(**row))
+    except IntegrityError:
+        pass
+
+def _pool_stats(pool) -> dict:
+    stats = {
+        "pool_class": type(pool).__name__,
+        "status": pool.status()
+    }
+    for metric in ("size", "checkedin", "checkedout", "overflow"):
+        if hasattr(pool, metric):
+            stats[metric] = getattr(pool, metric)()
+    return stats
+
+def get_pool_stats() -> dict:
+    """Report connection pool usage for monitoring."""
+    return {
+        "dialect": engine.dialect.name,
+        "sync": _pool_stats(engine.pool),
+        "async": _pool_stats(async_engine.sync_engine.pool)
+    }
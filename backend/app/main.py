@@ -1,33 +1,57 @@
-from fastapi import FastAPI, Depends, HTTPException, status, File, UploadFile, Response, Body, Form
+from fastapi import FastAPI, Depends, HTTPException, status, File, UploadFile, Response, Body, Form, Query
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
-from . import models, schemas, database
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, raiseload
+from . import models, schemas, database, queries
 from .auth import utils, oauth
-from .database import engine
+from .auth import cache as auth_cache
 from .config import settings
 from jose import JWTError
+from pydantic import ValidationError
 from datetime import datetime
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi import Request
 from fastapi.middleware.cors import CORSMiddleware
-from .agents.groq_analyzer import GroqAnalyzer
-from .services.firebase import FirebaseService
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
 from .auth.oauth import get_current_user, get_current_user_optional
-from .agents.file_agent import FileAgent
-from .agents.report_analyzer import ReportAnalyzer
 from fastapi import APIRouter
 from .models import ReportStatus  # Add this import
-from .agents.meeting_analyzer import MeetingAnalyzer
-from PyPDF2 import PdfReader
-import io
+from .agents.meeting_analyzer import normalize_key
+from .services.container import services
+from .services.jobs import JobQueue, QueueFullError
+from .services.http import http_client
+from .migrate import ensure_schema
+from .pagination import paginate
+from contextlib import asynccontextmanager
+import asyncio
+import json
+import logging
+import os
+import shutil
+import time
+import uuid
 
-# Create all database tables
-models.Base.metadata.drop_all(bind=engine)  # Drop existing tables
-models.Base.metadata.create_all(bind=engine)  # Create new tables
+logger = logging.getLogger(__name__)
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Schema changes are applied by migrations (run.py / `alembic upgrade head`)
+    # before workers start; this only checks the recorded revision
+    await asyncio.to_thread(ensure_schema)
+    if settings.PRELOAD_SERVICES:
+        await asyncio.to_thread(services.preload)
+    await http_client.start()
+    await job_queue.start()
+    yield
+    await job_queue.stop()
+    await services.aclose()
+    utils.shutdown_hash_executor()
+    await http_client.stop()
+
+app = FastAPI(lifespan=lifespan)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
@@ -41,24 +65,29 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = utils.jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = auth_cache.decode_token(token)
         email: str = payload.get("sub")
         if email is None:
             raise credentials_exception
     except JWTError:
         raise credentials_exception
+    cached = auth_cache.get_cached_user(payload)
+    if cached is not None:
+        return cached
     user = db.query(models.User).filter(models.User.email == email).first()
     if user is None:
         raise credentials_exception
-    return user
+    return auth_cache.cache_user(payload, user)
 
 @app.post("/register", response_model=schemas.User)
-def register(user: schemas.UserCreate, db: Session = Depends(database.get_db)):
-    db_user = db.query(models.User).filter(models.User.email == user.email).first()
-    if db_user:
+async def register(user: schemas.UserCreate, db: AsyncSession = Depends(database.get_async_db)):
+    result = await db.execute(select(models.User).where(models.User.email == user.email))
+    if result.scalars().first():
         raise HTTPException(status_code=400, detail="Email already registered")
+    # End the read transaction so no connection is held while bcrypt runs
+    await db.commit()
     
-    hashed_password = utils.get_password_hash(user.password)
+    hashed_password = await utils.hash_password(user.password)
     now = datetime.utcnow()
     db_user = models.User(
         email=user.email,
@@ -69,16 +98,16 @@ def register(user: schemas.UserCreate, db: Session = Depends(database.get_db)):
         role="user"  # Default role is 'user'
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     return db_user
 
 # New endpoint to create admin users (protected)
 @app.post("/create-admin", response_model=schemas.User)
-def create_admin(
+async def create_admin(
     user: schemas.UserCreate,
     current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(database.get_db)
+    db: AsyncSession = Depends(database.get_async_db)
 ):
     if current_user.role != "admin":
         raise HTTPException(
@@ -86,11 +115,13 @@ def create_admin(
             detail="Only admins can create other admin accounts"
         )
     
-    db_user = db.query(models.User).filter(models.User.email == user.email).first()
-    if db_user:
+    result = await db.execute(select(models.User).where(models.User.email == user.email))
+    if result.scalars().first():
         raise HTTPException(status_code=400, detail="Email already registered")
+    # End the read transaction so no connection is held while bcrypt runs
+    await db.commit()
     
-    hashed_password = utils.get_password_hash(user.password)
+    hashed_password = await utils.hash_password(user.password)
     now = datetime.utcnow()
     db_user = models.User(
         email=user.email,
@@ -101,26 +132,38 @@ def create_admin(
         role="admin"
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
+    # Never serve a stale role for this account from the user cache
+    auth_cache.invalidate_user(db_user.email)
     return db_user
 
 @app.post("/token", response_model=schemas.Token)
-def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(database.get_db)):
-    user = db.query(models.User).filter(models.User.email == form_data.username).first()
-    if not user or not utils.verify_password(form_data.password, user.hashed_password):
+async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(database.get_async_db)):
+    result = await db.execute(select(models.User).where(models.User.email == form_data.username))
+    user = result.scalars().first()
+    # End the read transaction so no connection is held while bcrypt runs
+    await db.commit()
+    valid, new_hash = (False, None)
+    if user:
+        valid, new_hash = await utils.verify_and_update_password(form_data.password, user.hashed_password)
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    if new_hash:
+        # The stored hash used an old cost factor; upgrade it now that we have the password
+        user.hashed_password = new_hash
+        await db.commit()
     access_token = utils.create_access_token(data={"sub": user.email})
     return {"access_token": access_token, "token_type": "bearer"}
 
 @app.post("/google-login")
 async def google_login(
     token_data: dict,
-    db: Session = Depends(database.get_db)
+    db: AsyncSession = Depends(database.get_async_db)
 ):
     try:
         result = await oauth.authenticate_google_user(token_data["token"], db)
@@ -159,96 +202,184 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize Groq analyzer instead of sentiment analyzer
-groq_analyzer = GroqAnalyzer(api_key=settings.GROQ_API_KEY)
-
-# Initialize Firebase service
-firebase_service = FirebaseService()
+if settings.DB_STATEMENT_BUDGET:
+    @app.middleware("http")
+    async def enforce_statement_budget(request: Request, call_next):
+        # Catch N+1 regressions: report how many SQL statements each request ran
+        with database.count_statements() as counter:
+            response = await call_next(request)
+        response.headers["X-DB-Statements"] = str(counter.count)
+        if counter.count > settings.DB_STATEMENT_BUDGET:
+            logger.warning(
+                "%s %s ran %d SQL statements (budget %d)",
+                request.method, request.url.path, counter.count, settings.DB_STATEMENT_BUDGET
+            )
+        return response
 
-# Initialize FileAgent with both API keys
-file_agent = FileAgent(
-    groq_api_key=settings.GROQ_API_KEY,
-    gemini_api_key=settings.GEMINI_API_KEY
-)
+# Serve uploads written by the local storage backend
+if settings.STORAGE_BACKEND == "local":
+    os.makedirs(settings.STORAGE_LOCAL_ROOT, exist_ok=True)
+    app.mount("/storage", StaticFiles(directory=settings.STORAGE_LOCAL_ROOT), name="storage")
 
-# Initialize report analyzer
-report_analyzer = ReportAnalyzer(
-    groq_api_key=settings.GROQ_API_KEY,
-    gemini_api_key=settings.GEMINI_API_KEY
+# Background job queue for report and meeting analysis
+job_queue = JobQueue(
+    worker_count=settings.JOB_WORKERS,
+    max_size=settings.JOB_QUEUE_MAX_SIZE,
+    lease_seconds=settings.JOB_LEASE_SECONDS,
+    max_attempts=settings.JOB_MAX_ATTEMPTS
 )
 
 # Create router
 router = APIRouter(prefix="/reports", tags=["reports"])
 
-@router.post("/", response_model=schemas.Report)
+async def save_report_stage(report_db_id: int, stage: str, result):
+    """Write a finished analysis stage onto its report row."""
+    async with database.AsyncSessionLocal() as db:
+        db_report = await db.get(models.Report, report_db_id)
+        if stage == "analysis":
+            db_report.category = result["main_category"]
+            db_report.sub_categories = result["sub_categories"]
+            db_report.severity_level = result["severity_level"]
+            db_report.priority_level = result["priority_level"]
+            db_report.estimated_financial_impact = result.get("estimated_financial_impact")
+            db_report.entities_involved = result["entities_involved"]
+            db_report.recommended_authorities = result["recommended_authorities"]
+            db_report.risk_assessment = result["risk_assessment"]
+            db_report.potential_evidence = result["potential_evidence"]
+            db_report.summary = result["summary"]
+        elif stage == "credibility":
+            db_report.credibility_score = result["credibility_score"]
+        elif stage == "report_id":
+            db_report.report_id = result
+        else:
+            return
+        db_report.updated_at = datetime.utcnow()
+        await db.commit()
+
+async def discard_report(report_db_id: int):
+    """Delete a report whose analysis failed, with its attachments."""
+    async with database.AsyncSessionLocal() as db:
+        await db.execute(delete(models.ReportAttachment).where(models.ReportAttachment.report_id == report_db_id))
+        await db.execute(delete(models.Report).where(models.Report.id == report_db_id))
+        await db.commit()
+
+async def run_report_job(job_id: str, payload: dict) -> dict:
+    """Background job: analyze a submitted report, filling in its row stage by stage."""
+    report_db_id = payload["report_db_id"]
+    completed_stages = []
+
+    async def on_stage(stage: str, result):
+        await save_report_stage(report_db_id, stage, result)
+        completed_stages.append(stage)
+        await job_queue.update(job_id, result={"completed_stages": list(completed_stages)})
+
+    try:
+        result = await services.report_analyzer.run_pipeline(
+            payload["content"],
+            stage_timeout=settings.REPORT_STAGE_TIMEOUT_SECONDS,
+            on_stage=on_stage
+        )
+    except Exception:
+        # The submitter never received a report ID, so the row is unreachable
+        await discard_report(report_db_id)
+        raise
+    return {
+        "report_id": result["report_id"],
+        "completed_stages": completed_stages,
+        "errors": result["errors"],
+        "timings": result["timings"]
+    }
+
+async def abandon_report_job(job_id: str, payload: dict):
+    """Discard the report of a job that was given up on mid-run."""
+    await discard_report(payload["report_db_id"])
+
+job_queue.register("report", run_report_job, on_abandon=abandon_report_job)
+
+@router.post("/", response_model=schemas.JobAccepted, status_code=status.HTTP_202_ACCEPTED)
 async def create_report(
     report: schemas.ReportCreate,
-    db: Session = Depends(database.get_db)
+    db: AsyncSession = Depends(database.get_async_db)
 ):
+    if job_queue.is_full():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Report queue is full, please retry shortly"
+        )
+    
     try:
-        # Analyze report content
-        analysis = await report_analyzer.analyze_report(report.content)
-        
-        # Check for sensitive information
-        sensitive_info = await report_analyzer.detect_sensitive_info(report.content)
-        
-        # Assess credibility
-        credibility = await report_analyzer.assess_credibility(report.content)
-        
-        # Generate unique report ID
-        report_id = await report_analyzer.generate_report_id(analysis)
-        
-        # Create report record
+        # Create the report row up front; the background job fills in the analysis
         now = datetime.utcnow()
         db_report = models.Report(
-            report_id=report_id,
             content=report.content,
-            category=analysis["main_category"],
-            sub_categories=analysis["sub_categories"],
-            severity_level=analysis["severity_level"],
-            priority_level=analysis["priority_level"],
-            estimated_financial_impact=analysis.get("estimated_financial_impact"),
-            entities_involved=analysis["entities_involved"],
-            recommended_authorities=analysis["recommended_authorities"],
-            risk_assessment=analysis["risk_assessment"],
-            potential_evidence=analysis["potential_evidence"],
-            summary=analysis["summary"],
             status=models.ReportStatus.SUBMITTED,
-            credibility_score=credibility["credibility_score"],
             created_at=now,
             updated_at=now
         )
         
         db.add(db_report)
-        db.commit()
-        db.refresh(db_report)
+        await db.flush()
         
-        # Handle attachments if any
-        if report.attachments:
-            for attachment_url in report.attachments:
-                db_attachment = models.ReportAttachment(
-                    report_id=db_report.id,
-                    file_url=attachment_url,
-                    created_at=now
-                )
-                db.add(db_attachment)
-            
-            db.commit()
+        # Store the report and its attachments in one transaction
+        await database.bulk_insert(db, models.ReportAttachment, [
+            {"report_id": db_report.id, "file_url": attachment_url, "created_at": now}
+            for attachment_url in report.attachments or []
+        ])
+        await db.commit()
         
-        return db_report
+        try:
+            job_id = await job_queue.submit("report", {
+                "report_db_id": db_report.id,
+                "content": report.content
+            })
+        except Exception:
+            # Without a job the report would never be analyzed or reachable
+            await discard_report(db_report.id)
+            raise
+        return {"job_id": job_id, "status": models.JobStatus.QUEUED, "status_url": f"/jobs/{job_id}"}
         
+    except QueueFullError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Report queue is full, please retry shortly"
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error processing report: {str(e)}"
         )
 
+@router.get("/", response_model=schemas.Page[schemas.ReportSummary])
+async def list_reports(
+    status: Optional[ReportStatus] = None,
+    category: Optional[str] = None,
+    priority: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(default=None, ge=1),
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(database.get_async_db),
+    current_admin: models.User = Depends(get_current_admin)
+):
+    # Newest first; each filter has a (column, created_at) index
+    query = select(models.Report).options(raiseload("*"))
+    if status:
+        query = query.where(models.Report.status == status)
+    if category:
+        query = query.where(models.Report.category == category)
+    if priority:
+        query = query.where(models.Report.priority_level == priority)
+    return await paginate(
+        db, query, (models.Report.created_at, models.Report.id), schemas.ReportSummary,
+        cursor=cursor, limit=limit, fields=fields
+    )
+
 @router.get("/{report_id}", response_model=schemas.Report)
 async def get_report(
     report_id: str,
-    db: Session = Depends(database.get_db)
+    db: AsyncSession = Depends(database.get_async_db)
 ):
-    report = db.query(models.Report).filter(models.Report.report_id == report_id).first()
+    result = await db.execute(queries.report_by_public_id(report_id))
+    report = result.scalars().first()
     if not report:
         raise HTTPException(status_code=404, detail="Report not found")
     return report
@@ -256,32 +387,39 @@ async def get_report(
 @router.post("/{report_id}/attachments")
 async def add_attachment(
     report_id: str,
-    file: UploadFile = File(...),
-    db: Session = Depends(database.get_db)
+    file: List[UploadFile] = File(...),
+    db: AsyncSession = Depends(database.get_async_db)
 ):
-    report = db.query(models.Report).filter(models.Report.report_id == report_id).first()
+    result = await db.execute(queries.report_by_public_id(report_id))
+    report = result.scalars().first()
     if not report:
         raise HTTPException(status_code=404, detail="Report not found")
     
     try:
-        file_url = await firebase_service.upload_file(
-            file,
-            f"reports/{report_id}/attachments"
-        )
+        # Upload every attachment concurrently
+        file_urls = await asyncio.gather(*[
+            services.storage.upload_file(upload, f"reports/{report_id}/attachments")
+            for upload in file
+        ])
         
-        db_attachment = models.ReportAttachment(
-            report_id=report.id,
-            file_name=file.filename,
-            file_type=file.content_type,
-            file_url=file_url,
-            created_at=datetime.utcnow()
-        )
-        
-        db.add(db_attachment)
-        db.commit()
-        db.refresh(db_attachment)
+        now = datetime.utcnow()
+        await database.bulk_insert(db, models.ReportAttachment, [
+            {
+                "report_id": report.id,
+                "file_name": upload.filename,
+                "file_type": upload.content_type,
+                "file_url": file_url,
+                "created_at": now
+            }
+            for upload, file_url in zip(file, file_urls)
+        ])
+        await db.commit()
         
-        return {"message": "Attachment added successfully", "file_url": file_url}
+        return {
+            "message": f"{len(file_urls)} attachment(s) added successfully",
+            "file_url": file_urls[0],
+            "file_urls": file_urls
+        }
         
     except Exception as e:
         raise HTTPException(
@@ -292,16 +430,17 @@ async def add_attachment(
 @router.get("/{report_id}/investigation-steps")
 async def get_investigation_steps(
     report_id: str,
-    db: Session = Depends(database.get_db)
+    db: AsyncSession = Depends(database.get_async_db)
 ):
     try:
         # Get the report from database
-        report = db.query(models.Report).filter(models.Report.report_id == report_id).first()
+        result = await db.execute(queries.report_by_public_id(report_id))
+        report = result.scalars().first()
         if not report:
             raise HTTPException(status_code=404, detail="Report not found")
             
         # Generate investigation steps
-        steps = await report_analyzer.generate_investigation_steps(report.content)
+        steps = await services.report_analyzer.generate_investigation_steps(report.content)
         
         if not steps:
             raise HTTPException(
@@ -322,11 +461,12 @@ async def update_report_status(
     report_id: str,
     status: ReportStatus = Body(...),
     notes: str = Body(...),
-    db: Session = Depends(database.get_db)
+    db: AsyncSession = Depends(database.get_async_db)
 ):
     try:
         # Get the report
-        report = db.query(models.Report).filter(models.Report.report_id == report_id).first()
+        result = await db.execute(queries.report_by_public_id(report_id))
+        report = result.scalars().first()
         if not report:
             raise HTTPException(status_code=404, detail="Report not found")
         
@@ -342,25 +482,25 @@ async def update_report_status(
         )
         
         db.add(update)
-        db.commit()
-        db.refresh(report)
+        await db.commit()
+        await db.refresh(report)
         
         return {"message": "Status updated successfully"}
         
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=500,
             detail=f"Error updating report status: {str(e)}"
         )
 
 @app.post("/feedback", response_model=schemas.Feedback)
-def create_feedback(
+async def create_feedback(
     feedback: schemas.FeedbackCreate,
     db: Session = Depends(database.get_db)
 ):
     # Analyze feedback using Groq
-    analysis = groq_analyzer.analyze_feedback(feedback.content)
+    analysis = await services.groq_analyzer.analyze_feedback(feedback.content)
     
     # Create feedback entry
     db_feedback = models.PublicFeedback(
@@ -384,16 +524,118 @@ def create_feedback(
         "topics": db_feedback.topics.split(",") if db_feedback.topics else []
     }
 
+def parse_feedback_item(item, position: int) -> schemas.FeedbackCreate:
+    try:
+        return schemas.FeedbackCreate.model_validate(item)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Invalid feedback item {position}: {e.errors()[0]['msg']}"
+        )
+
+def parse_feedback_line(line: bytes, line_number: int) -> schemas.FeedbackCreate:
+    try:
+        item = json.loads(line)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Invalid JSON on line {line_number}"
+        )
+    return parse_feedback_item(item, line_number)
+
+async def read_feedback_items(request: Request):
+    """Yield feedback items from a JSON array body or an NDJSON stream."""
+    content_type = request.headers.get("content-type", "")
+    if "ndjson" in content_type or "jsonlines" in content_type:
+        # Parse line by line as the body arrives instead of buffering it whole
+        buffer, line_number = b"", 0
+        async for chunk in request.stream():
+            *lines, buffer = (buffer + chunk).split(b"\n")
+            for line in lines:
+                line_number += 1
+                if line.strip():
+                    yield parse_feedback_line(line, line_number)
+        if buffer.strip():
+            yield parse_feedback_line(buffer, line_number + 1)
+        return
+
+    try:
+        items = json.loads(await request.body())
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Invalid JSON body")
+    if not isinstance(items, list):
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Expected a JSON array of feedback items")
+    for position, item in enumerate(items):
+        yield parse_feedback_item(item, position)
+
+async def store_feedback_chunk(db: AsyncSession, items: List[schemas.FeedbackCreate]) -> int:
+    """Analyze a chunk of feedback with batched prompts and bulk insert it."""
+    analyses = await services.groq_analyzer.analyze_feedback_batch([item.content for item in items])
+    now = datetime.utcnow()
+    await database.bulk_insert(db, models.PublicFeedback, [
+        {
+            "name": item.name,
+            "content": item.content,
+            "sentiment_score": analysis["sentiment_score"],
+            "sentiment_label": analysis["sentiment_label"],
+            "topics": ",".join(analysis["topics"]),
+            "summary": analysis["summary"],
+            "created_at": now
+        }
+        for item, analysis in zip(items, analyses)
+    ])
+    await db.commit()
+    return len(items)
+
+@app.post("/feedback/batch", response_model=schemas.FeedbackBatchResult)
+async def create_feedback_batch(
+    request: Request,
+    db: AsyncSession = Depends(database.get_async_db)
+):
+    """Ingest many feedback items as a JSON array or NDJSON (application/x-ndjson).
+
+    Items are analyzed and stored in chunks of FEEDBACK_INGEST_CHUNK, each
+    committed as it completes.
+    """
+    started = time.perf_counter()
+    created = 0
+    chunk: List[schemas.FeedbackCreate] = []
+    try:
+        async for item in read_feedback_items(request):
+            if created + len(chunk) >= settings.FEEDBACK_BATCH_MAX_ITEMS:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"At most {settings.FEEDBACK_BATCH_MAX_ITEMS} feedback items per request"
+                )
+            chunk.append(item)
+            if len(chunk) >= settings.FEEDBACK_INGEST_CHUNK:
+                created += await store_feedback_chunk(db, chunk)
+                chunk = []
+        if chunk:
+            created += await store_feedback_chunk(db, chunk)
+    except HTTPException as e:
+        if created:
+            e.detail = f"{e.detail} ({created} items were stored before the error)"
+        raise
+
+    elapsed = time.perf_counter() - started
+    return {
+        "created": created,
+        "elapsed_seconds": round(elapsed, 3),
+        "items_per_second": round(created / elapsed, 1) if elapsed > 0 else 0.0
+    }
+
 @app.post("/documents/upload", response_model=schemas.Document)
 async def upload_document(
     file: UploadFile = File(...),
-    db: Session = Depends(database.get_db),
+    db: AsyncSession = Depends(database.get_async_db),
     current_user: models.User = Depends(oauth.get_current_user)
 ):
     try:
-        # Upload file to Firebase with user_id
+        # Upload file to storage under the user's folder
         user_id = current_user.id if current_user else None
-        firebase_url = await firebase_service.upload_file(file, user_id)
+        folder = f"users/{user_id}/documents" if user_id else "documents"
+        firebase_url = await services.storage.upload_file(file, folder)
         
         # Create document record in database
         db_document = models.Document(
@@ -405,8 +647,20 @@ async def upload_document(
         )
         
         db.add(db_document)
-        db.commit()
-        db.refresh(db_document)
+        await db.commit()
+        await db.refresh(db_document)
+        
+        # Extract and store the text now so later reads skip Firebase entirely;
+        # the upload is streamed from its spool file, and oversized files are
+        # left to lazy extraction
+        if file.size is not None and file.size <= settings.PDF_MAX_BYTES:
+            try:
+                await file.seek(0)
+                await services.document_text_store.store_file(db, db_document, file.file)
+                await db.refresh(db_document)
+            except Exception as e:
+                await db.rollback()
+                logger.warning("Deferred text extraction for document %s: %s", db_document.id, e)
         
         return db_document
     except Exception as e:
@@ -415,16 +669,26 @@ async def upload_document(
             detail=f"Error uploading document: {str(e)}"
         )
 
-@app.get("/documents", response_model=List[schemas.Document])
-def get_documents(
-    db: Session = Depends(database.get_db),
+@app.get("/documents", response_model=schemas.Page[schemas.Document])
+async def get_documents(
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(default=None, ge=1),
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(database.get_async_db),
     current_user: models.User = Depends(get_current_user)
 ):
     try:
-        documents = db.query(models.Document).filter(
-            models.Document.uploaded_by == current_user.id
-        ).all()
-        return documents
+        return await paginate(
+            db,
+            select(models.Document).where(models.Document.uploaded_by == current_user.id),
+            (models.Document.id,),
+            schemas.Document,
+            cursor=cursor,
+            limit=limit,
+            fields=fields
+        )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -432,15 +696,18 @@ def get_documents(
         )
 
 @app.get("/documents/{document_id}", response_model=schemas.Document)
-def get_document(
+async def get_document(
     document_id: int,
     current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(database.get_db)
+    db: AsyncSession = Depends(database.get_async_db)
 ):
-    document = db.query(models.Document).filter(
-        models.Document.id == document_id,
-        models.Document.uploaded_by == current_user.id
-    ).first()
+    result = await db.execute(
+        select(models.Document).where(
+            models.Document.id == document_id,
+            models.Document.uploaded_by == current_user.id
+        )
+    )
+    document = result.scalars().first()
     
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
@@ -457,18 +724,16 @@ async def upload_page(request: Request):
 @app.get("/documents/{document_id}/content")
 async def get_document_content(
     document_id: int,
-    db: Session = Depends(database.get_db)
+    db: AsyncSession = Depends(database.get_async_db)
 ):
     # Get document without checking ownership
-    document = db.query(models.Document).filter(
-        models.Document.id == document_id
-    ).first()
+    document = await db.get(models.Document, document_id)
     
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
     
     try:
-        content, is_text = await file_agent.read_file_content(document.firebase_url, document.content_type)
+        content, is_text = await services.document_text_store.get_content(db, document)
         if is_text:
             return {"content": content}
         return Response(content=content, media_type=document.content_type)
@@ -482,24 +747,22 @@ async def get_document_content(
 async def get_document_summary(
     document_id: int,
     max_length: Optional[int] = 500,
-    db: Session = Depends(database.get_db)
+    db: AsyncSession = Depends(database.get_async_db)
 ):
     # Get document without checking ownership
-    document = db.query(models.Document).filter(
-        models.Document.id == document_id
-    ).first()
+    document = await db.get(models.Document, document_id)
     
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
     
     try:
-        content, is_text = await file_agent.read_file_content(document.firebase_url, document.content_type)
+        content, is_text = await services.document_text_store.get_content(db, document)
         if not is_text:
             raise HTTPException(
                 status_code=400,
                 detail="Cannot summarize binary content. Only text files are supported."
             )
-        summary = await file_agent.summarize_content(content, max_length)
+        summary = await services.file_agent.summarize_content(content, max_length)
         return {"summary": summary}
     except Exception as e:
         raise HTTPException(
@@ -507,28 +770,54 @@ async def get_document_summary(
             detail=f"Error summarizing document: {str(e)}"
         )
 
+@app.get("/documents/{document_id}/summary/stream")
+async def stream_document_summary(
+    document_id: int,
+    max_length: Optional[int] = 500,
+    db: AsyncSession = Depends(database.get_async_db)
+):
+    # Get document without checking ownership
+    document = await db.get(models.Document, document_id)
+    
+    if not document:
+        raise HTTPException(status_code=404, detail="Document not found")
+    
+    content, is_text = await services.document_text_store.get_content(db, document)
+    if not is_text:
+        raise HTTPException(
+            status_code=400,
+            detail="Cannot summarize binary content. Only text files are supported."
+        )
+    
+    async def event_stream():
+        try:
+            async for event in services.file_agent.summarize_content_stream(content, max_length):
+                yield f"event: {event['event']}\ndata: {json.dumps(event)}\n\n"
+        except Exception as e:
+            yield f"event: error\ndata: {json.dumps({'detail': str(e)})}\n\n"
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
 @app.get("/documents/{document_id}/translate/{language}", response_model=schemas.FileTranslation)
 async def translate_document(
     document_id: int,
     language: str,
-    db: Session = Depends(database.get_db)
+    db: AsyncSession = Depends(database.get_async_db)
 ):
     # Get document without checking ownership
-    document = db.query(models.Document).filter(
-        models.Document.id == document_id
-    ).first()
+    document = await db.get(models.Document, document_id)
     
     if not document:
         raise HTTPException(status_code=404, detail="Document not found")
     
     try:
-        content, is_text = await file_agent.read_file_content(document.firebase_url, document.content_type)
+        content, is_text = await services.document_text_store.get_content(db, document)
         if not is_text:
             raise HTTPException(
                 status_code=400,
                 detail="Cannot translate binary content. Only text files are supported."
             )
-        translated_content = await file_agent.translate_content(content, language)
+        translated_content = await services.file_agent.translate_content(content, language)
         return {"translated_content": translated_content}
     except Exception as e:
         raise HTTPException(
@@ -536,128 +825,255 @@ async def translate_document(
             detail=f"Error translating document: {str(e)}"
         )
 
-@app.post("/meetings/analyze", response_model=schemas.MeetingAnalysis)
-async def analyze_meeting(
-    file: UploadFile = File(...),
-    title: str = Form(default="Untitled Meeting"),
-    file_type: str = Form(default="audio"),  # 'audio' or 'pdf'
-    db: Session = Depends(database.get_db)
-):
-    try:
-        contents = await file.read()
-        file_format = file.filename.split('.')[-1].lower()
-        
-        # Initialize analyzer
-        analyzer = MeetingAnalyzer(
-            groq_api_key=settings.GROQ_API_KEY,
-            gemini_api_key=settings.GEMINI_API_KEY
-        )
-        
-        # Handle different file types
-        if file_type == "pdf":
-            # Extract text from PDF
-            pdf_file = io.BytesIO(contents)
-            pdf_reader = PdfReader(pdf_file)
-            transcript = ""
-            for page in pdf_reader.pages:
-                transcript += page.extract_text() + "\n"
-        else:
-            # Handle audio file
-            transcript = await analyzer.transcribe_audio(contents, file_format)
-        
-        if not transcript:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Failed to extract text from {file_type} file"
-            )
-        
-        print(f"Text extraction successful. Length: {len(transcript)}")
-        
-        # Analyze the content
-        analysis = await analyzer.analyze_meeting(transcript)
-        
-        # Store in database
-        sentiment_map = {
-            "positive": 1.0,
-            "neutral": 0.0,
-            "negative": -1.0
+SENTIMENT_SCORES = {
+    "positive": 1.0,
+    "neutral": 0.0,
+    "negative": -1.0
+}
+
+def meeting_sentiment_score(analysis: dict) -> float:
+    return SENTIMENT_SCORES.get(
+        analysis["sentiment_analysis"].get("overall_tone", "neutral").lower(),
+        0.0
+    )
+
+async def insert_meeting_analysis_rows(db: AsyncSession, meeting_id: int, analysis: dict, known_tasks=frozenset()):
+    """Bulk insert topic, action item and participant rows for a meeting analysis.
+
+    Action items whose normalized task is in ``known_tasks`` are skipped.
+    """
+    now = datetime.utcnow()
+    await database.bulk_insert(db, models.MeetingTopic, [
+        {
+            "meeting_id": meeting_id,
+            "topic": topic["topic"],
+            "key_points": topic["key_points"],
+            "decisions_made": topic.get("decisions_made") or [],
+            "importance_level": topic.get("importance_level") or "medium",
+            "created_at": now
         }
-        sentiment_score = sentiment_map.get(
-            analysis["sentiment_analysis"].get("overall_tone", "neutral").lower(),
-            0.0
-        )
-        
+        for topic in analysis.get("key_topics", [])
+    ])
+    await database.bulk_insert(db, models.ActionItem, [
+        {
+            "meeting_id": meeting_id,
+            "description": item["task"],
+            "assigned_to": None,
+            "due_date": None,
+            "priority": item.get("priority") or "medium",
+            "status": "pending",
+            "created_at": now,
+            "updated_at": now
+        }
+        for item in analysis.get("action_items", [])
+        if normalize_key(item["task"]) not in known_tasks
+    ])
+    await database.bulk_insert(db, models.MeetingParticipant, [
+        {
+            "meeting_id": meeting_id,
+            "name": participant["name"],
+            "role": participant.get("role") or "participant",
+            "contributions": participant.get("contributions") or [],
+            "created_at": now
+        }
+        for participant in analysis.get("participants", [])
+    ])
+
+async def process_meeting_upload(payload: dict) -> dict:
+    """Extract, analyze and store a spooled meeting upload."""
+    upload_path = payload["upload_path"]
+    filename = payload["filename"]
+    file_type = payload["file_type"]
+
+    file_format = filename.split('.')[-1].lower()
+    
+    analyzer = services.meeting_analyzer
+    
+    # Handle different file types
+    if file_type == "pdf":
+        # Extract text from the spooled PDF without loading it on the event loop
+        transcript = await services.pdf_extractor.extract_text(upload_path)
+    else:
+        # Stream the spooled audio through the chunked transcriber
+        transcript = await analyzer.transcribe_audio(upload_path, file_format)
+    
+    if not transcript:
+        raise Exception(f"Failed to extract text from {file_type} file")
+    
+    print(f"Text extraction successful. Length: {len(transcript)}")
+    
+    # Analyze the content window by window, keeping the per-window results
+    analysis, segments = await analyzer.analyze_transcript(transcript)
+    
+    async with database.AsyncSessionLocal() as db:
         # Create meeting record
         db_meeting = models.Meeting(
-            title=title,
+            title=payload["title"],
             date=datetime.utcnow(),
-            file_path=f"meetings/{file.filename}",
+            file_path=f"meetings/{filename}",
             file_type=file_type,
             transcript=transcript,
             summary=analysis["summary"],
-            sentiment_score=sentiment_score,
+            sentiment_score=meeting_sentiment_score(analysis),
+            analysis_segments=segments,
             created_at=datetime.utcnow(),
             updated_at=datetime.utcnow()
         )
         db.add(db_meeting)
-        db.commit()
-        db.refresh(db_meeting)
-        
-        # Create topics
-        for topic in analysis.get("key_topics", []):
-            db_topic = models.MeetingTopic(
-                meeting_id=db_meeting.id,
-                topic=topic["topic"],
-                key_points=topic["key_points"],
-                decisions_made=topic.get("decisions_made", []),
-                importance_level=topic.get("importance_level", "medium"),
-                created_at=datetime.utcnow()
-            )
-            db.add(db_topic)
-        
-        # Create action items
-        for item in analysis.get("action_items", []):
-            db_action_item = models.ActionItem(
-                meeting_id=db_meeting.id,
-                description=item["task"],
-                assigned_to=None,
-                due_date=None,
-                priority=item.get("priority", "medium"),
-                status="pending",
-                created_at=datetime.utcnow(),
+        await db.flush()
+
+        # The meeting and all of its child rows are stored in one transaction
+        await insert_meeting_analysis_rows(db, db_meeting.id, analysis)
+        await db.commit()
+        meeting_id = db_meeting.id
+    
+    return {"meeting_id": meeting_id, "analysis": analysis}
+
+async def run_meeting_job(job_id: str, payload: dict) -> dict:
+    """Background job: analyze an uploaded meeting file, then discard the upload."""
+    try:
+        result = await process_meeting_upload(payload)
+    except Exception:
+        os.remove(payload["upload_path"])
+        raise
+    os.remove(payload["upload_path"])
+    return result
+
+job_queue.register("meeting", run_meeting_job)
+
+async def run_meeting_extension_job(job_id: str, payload: dict) -> dict:
+    """Background job: append to a meeting transcript and re-analyze only what changed."""
+    meeting_id = payload["meeting_id"]
+
+    async with database.AsyncSessionLocal() as db:
+        # Append in SQL so concurrent extensions cannot overwrite each other
+        await db.execute(
+            update(models.Meeting)
+            .where(models.Meeting.id == meeting_id)
+            .values(
+                transcript=func.coalesce(models.Meeting.transcript + "\n", "") + payload["text"],
                 updated_at=datetime.utcnow()
             )
-            db.add(db_action_item)
+        )
+        await db.commit()
+        meeting = await db.get(models.Meeting, meeting_id)
+        if meeting is None:
+            raise Exception(f"Meeting {meeting_id} not found")
+        transcript = meeting.transcript
+        cached_segments = meeting.analysis_segments or []
+
+    # No session is held while the LLM works through the new windows
+    analysis, segments = await services.meeting_analyzer.analyze_transcript(transcript, cached_segments)
+    cached_hashes = {segment["hash"] for segment in cached_segments}
+    reanalyzed = sum(1 for segment in segments if segment["hash"] not in cached_hashes)
+
+    async with database.AsyncSessionLocal() as db:
+        result = await db.execute(queries.meeting_by_id(meeting_id, queries.MEETING_ACTION_ITEMS))
+        meeting = result.scalars().first()
+        if meeting is None or meeting.transcript != transcript:
+            # A later extension owns the newer transcript and will store its analysis
+            return {"meeting_id": meeting_id, "superseded": True, "reanalyzed_segments": reanalyzed}
+
+        meeting.summary = analysis["summary"]
+        meeting.sentiment_score = meeting_sentiment_score(analysis)
+        meeting.analysis_segments = segments
+        meeting.updated_at = datetime.utcnow()
+
+        # Topics and participants are derived data and are replaced; existing
+        # action items may have been edited, so only new tasks are added
+        await db.execute(delete(models.MeetingTopic).where(models.MeetingTopic.meeting_id == meeting_id))
+        await db.execute(delete(models.MeetingParticipant).where(models.MeetingParticipant.meeting_id == meeting_id))
+        known_tasks = {normalize_key(item.description) for item in meeting.action_items}
+        await insert_meeting_analysis_rows(db, meeting_id, analysis, known_tasks=known_tasks)
+        await db.commit()
+
+    return {"meeting_id": meeting_id, "analysis": analysis, "reanalyzed_segments": reanalyzed}
+
+job_queue.register("meeting_extension", run_meeting_extension_job)
+
+@app.post("/meetings/analyze", response_model=schemas.JobAccepted, status_code=status.HTTP_202_ACCEPTED)
+async def analyze_meeting(
+    file: UploadFile = File(...),
+    title: str = Form(default="Untitled Meeting"),
+    file_type: str = Form(default="audio")  # 'audio' or 'pdf'
+):
+    if job_queue.is_full():
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Meeting queue is full, please retry shortly"
+        )
+    
+    try:
+        # Spool the upload to disk so the job survives a restart
+        os.makedirs(settings.JOB_UPLOAD_DIR, exist_ok=True)
+        upload_path = os.path.join(settings.JOB_UPLOAD_DIR, f"{uuid.uuid4()}_{os.path.basename(file.filename)}")
+        with open(upload_path, "wb") as f:
+            await asyncio.to_thread(shutil.copyfileobj, file.file, f)
         
-        # Create participants
-        for participant in analysis.get("participants", []):
-            db_participant = models.MeetingParticipant(
-                meeting_id=db_meeting.id,
-                name=participant["name"],
-                role=participant.get("role", "participant"),
-                contributions=participant.get("contributions", []),
-                created_at=datetime.utcnow()
+        try:
+            job_id = await job_queue.submit("meeting", {
+                "upload_path": upload_path,
+                "filename": file.filename,
+                "title": title,
+                "file_type": file_type
+            })
+        except QueueFullError:
+            os.remove(upload_path)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Meeting queue is full, please retry shortly"
             )
-            db.add(db_participant)
-        
-        db.commit()
-        
-        return analysis
+        return {"job_id": job_id, "status": models.JobStatus.QUEUED, "status_url": f"/jobs/{job_id}"}
         
+    except HTTPException:
+        raise
     except Exception as e:
-        db.rollback()
         print(f"Error in analyze_meeting: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error processing meeting: {str(e)}"
         )
 
+@app.post("/meetings/{meeting_id}/transcript", response_model=schemas.JobAccepted, status_code=status.HTTP_202_ACCEPTED)
+async def extend_meeting_transcript(
+    meeting_id: int,
+    extension: schemas.TranscriptExtension,
+    db: AsyncSession = Depends(database.get_async_db)
+):
+    """Append text to a meeting transcript; only the new windows are re-analyzed."""
+    if await db.get(models.Meeting, meeting_id) is None:
+        raise HTTPException(status_code=404, detail="Meeting not found")
+
+    try:
+        job_id = await job_queue.submit("meeting_extension", {
+            "meeting_id": meeting_id,
+            "text": extension.text
+        })
+    except QueueFullError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Meeting queue is full, please retry shortly"
+        )
+    return {"job_id": job_id, "status": models.JobStatus.QUEUED, "status_url": f"/jobs/{job_id}"}
+
+@app.get("/jobs/{job_id}", response_model=schemas.Job)
+async def get_job(
+    job_id: str,
+    db: AsyncSession = Depends(database.get_async_db)
+):
+    job = await db.get(models.Job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
 @app.get("/meetings/{meeting_id}", response_model=schemas.Meeting)
 async def get_meeting(
     meeting_id: int,
-    db: Session = Depends(database.get_db)
+    db: AsyncSession = Depends(database.get_async_db)
 ):
-    meeting = db.query(models.Meeting).filter(models.Meeting.id == meeting_id).first()
+    # Topics, action items and participants come back in one query each
+    result = await db.execute(queries.meeting_by_id(meeting_id))
+    meeting = result.scalars().first()
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
     return meeting
@@ -665,40 +1081,36 @@ async def get_meeting(
 @app.get("/meetings/{meeting_id}/action-items", response_model=List[schemas.ActionItem])
 async def get_meeting_action_items(
     meeting_id: int,
-    db: Session = Depends(database.get_db)
+    db: AsyncSession = Depends(database.get_async_db)
 ):
-    action_items = db.query(models.ActionItem).filter(
-        models.ActionItem.meeting_id == meeting_id
-    ).all()
-    return action_items
+    result = await db.execute(
+        queries.action_items().where(models.ActionItem.meeting_id == meeting_id)
+    )
+    return result.scalars().all()
 
 @app.post("/meetings/{meeting_id}/action-items", response_model=schemas.ActionItem)
 async def create_action_item(
     meeting_id: int,
     action_item: schemas.ActionItemCreate,
-    db: Session = Depends(database.get_db)
+    db: AsyncSession = Depends(database.get_async_db)
 ):
     db_action_item = models.ActionItem(**action_item.dict(), meeting_id=meeting_id)
     db.add(db_action_item)
-    db.commit()
-    db.refresh(db_action_item)
+    await db.commit()
+    await db.refresh(db_action_item)
     return db_action_item
 
 @app.get("/meetings/{meeting_id}/minutes", response_model=schemas.MeetingMinutes)
 async def get_meeting_minutes(
     meeting_id: int,
-    db: Session = Depends(database.get_db)
+    db: AsyncSession = Depends(database.get_async_db)
 ):
-    meeting = db.query(models.Meeting).filter(models.Meeting.id == meeting_id).first()
+    # Topics, action items and participants come back in one query each
+    result = await db.execute(queries.meeting_by_id(meeting_id))
+    meeting = result.scalars().first()
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
         
-    analyzer = MeetingAnalyzer(
-        groq_api_key=settings.GROQ_API_KEY,
-        gemini_api_key=settings.GEMINI_API_KEY,
-        google_credentials_path=settings.GOOGLE_CREDENTIALS_PATH
-    )
-    
     # Convert SQLAlchemy objects to dictionaries
     analysis = {
         "summary": meeting.summary,
@@ -722,7 +1134,7 @@ async def get_meeting_minutes(
         } for participant in meeting.participants]
     }
     
-    minutes = await analyzer.generate_meeting_minutes(analysis)
+    minutes = await services.meeting_analyzer.generate_meeting_minutes(analysis)
     return {"content": minutes}
 
 @app.put("/meetings/{meeting_id}/action-items/{item_id}", response_model=schemas.ActionItem)
@@ -730,12 +1142,15 @@ async def update_action_item(
     meeting_id: int,
     item_id: int,
     action_item: schemas.ActionItemUpdate,
-    db: Session = Depends(database.get_db)
+    db: AsyncSession = Depends(database.get_async_db)
 ):
-    db_item = db.query(models.ActionItem).filter(
-        models.ActionItem.id == item_id,
-        models.ActionItem.meeting_id == meeting_id
-    ).first()
+    result = await db.execute(
+        queries.action_items().where(
+            models.ActionItem.id == item_id,
+            models.ActionItem.meeting_id == meeting_id
+        )
+    )
+    db_item = result.scalars().first()
     
     if not db_item:
         raise HTTPException(status_code=404, detail="Action item not found")
@@ -743,20 +1158,48 @@ async def update_action_item(
     for key, value in action_item.dict(exclude_unset=True).items():
         setattr(db_item, key, value)
     
-    db.commit()
-    db.refresh(db_item)
+    await db.commit()
+    await db.refresh(db_item)
     return db_item
 
-@app.get("/users/{user_id}/action-items", response_model=List[schemas.ActionItem])
+@app.get("/users/{user_id}/action-items", response_model=schemas.Page[schemas.ActionItem])
 async def get_user_action_items(
     user_id: int,
     status: Optional[str] = None,
-    db: Session = Depends(database.get_db)
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(default=None, ge=1),
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(database.get_async_db)
 ):
-    query = db.query(models.ActionItem).filter(models.ActionItem.assigned_to == user_id)
+    query = queries.action_items().where(models.ActionItem.assigned_to == user_id)
     if status:
-        query = query.filter(models.ActionItem.status == status)
-    return query.all()
+        query = query.where(models.ActionItem.status == status)
+    return await paginate(
+        db, query, (models.ActionItem.id,), schemas.ActionItem,
+        cursor=cursor, limit=limit, fields=fields
+    )
+
+@app.get("/meetings", response_model=schemas.Page[schemas.MeetingSummary])
+async def list_meetings(
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(default=None, ge=1),
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(database.get_async_db)
+):
+    return await paginate(
+        db, select(models.Meeting).options(raiseload("*")), (models.Meeting.id,), schemas.MeetingSummary,
+        cursor=cursor, limit=limit, fields=fields
+    )
+
+@app.get("/llm-cache/stats")
+async def get_llm_cache_stats(current_admin: models.User = Depends(get_current_admin)):
+    if services.llm_client.cache is None:
+        return {"backend": "none", "hits": 0, "misses": 0, "hit_rate": 0.0, "size": 0}
+    return await services.llm_client.cache.stats()
+
+@app.get("/db/pool-stats")
+def get_db_pool_stats(current_admin: models.User = Depends(get_current_admin)):
+    return database.get_pool_stats()
 
 # Add this line to include the router in the app
 app.include_router(router)
\ No newline at end of file
@@ -0,0 +1,50 @@
+import logging
+from pathlib import Path
+from typing import Optional
+from .database import SQLALCHEMY_DATABASE_URL, engine
+
+logger = logging.getLogger(__name__)
+
+# Alembic is imported inside each function so importing the app stays cheap
+
+ALEMBIC_INI = Path(__file__).resolve().parent.parent / "alembic.ini"
+
+def get_alembic_config():
+    from alembic.config import Config
+
+    config = Config(str(ALEMBIC_INI))
+    config.set_main_option("sqlalchemy.url", SQLALCHEMY_DATABASE_URL.replace("%", "%%"))
+    return config
+
+def head_revision() -> Optional[str]:
+    """Latest revision in the migration scripts (read from disk, not the database)."""
+    from alembic.script import ScriptDirectory
+
+    return ScriptDirectory.from_config(get_alembic_config()).get_current_head()
+
+def current_revision() -> Optional[str]:
+    """Revision recorded in the database's alembic_version table."""
+    from alembic.runtime.migration import MigrationContext
+
+    with engine.connect() as connection:
+        return MigrationContext.configure(connection).get_current_revision()
+
+def upgrade_database():
+    """Apply every pending migration; concurrent callers wait on a database lock."""
+    from alembic import command
+
+    command.upgrade(get_alembic_config(), "head")
+
+def ensure_schema():
+    """Fast startup check: only run migrations when the database is behind head.
+
+    Reads the single alembic_version row instead of reflecting the schema, so
+    it is cheap enough to run in every worker process.
+    """
+    if current_revision() == head_revision():
+        return
+    logger.info("Database schema is behind; running migrations")
+    upgrade_database()
+
+if __name__ == "__main__":
+    upgrade_database()
@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean, Column, Integer, String, DateTime, Enum, Text, ForeignKey, Float, JSON, Table
+from sqlalchemy import Boolean, Column, Integer, String, DateTime, Enum, Text, ForeignKey, Float, JSON, Table, Index, UniqueConstraint
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -39,10 +39,35 @@ class Document(Base):
     filename = Column(String)
     firebase_url = Column(String)
     content_type = Column(String)
+    content_hash = Column(String, nullable=True)  # SHA-256 of the stored blob
     uploaded_by = Column(Integer, ForeignKey("users.id"), nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     
     user = relationship("User", back_populates="documents")
+    texts = relationship("DocumentText", back_populates="document")
+
+    # A user's documents, paged by id
+    __table_args__ = (
+        Index("ix_documents_uploaded_by_id", "uploaded_by", "id"),
+    )
+
+class DocumentText(Base):
+    __tablename__ = "document_texts"
+
+    id = Column(Integer, primary_key=True, index=True)
+    document_id = Column(Integer, ForeignKey("documents.id"), index=True)
+    content_hash = Column(String, index=True)
+    text = Column(Text)
+    blob_version = Column(String, nullable=True)  # ETag or generation of the blob the text came from
+    verified_at = Column(DateTime, nullable=True)  # last time blob_version was checked against storage
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    # One extraction per blob version, even when two first reads race
+    __table_args__ = (
+        UniqueConstraint("document_id", "content_hash", name="uq_document_texts_document_id_content_hash"),
+    )
+
+    document = relationship("Document", back_populates="texts")
 
 class PublicFeedback(Base):
     __tablename__ = "public_feedback"
@@ -85,8 +110,15 @@ class Report(Base):
     summary = Column(Text)
     status = Column(Enum(ReportStatus), default=ReportStatus.SUBMITTED)
     credibility_score = Column(Float)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Dashboard filters: newest reports by status or by category
+    __table_args__ = (
+        Index("ix_reports_status_created_at", "status", "created_at"),
+        Index("ix_reports_category_created_at", "category", "created_at"),
+        Index("ix_reports_priority_level_created_at", "priority_level", "created_at"),
+    )
     
     # Relationships
     updates = relationship("ReportUpdate", back_populates="report")
@@ -97,7 +129,7 @@ class ReportUpdate(Base):
     __tablename__ = "report_updates"
 
     id = Column(Integer, primary_key=True, index=True)
-    report_id = Column(Integer, ForeignKey("reports.id"))
+    report_id = Column(Integer, ForeignKey("reports.id"), index=True)
     status = Column(Enum(ReportStatus))
     notes = Column(Text)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -109,7 +141,7 @@ class ReportAttachment(Base):
     __tablename__ = "report_attachments"
 
     id = Column(Integer, primary_key=True, index=True)
-    report_id = Column(Integer, ForeignKey("reports.id"))
+    report_id = Column(Integer, ForeignKey("reports.id"), index=True)
     file_name = Column(String)
     file_type = Column(String)
     file_url = Column(String)
@@ -129,6 +161,7 @@ class Meeting(Base):
     transcript = Column(Text, nullable=True)
     summary = Column(Text, nullable=True)
     sentiment_score = Column(Float, nullable=True)
+    analysis_segments = Column(JSON, nullable=True)  # per-window analyses reused when the transcript grows
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
@@ -141,7 +174,7 @@ class ActionItem(Base):
     __tablename__ = "action_items"
 
     id = Column(Integer, primary_key=True, index=True)
-    meeting_id = Column(Integer, ForeignKey("meetings.id"))
+    meeting_id = Column(Integer, ForeignKey("meetings.id"), index=True)
     description = Column(Text)
     assigned_to = Column(Integer, ForeignKey("users.id"))
     due_date = Column(DateTime, nullable=True)
@@ -150,6 +183,12 @@ class ActionItem(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    # A user's action items paged by id, with or without a status filter
+    __table_args__ = (
+        Index("ix_action_items_assigned_to_status_id", "assigned_to", "status", "id"),
+        Index("ix_action_items_assigned_to_id", "assigned_to", "id"),
+    )
+
     # Relationships
     meeting = relationship("Meeting", back_populates="action_items")
     assigned_user = relationship("User", back_populates="action_items")
@@ -158,7 +197,7 @@ class MeetingTopic(Base):
     __tablename__ = "meeting_topics"
 
     id = Column(Integer, primary_key=True, index=True)
-    meeting_id = Column(Integer, ForeignKey("meetings.id"))
+    meeting_id = Column(Integer, ForeignKey("meetings.id"), index=True)
     topic = Column(String)
     key_points = Column(JSON)
     decisions_made = Column(JSON)
@@ -172,7 +211,7 @@ class MeetingParticipant(Base):
     __tablename__ = "meeting_participants"
 
     id = Column(Integer, primary_key=True, index=True)
-    meeting_id = Column(Integer, ForeignKey("meetings.id"))
+    meeting_id = Column(Integer, ForeignKey("meetings.id"), index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     name = Column(String)
     role = Column(String)
@@ -181,4 +220,25 @@ class MeetingParticipant(Base):
 
     # Relationships
     meeting = relationship("Meeting", back_populates="participants")
-    user = relationship("User", backref="meeting_participations")
\ No newline at end of file
+    user = relationship("User", backref="meeting_participations")
+
+class JobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+class Job(Base):
+    __tablename__ = "jobs"
+
+    id = Column(String, primary_key=True, index=True)  # UUID
+    kind = Column(String)  # "report" or "meeting"
+    status = Column(Enum(JobStatus), default=JobStatus.QUEUED, index=True)
+    payload = Column(JSON)
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    worker_id = Column(String, nullable=True)  # process running the job
+    lease_expires_at = Column(DateTime, nullable=True)  # renewed while the job runs
+    attempts = Column(Integer, default=0, server_default="0", nullable=False)  # times the job was claimed
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -0,0 +1,92 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy import Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
+from .config import settings
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Opaque cursor holding the sort key of the last row on a page."""
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+def decode_cursor(cursor: str, columns: Sequence) -> List[Any]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(values, list) or len(values) != len(columns):
+            raise ValueError("cursor does not match the sort key")
+        return [
+            datetime.fromisoformat(value) if column.type.python_type is datetime else value
+            for column, value in zip(columns, values)
+        ]
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def parse_fields(fields: Optional[str], schema: type[BaseModel]) -> Optional[List[str]]:
+    """Validate a comma-separated field projection against the response schema."""
+    if not fields:
+        return None
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in requested if field not in schema.model_fields]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    return requested
+
+def page_size(limit: Optional[int]) -> int:
+    return min(limit or settings.PAGE_SIZE_DEFAULT, settings.PAGE_SIZE_MAX)
+
+async def paginate(
+    db: AsyncSession,
+    query: Select,
+    order_by: Sequence,
+    schema: type[BaseModel],
+    cursor: Optional[str] = None,
+    limit: Optional[int] = None,
+    fields: Optional[str] = None
+):
+    """Return one keyset page of ``query``, newest first.
+
+    ``order_by`` is the sort key, ending in a unique column such as ``id``,
+    and should match an index so each page is a range scan no matter how
+    deep it is. Rows after ``cursor`` are fetched with one extra row to tell
+    whether another page exists. With ``fields``, only those columns are
+    loaded and returned.
+    """
+    size = page_size(limit)
+    projection = parse_fields(fields, schema)
+    model = query.column_descriptions[0]["entity"]
+
+    if cursor:
+        values = decode_cursor(cursor, order_by)
+        if len(order_by) == 1:
+            query = query.where(order_by[0] < values[0])
+        else:
+            query = query.where(tuple_(*order_by) < tuple_(*values))
+    if projection:
+        keys = {column.key for column in order_by}
+        query = query.options(load_only(*[
+            getattr(model, name) for name in sorted(set(projection) | keys)
+        ]))
+
+    result = await db.execute(query.order_by(*[column.desc() for column in order_by]).limit(size + 1))
+    rows = result.scalars().all()
+
+    next_cursor = None
+    if len(rows) > size:
+        rows = rows[:size]
+        next_cursor = encode_cursor([getattr(rows[-1], column.key) for column in order_by])
+
+    if projection:
+        # A partial item does not satisfy the full response schema, so the
+        # projected page is encoded here instead of by FastAPI
+        return JSONResponse(jsonable_encoder({
+            "items": [{name: getattr(row, name) for name in projection} for row in rows],
+            "next_cursor": next_cursor
+        }))
+    return {"items": rows, "next_cursor": next_cursor}
@@ -0,0 +1,36 @@
+from sqlalchemy import Select, select
+from sqlalchemy.orm import raiseload, selectinload
+from . import models
+
+# Loader options per read shape. Every relationship a response touches is
+# loaded up front and anything else raises, so a new lazy access fails
+# loudly instead of quietly adding a query per row.
+
+MEETING_DETAIL = (
+    selectinload(models.Meeting.topics),
+    selectinload(models.Meeting.action_items),
+    selectinload(models.Meeting.participants),
+    raiseload("*")
+)
+
+MEETING_ACTION_ITEMS = (
+    selectinload(models.Meeting.action_items),
+    raiseload("*")
+)
+
+REPORT_DETAIL = (
+    raiseload("*"),
+)
+
+ACTION_ITEM_DETAIL = (
+    raiseload("*"),
+)
+
+def meeting_by_id(meeting_id: int, options=MEETING_DETAIL) -> Select:
+    return select(models.Meeting).where(models.Meeting.id == meeting_id).options(*options)
+
+def report_by_public_id(report_id: str, options=REPORT_DETAIL) -> Select:
+    return select(models.Report).where(models.Report.report_id == report_id).options(*options)
+
+def action_items(options=ACTION_ITEM_DETAIL) -> Select:
+    return select(models.ActionItem).options(*options)
@@ -1,7 +1,13 @@
 from pydantic import BaseModel, EmailStr
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from .models import ReportStatus
+from typing import Optional, List, Dict, Any, Generic, TypeVar
+from .models import ReportStatus, JobStatus
+
+T = TypeVar("T")
+
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None  # pass back as ?cursor= for the next page
 
 class UserBase(BaseModel):
     email: EmailStr
@@ -63,6 +69,11 @@ class Feedback(BaseModel):
     class Config:
         from_attributes = True
 
+class FeedbackBatchResult(BaseModel):
+    created: int
+    elapsed_seconds: float
+    items_per_second: float
+
 class ReportBase(BaseModel):
     title: str
     description: str
@@ -103,6 +114,19 @@ class Report(BaseModel):
     class Config:
         from_attributes = True
 
+class ReportSummary(BaseModel):
+    id: int
+    report_id: Optional[str] = None
+    category: Optional[str] = None
+    severity_level: Optional[int] = None
+    priority_level: Optional[str] = None
+    summary: Optional[str] = None
+    status: ReportStatus
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
 class ReportAnalysis(BaseModel):
     main_category: str
     sub_categories: List[str]
@@ -173,6 +197,7 @@ class ActionItemUpdate(BaseModel):
 # Full models with relationships
 class ActionItem(ActionItemCreate):
     id: int
+    assigned_to: Optional[int] = None  # items found by meeting analysis start unassigned
     meeting_id: int
     created_at: datetime
     updated_at: datetime
@@ -205,6 +230,17 @@ class Meeting(MeetingBase):
     class Config:
         from_attributes = True
 
+class MeetingSummary(MeetingBase):
+    id: int
+    file_type: Optional[str] = None
+    summary: Optional[str] = None
+    sentiment_score: Optional[float] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
 # Analysis models
 class MeetingAnalysis(BaseModel):
     summary: str
@@ -217,6 +253,9 @@ class MeetingAnalysis(BaseModel):
 class MeetingMinutes(BaseModel):
     content: str
 
+class TranscriptExtension(BaseModel):
+    text: str
+
 class FileContent(BaseModel):
     content: str
 
@@ -224,4 +263,21 @@ class FileSummary(BaseModel):
     summary: str
 
 class FileTranslation(BaseModel):
-    translated_content: str
\ No newline at end of file
+    translated_content: str
+
+class JobAccepted(BaseModel):
+    job_id: str
+    status: JobStatus
+    status_url: str
+
+class Job(BaseModel):
+    id: str
+    kind: str
+    status: JobStatus
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,146 @@
+from functools import cached_property
+from ..agents.file_agent import FileAgent
+from ..agents.groq_analyzer import GroqAnalyzer
+from ..agents.meeting_analyzer import MeetingAnalyzer
+from ..agents.report_analyzer import ReportAnalyzer
+from ..agents.sentiment_analysis import create_sentiment_backend
+from ..agents.summarizer import MapReduceSummarizer
+from ..config import settings
+from .document_text import DocumentTextStore
+from .http import http_client
+from .llm import LLMClient
+from .llm_cache import create_llm_cache
+from .pdf import PDFExtractor
+from .storage import create_storage
+from .transcription import Transcriber, create_recognizer
+
+class ServiceContainer:
+    """Lazily built, process-wide agents and SDK clients.
+
+    Nothing is constructed at import time: each service is created on first
+    access and then reused, and the SDKs behind them are only imported when
+    their clients are built, so importing the app stays fast.
+    ``preload`` builds everything up front for workers that prefer a warm
+    first request.
+    """
+
+    @cached_property
+    def llm_client(self):
+        # Shared async LLM client used by every agent
+        return LLMClient(
+            groq_api_key=settings.GROQ_API_KEY,
+            gemini_api_key=settings.GEMINI_API_KEY,
+            max_connections=settings.LLM_MAX_CONNECTIONS,
+            timeout=settings.LLM_TIMEOUT_SECONDS,
+            cache=create_llm_cache(
+                backend=settings.LLM_CACHE_BACKEND,
+                path=settings.LLM_CACHE_PATH,
+                max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+                ttl_seconds=settings.LLM_CACHE_TTL_SECONDS
+            )
+        )
+
+    @cached_property
+    def sentiment_backend(self):
+        # Local sentiment scoring; the model, if any, loads once per process
+        return create_sentiment_backend(
+            settings.SENTIMENT_BACKEND,
+            model_name=settings.SENTIMENT_MODEL,
+            batch_size=settings.SENTIMENT_BATCH_SIZE,
+            label_map=settings.SENTIMENT_LABEL_MAP
+        )
+
+    @cached_property
+    def groq_analyzer(self):
+        return GroqAnalyzer(
+            self.llm_client,
+            batch_size=settings.FEEDBACK_BATCH_SIZE,
+            batch_max_chars=settings.FEEDBACK_BATCH_MAX_CHARS,
+            max_concurrency=settings.FEEDBACK_MAX_CONCURRENCY,
+            sentiment_backend=self.sentiment_backend
+        )
+
+    @cached_property
+    def storage(self):
+        # Object storage (Firebase, or the local filesystem for offline use)
+        return create_storage(
+            backend=settings.STORAGE_BACKEND,
+            chunk_size=settings.STORAGE_CHUNK_SIZE,
+            local_root=settings.STORAGE_LOCAL_ROOT,
+            local_base_url=settings.STORAGE_LOCAL_BASE_URL
+        )
+
+    @cached_property
+    def pdf_extractor(self):
+        # Shared PDF text extractor for documents and meeting uploads
+        return PDFExtractor(
+            max_workers=settings.PDF_MAX_WORKERS,
+            batch_size=settings.PDF_PAGE_BATCH_SIZE,
+            max_bytes=settings.PDF_MAX_BYTES
+        )
+
+    @cached_property
+    def file_agent(self):
+        return FileAgent(
+            self.llm_client,
+            summarizer=MapReduceSummarizer(
+                self.llm_client,
+                chunk_tokens=settings.SUMMARY_CHUNK_TOKENS,
+                max_concurrency=settings.SUMMARY_MAX_CONCURRENCY,
+                reduce_fan_in=settings.SUMMARY_REDUCE_FAN_IN
+            ),
+            pdf_extractor=self.pdf_extractor,
+            http_client=http_client
+        )
+
+    @cached_property
+    def document_text_store(self):
+        # Persistent store of text extracted from uploaded documents
+        return DocumentTextStore(
+            self.file_agent,
+            http_client=http_client,
+            check_interval_seconds=settings.DOCUMENT_BLOB_CHECK_SECONDS
+        )
+
+    @cached_property
+    def report_analyzer(self):
+        return ReportAnalyzer(self.llm_client)
+
+    @cached_property
+    def transcriber(self):
+        # Chunked, concurrent speech-to-text for meeting recordings
+        return Transcriber(
+            create_recognizer(settings.TRANSCRIPTION_BACKEND, settings.TRANSCRIPTION_LANGUAGE),
+            window_seconds=settings.TRANSCRIPTION_WINDOW_SECONDS,
+            silence_search_seconds=settings.TRANSCRIPTION_SILENCE_SEARCH_SECONDS,
+            max_workers=settings.TRANSCRIPTION_MAX_WORKERS
+        )
+
+    @cached_property
+    def meeting_analyzer(self):
+        # Shared by every meeting request; it holds no per-request state
+        return MeetingAnalyzer(
+            self.llm_client,
+            transcriber=self.transcriber,
+            window_tokens=settings.MEETING_WINDOW_TOKENS,
+            max_concurrency=settings.MEETING_ANALYSIS_MAX_CONCURRENCY
+        )
+
+    def preload(self):
+        """Build every service now instead of on first use."""
+        for name in ("llm_client", "sentiment_backend", "groq_analyzer", "storage",
+                     "pdf_extractor", "file_agent", "document_text_store",
+                     "report_analyzer", "transcriber", "meeting_analyzer"):
+            getattr(self, name)
+
+    async def aclose(self):
+        """Release the services that were actually created."""
+        if "llm_client" in self.__dict__:
+            await self.llm_client.aclose()
+        if "pdf_extractor" in self.__dict__:
+            self.pdf_extractor.shutdown()
+        if "transcriber" in self.__dict__:
+            self.transcriber.shutdown()
+
+# Shared instance, closed by the FastAPI lifespan
+services = ServiceContainer()
@@ -0,0 +1,150 @@
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+from datetime import datetime, timedelta
+from typing import BinaryIO, Optional
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from .. import models
+from ..agents.file_agent import FileAgent
+from ..database import insert_ignoring_conflicts
+from .http import HTTPClient
+
+# Response headers identifying a blob version, most specific first
+logger = logging.getLogger(__name__)
+
+VERSION_HEADERS = ("x-goog-generation", "ETag", "Last-Modified")
+SPOOL_CHUNK_SIZE = 1024 * 1024
+
+def spool_with_hash(source: BinaryIO) -> tuple[str, str]:
+    """Copy a file object to a temporary file in chunks; return its path and SHA-256."""
+    digest = hashlib.sha256()
+    with tempfile.NamedTemporaryFile(delete=False) as out:
+        for chunk in iter(lambda: source.read(SPOOL_CHUNK_SIZE), b""):
+            digest.update(chunk)
+            out.write(chunk)
+        return out.name, digest.hexdigest()
+
+class DocumentTextStore:
+    """Persistent cache of text extracted from uploaded documents.
+
+    Entries are keyed by document id and the SHA-256 of the blob they were
+    extracted from. Every ``check_interval_seconds`` a read compares the
+    blob's version (its generation or ETag, from a HEAD request) with the
+    one the text came from, and re-extracts if the blob was replaced; in
+    between, reads never touch storage.
+    """
+
+    def __init__(self, file_agent: FileAgent, http_client: HTTPClient, check_interval_seconds: int = 300):
+        self.file_agent = file_agent
+        self.http_client = http_client
+        self.check_interval = timedelta(seconds=check_interval_seconds)
+
+    async def _lookup(self, db: AsyncSession, document: models.Document):
+        if not document.content_hash:
+            return None
+        result = await db.execute(
+            select(models.DocumentText).where(
+                models.DocumentText.document_id == document.id,
+                models.DocumentText.content_hash == document.content_hash
+            )
+        )
+        return result.scalars().first()
+
+    async def blob_version(self, url: str) -> Optional[str]:
+        """Current version of a blob, or None if storage cannot tell us."""
+        try:
+            response = await self.http_client.request("HEAD", url)
+        except Exception as e:
+            logger.warning("Could not check blob version of %s: %s", url, e)
+            return None
+        if response.status != 200:
+            return None
+        for header in VERSION_HEADERS:
+            if response.headers.get(header):
+                return response.headers[header]
+        return None
+
+    async def store(
+        self,
+        db: AsyncSession,
+        document: models.Document,
+        content: bytes,
+        blob_version: Optional[str] = None
+    ) -> tuple[bytes | str, bool]:
+        """Extract text from raw blob bytes and persist it for the document."""
+        parsed, is_text = await self.file_agent.parse_file_content(content, document.content_type)
+        await self._save(db, document, hashlib.sha256(content).hexdigest(), parsed, is_text, blob_version)
+        return parsed, is_text
+
+    async def store_file(self, db: AsyncSession, document: models.Document, source: BinaryIO):
+        """Extract text from an uploaded file object and persist it for the document.
+
+        The file is copied to disk in chunks and extracted from there, so the
+        upload is never held in memory.
+        """
+        path, content_hash = await asyncio.to_thread(spool_with_hash, source)
+        try:
+            parsed, is_text = await self.file_agent.parse_file(path, document.content_type)
+        finally:
+            os.remove(path)
+        await self._save(db, document, content_hash, parsed, is_text)
+
+    async def _save(
+        self,
+        db: AsyncSession,
+        document: models.Document,
+        content_hash: str,
+        parsed,
+        is_text: bool,
+        blob_version: Optional[str] = None
+    ):
+        document.content_hash = content_hash
+        if is_text:
+            # Drop text extracted from any previous version of the blob
+            await db.execute(
+                delete(models.DocumentText).where(
+                    models.DocumentText.document_id == document.id,
+                    models.DocumentText.content_hash != content_hash
+                )
+            )
+            # A concurrent first read may have stored the same text already
+            await insert_ignoring_conflicts(db, models.DocumentText, {
+                "document_id": document.id,
+                "content_hash": content_hash,
+                "text": parsed,
+                "blob_version": blob_version,
+                "verified_at": datetime.utcnow(),
+                "created_at": datetime.utcnow()
+            }, ["document_id", "content_hash"])
+        await db.commit()
+
+    async def _is_current(self, db: AsyncSession, document: models.Document, cached: models.DocumentText) -> bool:
+        """Whether stored text still matches the blob, re-checking at most once per interval."""
+        now = datetime.utcnow()
+        if cached.verified_at and now - cached.verified_at < self.check_interval:
+            return True
+
+        version = await self.blob_version(document.firebase_url)
+        if version is not None and cached.blob_version is not None and version != cached.blob_version:
+            return False
+
+        # Same version, first check since upload, or storage could not say
+        await db.execute(
+            update(models.DocumentText)
+            .where(models.DocumentText.id == cached.id)
+            .values(verified_at=now, blob_version=version or cached.blob_version)
+        )
+        await db.commit()
+        return True
+
+    async def get_content(self, db: AsyncSession, document: models.Document) -> tuple[bytes | str, bool]:
+        """Return the document's text from the store, extracting it on a miss or a changed blob."""
+        cached = await self._lookup(db, document)
+        if cached is not None and await self._is_current(db, document, cached):
+            return cached.text, True
+
+        content = await self.file_agent.download_file(document.firebase_url)
+        return await self.store(db, document, content, blob_version=await self.blob_version(document.firebase_url))
@@ -1,11 +1,12 @@
+import asyncio
 import firebase_admin
 from firebase_admin import credentials, storage
 from fastapi import UploadFile, HTTPException, status
-import uuid
 from ..config import settings
+from .storage import make_object_path
 
 class FirebaseService:
-    def __init__(self):
+    def __init__(self, chunk_size: int = 8 * 1024 * 1024):
         # Initialize Firebase with your service account
         cred = credentials.Certificate(settings.FIREBASE_CREDENTIALS_PATH)
         if not firebase_admin._apps:
@@ -13,37 +14,30 @@ class FirebaseService:
                 'storageBucket': settings.FIREBASE_STORAGE_BUCKET
             })
         self.bucket = storage.bucket()
+        # Resumable upload chunk size; must be a multiple of 256 KiB
+        self.chunk_size = chunk_size
 
-    async def upload_file(self, file: UploadFile, user_id: int = None) -> str:
+    def _upload(self, path: str, file: UploadFile) -> str:
+        """Stream the upload to a blob in chunks; runs in a worker thread."""
+        blob = self.bucket.blob(path, chunk_size=self.chunk_size)
+        file.file.seek(0)
+        blob.upload_from_file(file.file, content_type=file.content_type)
+        
+        # Make the blob publicly accessible
+        blob.make_public()
+        
+        return blob.public_url
+
+    async def upload_file(self, file: UploadFile, folder: str = "documents") -> str:
         try:
-            # Create a unique filename
-            extension = file.filename.split(".")[-1]
-            filename = f"{uuid.uuid4()}.{extension}"
-            
-            # Add user_id to path if provided
-            path = f"documents/{filename}"
-            if user_id:
-                path = f"users/{user_id}/documents/{filename}"
-            
-            # Create a new blob and upload the file's contents
-            blob = self.bucket.blob(path)
-            
-            # Read the file content
-            content = await file.read()
+            # Create a unique filename under the requested folder
+            path = make_object_path(folder, file.filename)
             
-            # Upload to Firebase
-            blob.upload_from_string(
-                content,
-                content_type=file.content_type
-            )
-            
-            # Make the blob publicly accessible
-            blob.make_public()
-            
-            return blob.public_url
+            # Upload off the event loop without reading the whole file into memory
+            return await asyncio.to_thread(self._upload, path, file)
             
         except Exception as e:
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Error uploading to Firebase: {str(e)}"
-            ) 
\ No newline at end of file
+            )
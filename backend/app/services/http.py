@@ -0,0 +1,91 @@
+import asyncio
+import json
+from typing import TYPE_CHECKING, Any, Optional
+from multidict import CIMultiDictProxy
+from ..config import settings
+
+if TYPE_CHECKING:
+    import aiohttp
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+class HTTPResponse:
+    """Fully-read response returned by HTTPClient."""
+
+    def __init__(self, status: int, headers: CIMultiDictProxy, body: bytes):
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+class HTTPClient:
+    """App-lifetime pooled HTTP client for all outbound requests.
+
+    A single ``aiohttp.ClientSession`` keeps connections alive and caches DNS
+    across requests, with total and per-host connection limits. Idempotent
+    requests are retried with exponential backoff on connection errors,
+    timeouts and retryable status codes.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 20,
+        timeout: float = 30.0,
+        retries: int = 2,
+        backoff: float = 0.5
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    async def start(self):
+        import aiohttp
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    ttl_dns_cache=300
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+
+    async def stop(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def request(self, method: str, url: str, **kwargs) -> HTTPResponse:
+        import aiohttp
+
+        await self.start()
+        attempts = self.retries + 1 if method.upper() in ("GET", "HEAD") else 1
+
+        for attempt in range(attempts):
+            try:
+                async with self._session.request(method, url, **kwargs) as response:
+                    body = await response.read()
+                    if response.status not in RETRY_STATUSES or attempt == attempts - 1:
+                        return HTTPResponse(response.status, response.headers, body)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == attempts - 1:
+                    raise
+            await asyncio.sleep(self.backoff * (2 ** attempt))
+
+    async def get(self, url: str, **kwargs) -> HTTPResponse:
+        return await self.request("GET", url, **kwargs)
+
+# Shared instance, started and stopped by the FastAPI lifespan
+http_client = HTTPClient(
+    limit=settings.HTTP_POOL_LIMIT,
+    limit_per_host=settings.HTTP_POOL_LIMIT_PER_HOST,
+    timeout=settings.HTTP_TIMEOUT_SECONDS,
+    retries=settings.HTTP_RETRIES
+)
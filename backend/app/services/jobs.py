@@ -0,0 +1,267 @@
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+from sqlalchemy import or_, select, update
+from .. import models
+from ..database import AsyncSessionLocal
+
+JobHandler = Callable[[str, Dict[str, Any]], Awaitable[Optional[Dict[str, Any]]]]
+AbandonHandler = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+logger = logging.getLogger(__name__)
+
+class QueueFullError(Exception):
+    pass
+
+class JobQueue:
+    """In-process background job runner backed by the ``jobs`` table.
+
+    Jobs are persisted before they are queued, so anything still queued when
+    the process stops is picked up again. Several processes (e.g. uvicorn
+    workers) can share one table: a job is claimed with a conditional UPDATE,
+    so only one worker runs it, and the claim is a lease the runner keeps
+    renewing. A running job whose lease lapses, because its process died, is
+    queued again by whichever worker notices first. A job whose lease lapses
+    after ``max_attempts`` claims is failed instead, so a job that keeps
+    killing its worker is not run forever.
+    """
+
+    def __init__(
+        self,
+        worker_count: int = 4,
+        max_size: int = 100,
+        lease_seconds: float = 60.0,
+        max_attempts: int = 3
+    ):
+        self.worker_count = worker_count
+        self.max_size = max_size
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.handlers: Dict[str, JobHandler] = {}
+        self.abandon_handlers: Dict[str, AbandonHandler] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._queued: Set[str] = set()
+        self._workers: List[asyncio.Task] = []
+
+    def register(self, kind: str, handler: JobHandler, on_abandon: Optional[AbandonHandler] = None):
+        """Run ``handler`` for jobs of ``kind``.
+
+        ``on_abandon`` cleans up after a job that is given up on without its
+        handler finishing, i.e. after its last attempt's lease lapsed.
+        """
+        self.handlers[kind] = handler
+        if on_abandon is not None:
+            self.abandon_handlers[kind] = on_abandon
+
+    def is_full(self) -> bool:
+        return self._queue is None or self._queue.full()
+
+    async def submit(self, kind: str, payload: Dict[str, Any]) -> str:
+        """Persist a new job and queue it, raising QueueFullError when at capacity."""
+        if self.is_full():
+            raise QueueFullError("Job queue is full, try again later")
+
+        job_id = str(uuid.uuid4())
+        now = datetime.utcnow()
+        async with AsyncSessionLocal() as db:
+            db.add(models.Job(
+                id=job_id,
+                kind=kind,
+                status=models.JobStatus.QUEUED,
+                payload=payload,
+                created_at=now,
+                updated_at=now
+            ))
+            await db.commit()
+
+        if not self._enqueue(job_id):
+            # Another request took the last slot while this job was being saved
+            await self.update(job_id, status=models.JobStatus.FAILED, error="Job queue is full")
+            raise QueueFullError("Job queue is full, try again later")
+        return job_id
+
+    async def update(self, job_id: str, **fields):
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(models.Job)
+                .where(models.Job.id == job_id)
+                .values(updated_at=datetime.utcnow(), **fields)
+            )
+            await db.commit()
+
+    async def start(self):
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._workers = [
+            asyncio.create_task(self._worker()) for _ in range(self.worker_count)
+        ]
+        self._workers.append(asyncio.create_task(self._recover()))
+
+    async def stop(self):
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def _enqueue(self, job_id: str) -> bool:
+        if job_id in self._queued:
+            return True
+        try:
+            self._queue.put_nowait(job_id)
+        except asyncio.QueueFull:
+            return False
+        self._queued.add(job_id)
+        return True
+
+    async def _fail_exhausted_jobs(self):
+        """Fail jobs whose last allowed attempt's lease lapsed, and clean up after them."""
+        now = datetime.utcnow()
+        expired = (
+            models.Job.status == models.JobStatus.RUNNING,
+            or_(models.Job.lease_expires_at.is_(None), models.Job.lease_expires_at < now)
+        )
+        abandoned = []
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(models.Job.id, models.Job.kind, models.Job.payload)
+                .where(*expired, models.Job.attempts >= self.max_attempts)
+            )
+            for job in result.all():
+                failed = await db.execute(
+                    update(models.Job)
+                    .where(models.Job.id == job.id, *expired)
+                    .values(
+                        status=models.JobStatus.FAILED,
+                        error=f"Gave up after {self.max_attempts} attempts",
+                        worker_id=None,
+                        lease_expires_at=None,
+                        updated_at=now
+                    )
+                )
+                # Another worker may have failed it first
+                if failed.rowcount == 1:
+                    abandoned.append(job)
+            await db.commit()
+
+        for job in abandoned:
+            logger.warning("Job %s (%s) gave up after %d attempts", job.id, job.kind, self.max_attempts)
+            on_abandon = self.abandon_handlers.get(job.kind)
+            if on_abandon is None:
+                continue
+            try:
+                await on_abandon(job.id, job.payload)
+            except Exception:
+                logger.exception("Cleanup of abandoned job %s failed", job.id)
+
+    async def _pending_job_ids(self, queued_before: Optional[datetime] = None) -> List[str]:
+        """Release expired leases and return the ids of queued jobs, oldest first.
+
+        ``queued_before`` skips jobs queued since then, which the worker that
+        accepted them is about to run.
+        """
+        now = datetime.utcnow()
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(models.Job)
+                .where(
+                    models.Job.status == models.JobStatus.RUNNING,
+                    or_(models.Job.lease_expires_at.is_(None), models.Job.lease_expires_at < now)
+                )
+                .values(status=models.JobStatus.QUEUED, worker_id=None, lease_expires_at=None)
+            )
+            await db.commit()
+            query = select(models.Job.id).where(models.Job.status == models.JobStatus.QUEUED)
+            if queued_before is not None:
+                query = query.where(models.Job.updated_at < queued_before)
+            result = await db.execute(query.order_by(models.Job.created_at))
+            return list(result.scalars().all())
+
+    async def _recover(self):
+        """Queue leftover jobs at startup, then re-check once per lease period."""
+        queued_before = None
+        while True:
+            try:
+                await self._fail_exhausted_jobs()
+                for job_id in await self._pending_job_ids(queued_before):
+                    if not self._enqueue(job_id):
+                        break
+            except Exception:
+                logger.exception("Job recovery failed")
+            await asyncio.sleep(self.lease_seconds)
+            queued_before = datetime.utcnow() - timedelta(seconds=self.lease_seconds)
+
+    async def _worker(self):
+        while True:
+            job_id = await self._queue.get()
+            self._queued.discard(job_id)
+            try:
+                await self._run(job_id)
+            except Exception:
+                logger.exception("Job %s could not be run", job_id)
+            finally:
+                self._queue.task_done()
+
+    async def _claim(self, job_id: str) -> Optional[models.Job]:
+        """Atomically move a queued job to running under this worker's lease."""
+        now = datetime.utcnow()
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                update(models.Job)
+                .where(models.Job.id == job_id, models.Job.status == models.JobStatus.QUEUED)
+                .values(
+                    status=models.JobStatus.RUNNING,
+                    worker_id=self.worker_id,
+                    lease_expires_at=now + timedelta(seconds=self.lease_seconds),
+                    attempts=models.Job.attempts + 1,
+                    updated_at=now
+                )
+            )
+            await db.commit()
+            if result.rowcount != 1:
+                # Already claimed by another worker, finished, or gone
+                return None
+            return await db.get(models.Job, job_id)
+
+    async def _renew_lease(self, job_id: str):
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                async with AsyncSessionLocal() as db:
+                    await db.execute(
+                        update(models.Job)
+                        .where(models.Job.id == job_id, models.Job.worker_id == self.worker_id)
+                        .values(lease_expires_at=datetime.utcnow() + timedelta(seconds=self.lease_seconds))
+                    )
+                    await db.commit()
+            except Exception:
+                logger.exception("Could not renew lease on job %s", job_id)
+
+    async def _finish(self, job_id: str, **fields):
+        """Record a job's outcome, unless its lease was lost to another worker."""
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(models.Job)
+                .where(models.Job.id == job_id, models.Job.worker_id == self.worker_id)
+                .values(updated_at=datetime.utcnow(), lease_expires_at=None, **fields)
+            )
+            await db.commit()
+
+    async def _run(self, job_id: str):
+        job = await self._claim(job_id)
+        if job is None:
+            return
+        kind, payload = job.kind, job.payload
+
+        renewal = asyncio.create_task(self._renew_lease(job_id))
+        try:
+            result = await self.handlers[kind](job_id, payload)
+            await self._finish(job_id, status=models.JobStatus.COMPLETED, result=result)
+        except Exception as e:
+            logger.warning("Job %s (%s) failed: %s", job_id, kind, e)
+            await self._finish(job_id, status=models.JobStatus.FAILED, error=str(e))
+        finally:
+            renewal.cancel()
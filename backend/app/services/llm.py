@@ -0,0 +1,145 @@
+import json
+from typing import Any, Callable, Dict, List, Optional
+from .llm_cache import LLMCache
+
+DEFAULT_GROQ_MODEL = "mixtral-8x7b-32768"
+DEFAULT_GEMINI_MODEL = "gemini-pro"
+
+def parse_json_response(response: str) -> Any:
+    """Parse an LLM response as JSON, tolerating a surrounding code fence."""
+    content = response.strip()
+    if "```json" in content:
+        content = content.split("```json")[1].split("```")[0].strip()
+    elif content.startswith("```"):
+        content = content.split("```")[1].strip()
+    return json.loads(content)
+
+def is_json(response: str) -> bool:
+    """``validate`` callback accepting any response that parses as JSON."""
+    parse_json_response(response)
+    return True
+
+def has_json_fields(*fields: str) -> Callable[[str], bool]:
+    """``validate`` callback accepting a JSON object response with all of ``fields``."""
+    def validate(response: str) -> bool:
+        result = parse_json_response(response)
+        return isinstance(result, dict) and all(field in result for field in fields)
+    return validate
+
+class LLMClient:
+    """Shared, non-blocking Groq/Gemini client used by every agent.
+
+    All Groq traffic goes through a single pooled ``httpx.AsyncClient`` so
+    concurrent requests reuse keep-alive connections instead of opening a
+    new one per call, and the pool size caps in-flight LLM requests.
+    Responses are memoized in the optional ``LLMCache`` so repeated prompts
+    cost no tokens. A ``validate`` callback keeps responses the caller cannot
+    use (malformed JSON, missing fields) out of the cache, so the next call
+    asks the model again instead of replaying the bad answer.
+    """
+
+    def __init__(
+        self,
+        groq_api_key: str,
+        gemini_api_key: Optional[str] = None,
+        max_connections: int = 20,
+        timeout: float = 60.0,
+        cache: Optional[LLMCache] = None
+    ):
+        # The SDKs are slow to import, so load them only when a client is built
+        import httpx
+        from groq import AsyncGroq
+
+        self.cache = cache
+        self.http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            ),
+            timeout=timeout
+        )
+        self.groq = AsyncGroq(api_key=groq_api_key, http_client=self.http_client)
+        if gemini_api_key:
+            import google.generativeai as genai
+            genai.configure(api_key=gemini_api_key)
+            self.gemini_model = genai.GenerativeModel(DEFAULT_GEMINI_MODEL)
+        else:
+            self.gemini_model = None
+
+    async def chat(
+        self,
+        messages: List[Dict[str, str]],
+        model: str = DEFAULT_GROQ_MODEL,
+        temperature: float = 0.3,
+        max_tokens: int = 1000,
+        use_cache: bool = True,
+        response_format: Optional[Dict[str, str]] = None,
+        validate: Optional[Callable[[str], Any]] = None
+    ) -> str:
+        """Run a Groq chat completion and return the message content.
+
+        Pass ``response_format={"type": "json_object"}`` to force JSON output.
+        The content is only cached if ``validate`` accepts it.
+        """
+        options = {"response_format": response_format} if response_format else {}
+        key = None
+        if self.cache and use_cache:
+            key = LLMCache.make_key("groq", model, temperature, {"messages": messages, "max_tokens": max_tokens, **options})
+            cached = await self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        response = await self.groq.chat.completions.create(
+            messages=messages,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            **options
+        )
+        content = response.choices[0].message.content
+
+        if key and self._cacheable(content, validate):
+            await self.cache.set(key, content)
+        return content
+
+    async def generate(
+        self,
+        contents: Any,
+        use_cache: bool = True,
+        validate: Optional[Callable[[str], Any]] = None
+    ) -> str:
+        """Run a Gemini generation and return the response text.
+
+        The text is only cached if ``validate`` accepts it.
+        """
+        if self.gemini_model is None:
+            raise RuntimeError("Gemini API key is not configured")
+
+        key = None
+        if self.cache and use_cache:
+            key = LLMCache.make_key("gemini", DEFAULT_GEMINI_MODEL, None, contents)
+            cached = await self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        response = await self.gemini_model.generate_content_async(contents)
+        text = response.text
+
+        if key and self._cacheable(text, validate):
+            await self.cache.set(key, text)
+        return text
+
+    @staticmethod
+    def _cacheable(content: Optional[str], validate: Optional[Callable[[str], Any]]) -> bool:
+        """Whether a response may be cached: non-empty and accepted by ``validate``."""
+        if not content:
+            return False
+        if validate is None:
+            return True
+        try:
+            return bool(validate(content))
+        except Exception:
+            return False
+
+    async def aclose(self):
+        await self.http_client.aclose()
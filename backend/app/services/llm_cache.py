@@ -0,0 +1,149 @@
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+class MemoryCacheBackend:
+    """In-process LRU cache with per-entry TTL."""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 86400):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple[float, str]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.time():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str):
+        self._entries[key] = (time.time() + self.ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def size(self) -> int:
+        return len(self._entries)
+
+class SQLiteCacheBackend:
+    """SQLite-backed LRU cache with TTL, shared by every worker on the host."""
+
+    name = "sqlite"
+
+    def __init__(self, path: str, max_entries: int = 10000, ttl_seconds: float = 86400):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=5, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, last_access REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS ix_llm_cache_last_access ON llm_cache (last_access)")
+
+    def _get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock, self._conn as conn:
+            row = conn.execute(
+                "SELECT value, expires_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at < now:
+                conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                return None
+            conn.execute("UPDATE llm_cache SET last_access = ? WHERE key = ?", (now, key))
+            return value
+
+    def _set(self, key: str, value: str):
+        now = time.time()
+        with self._lock, self._conn as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at, last_access) VALUES (?, ?, ?, ?)",
+                (key, value, now + self.ttl_seconds, now)
+            )
+            conn.execute("DELETE FROM llm_cache WHERE expires_at < ?", (now,))
+            conn.execute(
+                "DELETE FROM llm_cache WHERE key IN ("
+                "SELECT key FROM llm_cache ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+
+    def _size(self) -> int:
+        with self._lock, self._conn as conn:
+            return conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+
+    async def get(self, key: str) -> Optional[str]:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: str):
+        await asyncio.to_thread(self._set, key, value)
+
+    async def size(self) -> int:
+        return await asyncio.to_thread(self._size)
+
+class LLMCache:
+    """Content-addressed cache of LLM responses with hit/miss counters."""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(provider: str, model: str, temperature: Optional[float], prompt: Any) -> str:
+        """Hash the provider, model, temperature and full rendered prompt into a cache key."""
+        payload = json.dumps(
+            {"provider": provider, "model": model, "temperature": temperature, "prompt": prompt},
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        value = await self.backend.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: str):
+        await self.backend.set(key, value)
+
+    async def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "backend": self.backend.name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+            "size": await self.backend.size()
+        }
+
+def create_llm_cache(backend: str, path: str, max_entries: int, ttl_seconds: float) -> Optional[LLMCache]:
+    """Build the configured cache, or return None when caching is disabled."""
+    if backend == "none":
+        return None
+    if backend == "memory":
+        return LLMCache(MemoryCacheBackend(max_entries=max_entries, ttl_seconds=ttl_seconds))
+    if backend == "sqlite":
+        return LLMCache(SQLiteCacheBackend(path, max_entries=max_entries, ttl_seconds=ttl_seconds))
+    raise ValueError(f"Unknown LLM cache backend: {backend}")
@@ -0,0 +1,97 @@
+import asyncio
+import io
+import math
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Union
+
+PdfSource = Union[bytes, str]
+
+def _open_reader(source: PdfSource):
+    """Open a PDF from raw bytes or a path on disk."""
+    from PyPDF2 import PdfReader
+
+    if isinstance(source, bytes):
+        return PdfReader(io.BytesIO(source))
+    return PdfReader(source)
+
+def iter_pdf_pages(source: PdfSource, start: int = 0, end: Optional[int] = None) -> Iterator[str]:
+    """Yield the text of each page in [start, end) without building the whole document."""
+    reader = _open_reader(source)
+    pages = reader.pages
+    for index in range(start, len(pages) if end is None else min(end, len(pages))):
+        yield pages[index].extract_text() or ""
+
+def _extract_page_batch(source: PdfSource, start: int, end: int) -> List[str]:
+    """Process-pool entry point: extract one batch of pages."""
+    return list(iter_pdf_pages(source, start, end))
+
+def _page_count(source: PdfSource) -> int:
+    return len(_open_reader(source).pages)
+
+def _spool_to_file(data: bytes) -> str:
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
+        f.write(data)
+        return f.name
+
+class PDFExtractor:
+    """Extract text from PDFs without blocking the event loop.
+
+    Small documents are read page by page in a worker thread; large ones are
+    split into one page range per worker and extracted in a process pool.
+    Pool workers are given a file path, never the PDF bytes, so a large
+    upload is not copied into every worker; bytes are spooled to a
+    temporary file first. Workers start from a fork server (or spawn) rather
+    than forking the threaded server process.
+    """
+
+    def __init__(self, max_workers: int = 2, batch_size: int = 25, max_bytes: int = 100 * 1024 * 1024):
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.max_bytes = max_bytes
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context(method)
+            )
+        return self._executor
+
+    def _check_size(self, source: PdfSource):
+        size = len(source) if isinstance(source, bytes) else os.path.getsize(source)
+        if size > self.max_bytes:
+            raise ValueError(f"PDF is too large to extract ({size} bytes, limit {self.max_bytes})")
+
+    async def extract_text(self, source: PdfSource) -> str:
+        """Return the text of every page, newline separated."""
+        self._check_size(source)
+        page_count = await asyncio.to_thread(_page_count, source)
+
+        if page_count <= self.batch_size:
+            pages = await asyncio.to_thread(_extract_page_batch, source, 0, page_count)
+            return "\n".join(pages)
+
+        path = await asyncio.to_thread(_spool_to_file, source) if isinstance(source, bytes) else source
+        try:
+            # One contiguous range per worker, since every batch re-parses the document
+            batch_size = max(self.batch_size, math.ceil(page_count / self.max_workers))
+            loop = asyncio.get_running_loop()
+            executor = self._get_executor()
+            batches = await asyncio.gather(*[
+                loop.run_in_executor(executor, _extract_page_batch, path, start, start + batch_size)
+                for start in range(0, page_count, batch_size)
+            ])
+        finally:
+            if path is not source:
+                os.remove(path)
+        return "\n".join(page for batch in batches for page in batch)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,46 @@
+import asyncio
+import os
+import shutil
+import uuid
+from fastapi import UploadFile, HTTPException, status
+
+def make_object_path(folder: str, filename: str) -> str:
+    """Build a unique object path that keeps the original file extension."""
+    extension = filename.split(".")[-1]
+    return f"{folder.strip('/')}/{uuid.uuid4()}.{extension}"
+
+class LocalStorage:
+    """Filesystem storage backend for offline development and tests."""
+
+    def __init__(self, root: str, base_url: str, chunk_size: int = 1024 * 1024):
+        self.root = root
+        self.base_url = base_url.rstrip("/")
+        self.chunk_size = chunk_size
+
+    def _upload(self, path: str, file: UploadFile) -> str:
+        """Copy the upload to disk in fixed-size chunks; runs in a worker thread."""
+        destination = os.path.join(self.root, path)
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        file.file.seek(0)
+        with open(destination, "wb") as out:
+            shutil.copyfileobj(file.file, out, self.chunk_size)
+        return f"{self.base_url}/{path}"
+
+    async def upload_file(self, file: UploadFile, folder: str = "documents") -> str:
+        try:
+            path = make_object_path(folder, file.filename)
+            return await asyncio.to_thread(self._upload, path, file)
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Error uploading to local storage: {str(e)}"
+            )
+
+def create_storage(backend: str, chunk_size: int, local_root: str, local_base_url: str):
+    """Build the configured storage backend."""
+    if backend == "firebase":
+        from .firebase import FirebaseService
+        return FirebaseService(chunk_size=chunk_size)
+    if backend == "local":
+        return LocalStorage(local_root, local_base_url, chunk_size=chunk_size)
+    raise ValueError(f"Unknown storage backend: {backend}")
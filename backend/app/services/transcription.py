@@ -0,0 +1,252 @@
+import asyncio
+import logging
+import math
+import sys
+import threading
+import wave
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_WIDTH = 2  # 16-bit PCM throughout
+FFMPEG_SAMPLE_RATE = 16000
+SILENCE_FRAME_SECONDS = 0.05
+
+class GoogleSpeechRecognizer:
+    """Transcribe PCM with the Google Web Speech API via speech_recognition."""
+
+    name = "google"
+
+    def __init__(self, language: str = "en-US"):
+        self.language = language
+        self._local = threading.local()
+
+    def _recognizer(self):
+        # One recognizer per worker thread; they are not safe to share
+        recognizer = getattr(self._local, "recognizer", None)
+        if recognizer is None:
+            import speech_recognition as sr
+            recognizer = self._local.recognizer = sr.Recognizer()
+        return recognizer
+
+    def recognize(self, pcm: bytes, sample_rate: int, sample_width: int) -> str:
+        import speech_recognition as sr
+
+        try:
+            return self._recognizer().recognize_google(
+                sr.AudioData(pcm, sample_rate, sample_width),
+                language=self.language
+            )
+        except sr.UnknownValueError:
+            # No intelligible speech in this segment
+            return ""
+
+class OfflineStubRecognizer:
+    """Network-free recognizer for tests and offline development.
+
+    Returns a placeholder describing each segment that contains sound, and
+    nothing for silent segments.
+    """
+
+    name = "offline"
+
+    def __init__(self, silence_threshold: int = 200):
+        self.silence_threshold = silence_threshold
+
+    def recognize(self, pcm: bytes, sample_rate: int, sample_width: int) -> str:
+        if rms(pcm) < self.silence_threshold:
+            return ""
+        return f"<{len(pcm) / (sample_rate * sample_width):.1f}s of speech>"
+
+def create_recognizer(backend: str = "google", language: str = "en-US"):
+    """Build the configured speech recognition backend."""
+    if backend == "google":
+        return GoogleSpeechRecognizer(language=language)
+    if backend == "offline":
+        return OfflineStubRecognizer()
+    raise ValueError(f"Unknown transcription backend: {backend}")
+
+def _samples(pcm: bytes) -> array:
+    samples = array("h", pcm[:len(pcm) - len(pcm) % SAMPLE_WIDTH])
+    if sys.byteorder == "big":
+        samples.byteswap()
+    return samples
+
+def rms(pcm: bytes) -> float:
+    """Root mean square amplitude of 16-bit little-endian PCM."""
+    samples = _samples(pcm)
+    if not samples:
+        return 0.0
+    return math.sqrt(sum(sample * sample for sample in samples) / len(samples))
+
+def format_timestamp(seconds: float) -> str:
+    seconds = int(seconds)
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+def format_transcript(segments: List[Dict[str, Any]]) -> str:
+    """Stitch segments into one transcript with a timestamp per segment."""
+    return "\n".join(
+        f"[{format_timestamp(segment['start'])}] {segment['text']}"
+        for segment in segments if segment["text"]
+    )
+
+class _WaveReader:
+    """Read 16-bit mono WAV frames straight from disk."""
+
+    def __init__(self, wav: wave.Wave_read):
+        self._wav = wav
+        self.sample_rate = wav.getframerate()
+
+    async def read(self, size: int) -> bytes:
+        return await asyncio.to_thread(self._wav.readframes, size // SAMPLE_WIDTH)
+
+    async def close(self):
+        self._wav.close()
+
+class _FFmpegReader:
+    """Decode any format ffmpeg understands to 16 kHz mono PCM on a pipe."""
+
+    sample_rate = FFMPEG_SAMPLE_RATE
+
+    def __init__(self, process: asyncio.subprocess.Process):
+        self._process = process
+
+    async def read(self, size: int) -> bytes:
+        try:
+            return await self._process.stdout.readexactly(size)
+        except asyncio.IncompleteReadError as e:
+            return e.partial
+
+    async def close(self):
+        if self._process.returncode is None:
+            self._process.kill()
+        await self._process.wait()
+
+async def open_audio(path: str, file_format: str):
+    """Open an audio file as a stream of 16-bit mono PCM."""
+    if file_format.lower() == "wav":
+        wav = await asyncio.to_thread(wave.open, path, "rb")
+        if wav.getnchannels() == 1 and wav.getsampwidth() == SAMPLE_WIDTH:
+            return _WaveReader(wav)
+        wav.close()
+
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-nostdin", "-loglevel", "error",
+            "-i", path,
+            "-f", "s16le", "-ac", "1", "-ar", str(FFMPEG_SAMPLE_RATE), "-",
+            stdout=asyncio.subprocess.PIPE
+        )
+    except FileNotFoundError:
+        raise RuntimeError(f"ffmpeg is required to decode {file_format} audio")
+    return _FFmpegReader(process)
+
+class Transcriber:
+    """Transcribe long recordings in bounded memory.
+
+    Audio is streamed from disk and cut into windows of about
+    ``window_seconds``, ending each at the quietest point of its last
+    ``silence_search_seconds`` so words are not split. Windows are
+    recognized concurrently in a thread pool; a new window is only read once
+    a worker is free, so at most ``max_workers + 1`` windows are in memory.
+    """
+
+    def __init__(
+        self,
+        recognizer,
+        window_seconds: float = 30.0,
+        silence_search_seconds: float = 3.0,
+        max_workers: int = 4
+    ):
+        self.recognizer = recognizer
+        self.window_seconds = window_seconds
+        self.silence_search_seconds = silence_search_seconds
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="transcribe"
+            )
+        return self._executor
+
+    def _find_cut(self, pcm: bytes, bytes_per_second: int) -> int:
+        """Byte offset of the quietest frame near the end of a full window."""
+        frame = int(SILENCE_FRAME_SECONDS * bytes_per_second) // SAMPLE_WIDTH * SAMPLE_WIDTH
+        search_start = max(len(pcm) - int(self.silence_search_seconds * bytes_per_second), frame)
+        search_start -= search_start % SAMPLE_WIDTH
+        if frame <= 0 or search_start >= len(pcm):
+            return len(pcm)
+
+        quietest, quietest_rms = len(pcm), None
+        for offset in range(search_start, len(pcm) - frame + 1, frame):
+            level = rms(pcm[offset:offset + frame])
+            if quietest_rms is None or level <= quietest_rms:
+                quietest, quietest_rms = offset, level
+        return quietest
+
+    async def _windows(self, reader) -> AsyncIterator[Tuple[float, bytes]]:
+        """Yield (start_seconds, pcm) windows until the stream is exhausted."""
+        bytes_per_second = reader.sample_rate * SAMPLE_WIDTH
+        window = max(int(self.window_seconds * bytes_per_second) // SAMPLE_WIDTH * SAMPLE_WIDTH, SAMPLE_WIDTH)
+        position = 0
+        buffer = b""
+
+        while True:
+            data = await reader.read(window - len(buffer))
+            buffer += data
+            at_end = len(buffer) < window
+            if not buffer:
+                return
+            cut = len(buffer) if at_end else self._find_cut(buffer, bytes_per_second)
+            yield position / bytes_per_second, buffer[:cut]
+            position += cut
+            buffer = buffer[cut:]
+            if at_end:
+                return
+
+    async def _recognize(
+        self,
+        start: float,
+        pcm: bytes,
+        sample_rate: int,
+        slots: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        end = start + len(pcm) / (sample_rate * SAMPLE_WIDTH)
+        try:
+            loop = asyncio.get_running_loop()
+            text = await loop.run_in_executor(
+                self._get_executor(), self.recognizer.recognize, pcm, sample_rate, SAMPLE_WIDTH
+            )
+        except Exception as e:
+            logger.warning("Transcription error for segment %s: %s", format_timestamp(start), e)
+            text = ""
+        finally:
+            slots.release()
+        return {"start": start, "end": end, "text": text.strip()}
+
+    async def transcribe(self, path: str, file_format: str) -> List[Dict[str, Any]]:
+        """Transcribe an audio file into timestamped segments, in order."""
+        reader = await open_audio(path, file_format)
+        slots = asyncio.Semaphore(self.max_workers)
+        tasks = []
+        try:
+            async for start, pcm in self._windows(reader):
+                await slots.acquire()
+                tasks.append(asyncio.create_task(
+                    self._recognize(start, pcm, reader.sample_rate, slots)
+                ))
+            return list(await asyncio.gather(*tasks))
+        finally:
+            for task in tasks:
+                task.cancel()
+            await reader.close()
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -0,0 +1,124 @@
+"""Per-call latency of outbound HTTP: a new session per call versus HTTPClient.
+
+A local stub server answers over plain HTTP and over TLS with a self-signed
+certificate. A new ``aiohttp.ClientSession`` per call, as FileAgent and the
+Google login used to do, pays for a TCP connection and, over TLS, a
+handshake on every call; the shared pooled client reuses its connections.
+
+    python -m benchmarks.bench_http [--calls 300]
+"""
+import argparse
+import asyncio
+import datetime
+import ssl
+import time
+from .common import BENCH_DIR, configure, percentile, print_table
+
+STUB_PORTS = {"http": 8772, "https": 8773}
+BODY = b"x" * 4096
+
+def make_certificate() -> tuple:
+    """Write a self-signed certificate for 127.0.0.1 and return (cert path, key path)."""
+    import ipaddress
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "127.0.0.1")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now)
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]), critical=False)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path, key_path = f"{BENCH_DIR}/stub.crt", f"{BENCH_DIR}/stub.key"
+    with open(cert_path, "wb") as f:
+        f.write(certificate.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, "wb") as f:
+        f.write(key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption()
+        ))
+    return cert_path, key_path
+
+async def start_stub_server(server_ssl: ssl.SSLContext):
+    from aiohttp import web
+
+    async def document(request):
+        return web.Response(body=BODY)
+
+    app = web.Application()
+    app.router.add_get("/document", document)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", STUB_PORTS["http"]).start()
+    await web.TCPSite(runner, "127.0.0.1", STUB_PORTS["https"], ssl_context=server_ssl).start()
+    return runner
+
+async def time_calls(call, calls: int) -> list:
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        await call()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+async def run(calls: int):
+    import aiohttp
+    from app.services.http import HTTPClient
+
+    cert_path, key_path = make_certificate()
+    server_ssl = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    server_ssl.load_cert_chain(cert_path, key_path)
+    client_ssl = ssl.create_default_context(cafile=cert_path)
+    runner = await start_stub_server(server_ssl)
+
+    client = HTTPClient()
+    await client.start()
+    rows = []
+    for scheme, port in STUB_PORTS.items():
+        url = f"{scheme}://127.0.0.1:{port}/document"
+        options = {"ssl": client_ssl} if scheme == "https" else {}
+
+        async def new_session():
+            async with aiohttp.ClientSession() as session:
+                async with session.get(url, **options) as response:
+                    await response.read()
+
+        async def pooled():
+            await client.get(url, **options)
+
+        for label, call in (("new session per call", new_session), ("HTTPClient", pooled)):
+            await call()
+            latencies = await time_calls(call, calls)
+            rows.append({
+                "scheme": scheme,
+                "client": label,
+                "mean ms": round(sum(latencies) / len(latencies) * 1000, 2),
+                "p50 ms": round(percentile(latencies, 50) * 1000, 2),
+                "p99 ms": round(percentile(latencies, 99) * 1000, 2),
+            })
+    await client.stop()
+    await runner.cleanup()
+    print(f"{calls} sequential GETs of a {len(BODY)} byte body per row")
+    print_table(["scheme", "client", "mean ms", "p50 ms", "p99 ms"], rows)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=300, help="calls per client and scheme")
+    args = parser.parse_args()
+
+    configure()
+    asyncio.run(run(args.calls))
+
+if __name__ == "__main__":
+    main()
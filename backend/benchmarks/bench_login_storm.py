@@ -0,0 +1,105 @@
+"""Latency of unrelated endpoints during a login storm.
+
+Serves the app with uvicorn in a separate process and probes
+``GET /reports/{report_id}`` and ``GET /me`` one request at a time, first
+while idle and then while many clients log in over and over. bcrypt runs on
+its own bounded pool, so the probes' p99 should barely move; when hashing
+ran inline, every login held the worker for the full bcrypt cost.
+
+    python -m benchmarks.bench_login_storm [--logins 50] [--samples 200] [--hash-workers 2] [--rounds 12]
+"""
+import argparse
+import asyncio
+import random
+import time
+from .bench_report_reads import seed_reports
+from .common import configure, migrate, percentile, print_table, start_server, wait_until_ready
+
+SERVER_PORT = 8775
+EMAIL, PASSWORD = "storm@example.org", "correct horse battery staple"
+
+async def probe(session, token: str, report_ids: list, samples: int) -> dict:
+    """Sequential latencies of each probed endpoint."""
+    latencies = {"GET /reports/{report_id}": [], "GET /me": []}
+    headers = {"Authorization": f"Bearer {token}"}
+    for number in range(samples):
+        for name, path, options in (
+            ("GET /reports/{report_id}", f"/reports/{random.choice(report_ids)}", {}),
+            ("GET /me", "/me", {"headers": headers}),
+        ):
+            start = time.perf_counter()
+            async with session.get(path, **options) as response:
+                await response.read()
+                response.raise_for_status()
+            latencies[name].append(time.perf_counter() - start)
+    return latencies
+
+async def log_in(session) -> str:
+    async with session.post("/token", data={"username": EMAIL, "password": PASSWORD}) as response:
+        response.raise_for_status()
+        return (await response.json())["access_token"]
+
+async def run(logins: int, samples: int, report_ids: list):
+    import aiohttp
+
+    async with aiohttp.ClientSession(f"http://127.0.0.1:{SERVER_PORT}") as session:
+        await wait_until_ready(session, "/reports/missing")
+        async with session.post("/register", json={"email": EMAIL, "password": PASSWORD}) as response:
+            response.raise_for_status()
+        token = await log_in(session)
+
+        idle = await probe(session, token, report_ids, samples)
+
+        stopping = asyncio.Event()
+        login_latencies = []
+
+        async def keep_logging_in():
+            while not stopping.is_set():
+                start = time.perf_counter()
+                await log_in(session)
+                login_latencies.append(time.perf_counter() - start)
+
+        storm = [asyncio.create_task(keep_logging_in()) for _ in range(logins)]
+        # Let the storm build up before probing
+        await asyncio.sleep(1.0)
+        start = time.perf_counter()
+        during = await probe(session, token, report_ids, samples)
+        elapsed = time.perf_counter() - start
+        stopping.set()
+        await asyncio.gather(*storm)
+
+    rows = [
+        {
+            "endpoint": name,
+            "idle p50 ms": round(percentile(idle[name], 50) * 1000, 1),
+            "idle p99 ms": round(percentile(idle[name], 99) * 1000, 1),
+            "storm p50 ms": round(percentile(during[name], 50) * 1000, 1),
+            "storm p99 ms": round(percentile(during[name], 99) * 1000, 1),
+        }
+        for name in idle
+    ]
+    print(f"{logins} clients logging in continuously, {samples} probes per endpoint")
+    print_table(["endpoint", "idle p50 ms", "idle p99 ms", "storm p50 ms", "storm p99 ms"], rows)
+    print(f"Logins during the storm: {len(login_latencies)} ({len(login_latencies) / elapsed:.1f}/s), "
+          f"p50 {percentile(login_latencies, 50) * 1000:.0f} ms, p99 {percentile(login_latencies, 99) * 1000:.0f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=50, help="clients logging in concurrently")
+    parser.add_argument("--samples", type=int, default=200, help="probe requests per endpoint and phase")
+    parser.add_argument("--hash-workers", type=int, default=2, help="PASSWORD_HASH_WORKERS")
+    parser.add_argument("--rounds", type=int, default=12, help="BCRYPT_ROUNDS")
+    args = parser.parse_args()
+
+    configure(PASSWORD_HASH_WORKERS=str(args.hash_workers), BCRYPT_ROUNDS=str(args.rounds))
+    migrate()
+    report_ids = seed_reports(1000)
+    server = start_server(SERVER_PORT)
+    try:
+        asyncio.run(run(args.logins, args.samples, report_ids))
+    finally:
+        server.terminate()
+        server.wait()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Persisting a meeting analysis with 500+ action items.
+
+Compares one ``db.add`` per topic, action item and participant, as
+``analyze_meeting`` used to, with the bulk ``insert_meeting_analysis_rows``,
+both in a single transaction per meeting. Also reports the SQL statements
+each path sends.
+
+    python -m benchmarks.bench_meeting_inserts [--action-items 500 1000 5000] [--meetings 5]
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime
+from .common import configure, migrate, print_table
+
+TOPICS = 50
+PARTICIPANTS = 50
+
+def make_analysis(action_items: int) -> dict:
+    return {
+        "key_topics": [
+            {"topic": f"Topic {number}", "key_points": ["budget", "schedule"], "decisions_made": ["approved"]}
+            for number in range(TOPICS)
+        ],
+        "action_items": [{"task": f"Follow up on item {number}", "priority": "high"} for number in range(action_items)],
+        "participants": [{"name": f"Member {number}", "role": "council"} for number in range(PARTICIPANTS)],
+    }
+
+def add_rows_one_by_one(db, meeting_id: int, analysis: dict):
+    """The per-row persistence this benchmark replaces."""
+    from app import models
+
+    for topic in analysis["key_topics"]:
+        db.add(models.MeetingTopic(
+            meeting_id=meeting_id,
+            topic=topic["topic"],
+            key_points=topic["key_points"],
+            decisions_made=topic.get("decisions_made", []),
+            importance_level=topic.get("importance_level", "medium"),
+            created_at=datetime.utcnow()
+        ))
+    for item in analysis["action_items"]:
+        db.add(models.ActionItem(
+            meeting_id=meeting_id,
+            description=item["task"],
+            priority=item.get("priority", "medium"),
+            status="pending",
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow()
+        ))
+    for participant in analysis["participants"]:
+        db.add(models.MeetingParticipant(
+            meeting_id=meeting_id,
+            name=participant["name"],
+            role=participant.get("role", "participant"),
+            contributions=participant.get("contributions", []),
+            created_at=datetime.utcnow()
+        ))
+
+async def persist(write_rows, analysis: dict, meetings: int) -> tuple:
+    """Store ``meetings`` copies of ``analysis``; return (ms per meeting, statements per meeting)."""
+    from app import database, models
+
+    statements = 0
+    start = time.perf_counter()
+    for _ in range(meetings):
+        with database.count_statements() as counter:
+            async with database.AsyncSessionLocal() as db:
+                meeting = models.Meeting(title="Council meeting", created_at=datetime.utcnow())
+                db.add(meeting)
+                await db.flush()
+                await write_rows(db, meeting.id, analysis)
+                await db.commit()
+        statements += counter.count
+    return (time.perf_counter() - start) / meetings * 1000, statements // meetings
+
+async def run(action_item_counts, meetings: int):
+    from app.main import insert_meeting_analysis_rows
+
+    async def one_by_one(db, meeting_id, analysis):
+        add_rows_one_by_one(db, meeting_id, analysis)
+
+    rows = []
+    for action_items in action_item_counts:
+        analysis = make_analysis(action_items)
+        old_ms, old_statements = await persist(one_by_one, analysis, meetings)
+        new_ms, new_statements = await persist(insert_meeting_analysis_rows, analysis, meetings)
+        rows.append({
+            "action items": action_items,
+            "db.add ms": round(old_ms, 1),
+            "db.add stmts": old_statements,
+            "bulk ms": round(new_ms, 1),
+            "bulk stmts": new_statements,
+            "speedup": f"{old_ms / new_ms:.1f}x",
+        })
+    print(f"{TOPICS} topics and {PARTICIPANTS} participants per meeting, mean of {meetings} meetings")
+    print_table(["action items", "db.add ms", "db.add stmts", "bulk ms", "bulk stmts", "speedup"], rows)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--action-items", type=int, nargs="+", default=[500, 1000, 5000], help="action items per meeting")
+    parser.add_argument("--meetings", type=int, default=5, help="meetings stored per size")
+    parser.add_argument("--database-url", help="database to run against (default: a temporary SQLite file)")
+    args = parser.parse_args()
+
+    configure(**({"DATABASE_URL": args.database_url} if args.database_url else {}))
+    migrate()
+    asyncio.run(run(args.action_items, args.meetings))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""PDF text extraction on 10, 100 and 1000 page documents.
+
+Compares the old approach, ``text += page.extract_text()`` on the event
+loop, with ``PDFExtractor``. Besides wall time it reports the longest the
+event loop went without running a 10 ms ticker task, i.e. how long every
+other request on the worker would have stalled.
+
+    python -m benchmarks.bench_pdf [--pages 10 100 1000] [--workers 2]
+"""
+import argparse
+import asyncio
+import time
+from .common import configure, print_table
+
+TICK_SECONDS = 0.01
+LINES_PER_PAGE = 40
+
+def make_pdf(pages: int) -> bytes:
+    """A minimal uncompressed PDF with a page of text on each page."""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        ("<< /Type /Pages /Kids [%s] /Count %d >>" % (
+            " ".join(f"{4 + 2 * index} 0 R" for index in range(pages)), pages
+        )).encode(),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for index in range(pages):
+        lines = " ".join(
+            f"(Page {index}, line {line}: the council discussed the budget and assigned follow-up items.) Tj 0 -16 Td"
+            for line in range(LINES_PER_PAGE)
+        )
+        stream = f"BT /F1 10 Tf 72 720 Td {lines} ET".encode()
+        objects.append((
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {5 + 2 * index} 0 R >>"
+        ).encode())
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+def extract_inline(data: bytes) -> str:
+    """The extraction this benchmark replaces."""
+    import io
+    from PyPDF2 import PdfReader
+
+    text = ""
+    for page in PdfReader(io.BytesIO(data)).pages:
+        text += page.extract_text()
+    return text
+
+async def measure(extract) -> tuple:
+    """Run ``extract`` and return (seconds, longest event loop stall in seconds)."""
+    stall = 0.0
+    running = True
+
+    async def ticker():
+        nonlocal stall
+        last = time.perf_counter()
+        while running:
+            await asyncio.sleep(TICK_SECONDS)
+            now = time.perf_counter()
+            stall = max(stall, now - last - TICK_SECONDS)
+            last = now
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await extract()
+    elapsed = time.perf_counter() - start
+    running = False
+    await task
+    return elapsed, stall
+
+async def run(page_counts, workers: int, batch_size: int):
+    from app.services.pdf import PDFExtractor
+
+    extractor = PDFExtractor(max_workers=workers, batch_size=batch_size)
+    # Start the pool before timing, as a long-running server would have
+    await extractor.extract_text(make_pdf(batch_size * workers + 1))
+
+    rows = []
+    for pages in page_counts:
+        data = make_pdf(pages)
+
+        async def inline():
+            extract_inline(data)
+
+        async def pooled():
+            await extractor.extract_text(data)
+
+        inline_seconds, inline_stall = await measure(inline)
+        pooled_seconds, pooled_stall = await measure(pooled)
+        rows.append({
+            "pages": pages,
+            "KiB": len(data) // 1024,
+            "inline s": round(inline_seconds, 2),
+            "inline stall ms": round(inline_stall * 1000),
+            "extractor s": round(pooled_seconds, 2),
+            "extractor stall ms": round(pooled_stall * 1000),
+        })
+    extractor.shutdown()
+    print(f"PDFExtractor with {workers} workers, {batch_size} pages per batch")
+    print_table(["pages", "KiB", "inline s", "inline stall ms", "extractor s", "extractor stall ms"], rows)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[10, 100, 1000], help="page counts to test")
+    parser.add_argument("--workers", type=int, default=2, help="extractor process pool size")
+    parser.add_argument("--batch-size", type=int, default=25, help="pages per extraction batch")
+    args = parser.parse_args()
+
+    configure()
+    asyncio.run(run(args.pages, args.workers, args.batch_size))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""Query plans and timings of the hot filters on 1M action items and 100k reports.
+
+Seeds the dataset, then runs each hot query the way its endpoint builds it:
+first with the indexes from the migrations, then again after dropping every
+non-unique index on the queried tables. Prints both timings and the plan
+with the indexes in place.
+
+    python -m benchmarks.bench_query_plans [--scale 1.0] [--repeat 20] [--database-url URL]
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from .common import configure, migrate, print_table
+
+ACTION_ITEMS = 1_000_000
+REPORTS = 100_000
+USERS = 2_000
+MEETINGS = 20_000
+DOCUMENTS = 100_000
+CATEGORIES = ("bribery", "fraud", "procurement", "nepotism", "embezzlement", "extortion", "other")
+PRIORITIES = ("low", "medium", "high", "critical")
+ACTION_STATUSES = ("pending", "in_progress", "completed")
+CHUNK = 50_000
+TABLES = ("action_items", "reports", "report_updates", "report_attachments", "documents")
+
+def insert_chunks(conn, table, count: int, make_row):
+    for start in range(0, count, CHUNK):
+        conn.execute(table.insert(), [make_row(number) for number in range(start, min(start + CHUNK, count))])
+
+def seed(engine, scale: float) -> dict:
+    from app import models
+
+    sizes = {name: max(1, int(count * scale)) for name, count in (
+        ("action_items", ACTION_ITEMS), ("reports", REPORTS), ("users", USERS),
+        ("meetings", MEETINGS), ("documents", DOCUMENTS)
+    )}
+    rng = random.Random(0)
+    now = datetime.utcnow()
+    statuses = list(models.ReportStatus)
+
+    with engine.begin() as conn:
+        insert_chunks(conn, models.User.__table__, sizes["users"], lambda number: {
+            "id": number + 1, "email": f"user{number}@example.org", "created_at": now, "updated_at": now
+        })
+        insert_chunks(conn, models.Meeting.__table__, sizes["meetings"], lambda number: {
+            "id": number + 1, "title": f"Meeting {number}", "created_at": now, "updated_at": now
+        })
+        insert_chunks(conn, models.ActionItem.__table__, sizes["action_items"], lambda number: {
+            "meeting_id": rng.randint(1, sizes["meetings"]),
+            # Most items are never assigned
+            "assigned_to": rng.randint(1, sizes["users"]) if rng.random() < 0.3 else None,
+            "description": "Follow up",
+            "priority": rng.choice(PRIORITIES),
+            "status": rng.choice(ACTION_STATUSES),
+            "created_at": now,
+            "updated_at": now,
+        })
+        insert_chunks(conn, models.Report.__table__, sizes["reports"], lambda number: {
+            "id": number + 1,
+            "report_id": f"CR-SEED-{number:07d}",
+            "content": "Seeded report",
+            "category": rng.choice(CATEGORIES),
+            "priority_level": rng.choice(PRIORITIES),
+            "status": rng.choice(statuses),
+            "created_at": now - timedelta(minutes=rng.randint(0, 525_600)),
+            "updated_at": now,
+        })
+        insert_chunks(conn, models.ReportAttachment.__table__, sizes["reports"], lambda number: {
+            "report_id": rng.randint(1, sizes["reports"]), "file_url": "https://example.org/file", "created_at": now
+        })
+        insert_chunks(conn, models.ReportUpdate.__table__, sizes["reports"], lambda number: {
+            "report_id": rng.randint(1, sizes["reports"]), "status": rng.choice(statuses), "notes": "", "created_at": now
+        })
+        insert_chunks(conn, models.Document.__table__, sizes["documents"], lambda number: {
+            "filename": "minutes.pdf", "uploaded_by": rng.randint(1, sizes["users"]), "created_at": now
+        })
+    return sizes
+
+def page(query, *order_by):
+    """Order and limit ``query`` like ``pagination.paginate`` does for a first page."""
+    from app.pagination import page_size
+
+    return query.order_by(*[column.desc() for column in order_by]).limit(page_size(None) + 1)
+
+def hot_queries(sizes: dict) -> list:
+    """(name, builder) pairs; each builder takes a random generator and returns a statement."""
+    from sqlalchemy import select
+    from app import models, queries
+
+    item, report = models.ActionItem, models.Report
+    return [
+        ("meeting action items", lambda rng: queries.action_items().where(item.meeting_id == rng.randint(1, sizes["meetings"]))),
+        ("user action items", lambda rng: page(queries.action_items().where(item.assigned_to == rng.randint(1, sizes["users"])), item.id)),
+        ("user action items by status", lambda rng: page(queries.action_items().where(
+            item.assigned_to == rng.randint(1, sizes["users"]), item.status == rng.choice(ACTION_STATUSES)
+        ), item.id)),
+        ("reports", lambda rng: page(select(report), report.created_at, report.id)),
+        ("reports by status", lambda rng: page(select(report).where(report.status == rng.choice(list(models.ReportStatus))), report.created_at, report.id)),
+        ("reports by category", lambda rng: page(select(report).where(report.category == rng.choice(CATEGORIES)), report.created_at, report.id)),
+        ("reports by priority", lambda rng: page(select(report).where(report.priority_level == rng.choice(PRIORITIES)), report.created_at, report.id)),
+        ("report attachments", lambda rng: select(models.ReportAttachment).where(models.ReportAttachment.report_id == rng.randint(1, sizes["reports"]))),
+        ("report updates", lambda rng: select(models.ReportUpdate).where(models.ReportUpdate.report_id == rng.randint(1, sizes["reports"]))),
+        ("user documents", lambda rng: page(select(models.Document).where(models.Document.uploaded_by == rng.randint(1, sizes["users"])), models.Document.id)),
+    ]
+
+def explain(conn, statement) -> list:
+    compiled = statement.compile(conn)
+    params = compiled.params
+    if compiled.positional:
+        params = tuple(params[name] for name in compiled.positiontup)
+    if conn.dialect.name == "sqlite":
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled.string}", params).fetchall()
+        return [row[-1] for row in rows]
+    return [row[0] for row in conn.exec_driver_sql(f"EXPLAIN {compiled.string}", params).fetchall()]
+
+def time_query(conn, build, repeat: int) -> float:
+    """Mean milliseconds per run, over ``repeat`` runs with fresh parameters."""
+    rng = random.Random(1)
+    statements = [build(rng) for _ in range(repeat)]
+    start = time.perf_counter()
+    for statement in statements:
+        conn.execute(statement).fetchall()
+    return (time.perf_counter() - start) / repeat * 1000
+
+def drop_secondary_indexes(engine):
+    from sqlalchemy import inspect, text
+
+    inspector = inspect(engine)
+    with engine.begin() as conn:
+        for table in TABLES:
+            for index in inspector.get_indexes(table):
+                if not index["unique"]:
+                    conn.execute(text(f'DROP INDEX "{index["name"]}"'))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, default=1.0, help="fraction of the full dataset to seed")
+    parser.add_argument("--repeat", type=int, default=20, help="runs per query")
+    parser.add_argument("--database-url", help="empty database to seed (default: a temporary SQLite file)")
+    args = parser.parse_args()
+
+    configure(**({"DATABASE_URL": args.database_url} if args.database_url else {}))
+    migrate()
+    from app.database import engine
+
+    start = time.perf_counter()
+    sizes = seed(engine, args.scale)
+    print(f"Seeded {sizes['action_items']} action items and {sizes['reports']} reports in {time.perf_counter() - start:.0f} s")
+
+    queries = hot_queries(sizes)
+    plans, indexed = {}, {}
+    with engine.connect() as conn:
+        for name, build in queries:
+            plans[name] = explain(conn, build(random.Random(1)))
+            indexed[name] = time_query(conn, build, args.repeat)
+    drop_secondary_indexes(engine)
+    rows = []
+    with engine.connect() as conn:
+        for name, build in queries:
+            unindexed = time_query(conn, build, args.repeat)
+            rows.append({
+                "query": name,
+                "indexed ms": f"{indexed[name]:.2f}",
+                "no index ms": f"{unindexed:.2f}",
+                "speedup": f"{unindexed / indexed[name]:.0f}x",
+            })
+    print_table(["query", "indexed ms", "no index ms", "speedup"], rows)
+    print("\nPlans with the indexes:")
+    for name, plan in plans.items():
+        print(f"  {name}:")
+        for line in plan:
+            print(f"    {line}")
+
+if __name__ == "__main__":
+    main()
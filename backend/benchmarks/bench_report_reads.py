@@ -0,0 +1,103 @@
+"""GET /reports/{report_id} under 500 concurrent clients.
+
+Seeds reports, starts the app under uvicorn in a separate process and has
+each client fetch random reports over its own keep-alive connection.
+Reports requests per second and the latency distribution.
+
+    python -m benchmarks.bench_report_reads [--clients 500] [--requests 20] [--workers 1]
+"""
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime
+from .common import configure, migrate, percentile, print_table, start_server, wait_until_ready
+
+SERVER_PORT = 8774
+
+def seed_reports(count: int) -> list:
+    from app import database, models
+
+    now = datetime.utcnow()
+    report_ids = [f"CR-BENCH-{number:06d}" for number in range(count)]
+    with database.SessionLocal() as db:
+        db.execute(models.Report.__table__.insert(), [
+            {
+                "report_id": report_id,
+                "content": "The tender was awarded without bids.",
+                "status": models.ReportStatus.SUBMITTED,
+                "category": "bribery",
+                "sub_categories": ["procurement"],
+                "severity_level": 3,
+                "priority_level": "high",
+                "entities_involved": [{"role": "official", "type": "individual"}],
+                "recommended_authorities": ["audit office"],
+                "risk_assessment": "moderate",
+                "potential_evidence": ["tender documents"],
+                "summary": "Alleged bid rigging.",
+                "credibility_score": 70.0,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for report_id in report_ids
+        ])
+        db.commit()
+    return report_ids
+
+async def run(clients: int, requests: int, report_ids: list):
+    import aiohttp
+
+    # A light client, so it takes as little CPU from the server as possible
+    connector = aiohttp.TCPConnector(limit=clients)
+    async with aiohttp.ClientSession(f"http://127.0.0.1:{SERVER_PORT}", connector=connector) as session:
+        await wait_until_ready(session, "/reports/missing")
+        latencies, errors = [], 0
+
+        async def one_client():
+            nonlocal errors
+            for _ in range(requests):
+                start = time.perf_counter()
+                async with session.get(f"/reports/{random.choice(report_ids)}") as response:
+                    await response.read()
+                latencies.append(time.perf_counter() - start)
+                if response.status != 200:
+                    errors += 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*[one_client() for _ in range(clients)])
+        elapsed = time.perf_counter() - start
+
+    print(f"{clients} concurrent clients x {requests} requests over {len(report_ids)} reports")
+    print_table(["requests", "errors", "seconds", "req/s", "p50 ms", "p99 ms", "max ms"], [{
+        "requests": len(latencies),
+        "errors": errors,
+        "seconds": round(elapsed, 2),
+        "req/s": round(len(latencies) / elapsed),
+        "p50 ms": round(percentile(latencies, 50) * 1000, 1),
+        "p99 ms": round(percentile(latencies, 99) * 1000, 1),
+        "max ms": round(max(latencies) * 1000, 1),
+    }])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=500, help="concurrent clients")
+    parser.add_argument("--requests", type=int, default=20, help="requests per client")
+    parser.add_argument("--reports", type=int, default=10000, help="reports to seed")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--database-url", help="database to run against (default: a temporary SQLite file)")
+    args = parser.parse_args()
+
+    configure(
+        **({"DATABASE_URL": args.database_url} if args.database_url else {})
+    )
+    migrate()
+    report_ids = seed_reports(args.reports)
+    server = start_server(SERVER_PORT, args.workers)
+    try:
+        asyncio.run(run(args.clients, args.requests, report_ids))
+    finally:
+        server.terminate()
+        server.wait()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""Throughput of POST /reports/ as the number of in-flight reports grows.
+
+Each client submits a report and polls its job until the analysis is done,
+against a local stub of the Groq API that answers after a fixed latency. If
+LLM calls block the event loop, throughput stays flat as clients are added
+and the stub never sees more than one call at a time; with the async client
+both grow with the clients. SQLite admits one writer at a time, so there the
+per-stage writes of each report soon bound throughput instead of the LLM;
+pass a PostgreSQL ``--database-url`` to measure the deployed setup.
+
+    python -m benchmarks.bench_reports [--latency 0.2] [--reports 64] [--database-url URL]
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import time
+from .common import configure, migrate, print_table, start_stub_groq
+
+CONCURRENCY_LEVELS = (1, 4, 16, 32)
+STUB_PORT = 8771
+
+async def submit_and_wait(client, content: str):
+    response = await client.post("/reports/", json={"content": content})
+    response.raise_for_status()
+    status_url = response.json()["status_url"]
+    while True:
+        job = (await client.get(status_url)).json()
+        if job["status"] in ("completed", "failed"):
+            return job["status"]
+        await asyncio.sleep(0.05)
+
+async def run(reports: int, latency: float):
+    import httpx
+    from app.main import app, lifespan
+
+    runner, stats = await start_stub_groq(STUB_PORT, latency)
+    rows = []
+    async with lifespan(app):
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=60) as client:
+            for concurrency in CONCURRENCY_LEVELS:
+                semaphore = asyncio.Semaphore(concurrency)
+
+                async def one(number: int):
+                    async with semaphore:
+                        return await submit_and_wait(client, f"Report {concurrency}-{number}: the tender was rigged.")
+
+                stats["peak_in_flight"] = 0
+                start = time.perf_counter()
+                # The pipeline logs its stage timings; keep the table readable
+                with contextlib.redirect_stdout(io.StringIO()):
+                    statuses = await asyncio.gather(*[one(number) for number in range(reports)])
+                elapsed = time.perf_counter() - start
+                rows.append({
+                    "in-flight": concurrency,
+                    "reports": reports,
+                    "failed": statuses.count("failed"),
+                    "seconds": round(elapsed, 2),
+                    "reports/s": round(reports / elapsed, 1),
+                    "peak LLM calls": stats["peak_in_flight"],
+                })
+    await runner.cleanup()
+    print(f"Stub LLM latency {latency * 1000:.0f} ms per call")
+    print_table(["in-flight", "reports", "failed", "seconds", "reports/s", "peak LLM calls"], rows)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.2, help="stub LLM latency in seconds")
+    parser.add_argument("--reports", type=int, default=64, help="reports submitted per concurrency level")
+    parser.add_argument("--database-url", help="database to run against (default: a temporary SQLite file)")
+    args = parser.parse_args()
+
+    configure(
+        **({"DATABASE_URL": args.database_url} if args.database_url else {}),
+        GROQ_BASE_URL=f"http://127.0.0.1:{STUB_PORT}",
+        JOB_WORKERS=str(max(CONCURRENCY_LEVELS)),
+        JOB_QUEUE_MAX_SIZE=str(args.reports * 2),
+        LLM_MAX_CONNECTIONS=str(max(CONCURRENCY_LEVELS) * 3),
+    )
+    migrate()
+    asyncio.run(run(args.reports, args.latency))
+
+if __name__ == "__main__":
+    main()
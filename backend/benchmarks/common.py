@@ -0,0 +1,124 @@
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+BENCH_DIR = tempfile.mkdtemp(prefix="backend-bench-")
+
+# Stub model answers, chosen by the system prompt of each agent
+STUB_ANSWERS = {
+    "anti-corruption analyst": {
+        "main_category": "bribery", "sub_categories": ["procurement"], "severity_level": 3,
+        "entities_involved": [{"role": "official", "type": "individual"}],
+        "estimated_financial_impact": None, "recommended_authorities": ["audit office"],
+        "risk_assessment": "moderate", "priority_level": "high",
+        "potential_evidence": ["invoices"], "summary": "Alleged bribe in a tender."
+    },
+    "data privacy": {"names": []},
+    "forensic": {"credibility_score": 70, "reasoning": "consistent details"},
+    "investigat": {"steps": ["Collect the tender documents"]},
+}
+
+def configure(**overrides: str):
+    """Point the app at a throwaway SQLite database and offline services.
+
+    Settings are read when the app is imported, so call this first.
+    """
+    os.environ.update({
+        "DATABASE_URL": f"sqlite:///{BENCH_DIR}/bench.db",
+        "SECRET_KEY": "bench-secret",
+        "ALGORITHM": "HS256",
+        "ACCESS_TOKEN_EXPIRE_MINUTES": "30",
+        "GOOGLE_CLIENT_ID": "bench-client-id",
+        "GOOGLE_CLIENT_SECRET": "bench-client-secret",
+        "GROQ_API_KEY": "bench-groq-key",
+        "LLM_CACHE_BACKEND": "none",
+        "STORAGE_BACKEND": "local",
+        "STORAGE_LOCAL_ROOT": f"{BENCH_DIR}/storage",
+        "JOB_UPLOAD_DIR": f"{BENCH_DIR}/job_uploads",
+        **overrides,
+    })
+    os.chdir(BACKEND_DIR)
+    sys.path.insert(0, str(BACKEND_DIR))
+
+def migrate():
+    from app.migrate import upgrade_database
+
+    upgrade_database()
+
+def stub_answer(system_prompt: str) -> str:
+    for marker, answer in STUB_ANSWERS.items():
+        if marker in system_prompt:
+            return json.dumps(answer)
+    return "stub response"
+
+async def start_stub_groq(port: int, latency: float):
+    """Serve Groq's chat completions API locally, answering after ``latency`` seconds.
+
+    Set GROQ_BASE_URL to ``http://127.0.0.1:<port>`` so the real SDK and
+    connection pool are exercised. Returns the aiohttp runner to clean up
+    and a dict counting calls and the peak number answered at once.
+    """
+    from aiohttp import web
+
+    stats = {"calls": 0, "in_flight": 0, "peak_in_flight": 0}
+
+    async def completions(request):
+        body = await request.json()
+        stats["calls"] += 1
+        stats["in_flight"] += 1
+        stats["peak_in_flight"] = max(stats["peak_in_flight"], stats["in_flight"])
+        try:
+            await asyncio.sleep(latency)
+        finally:
+            stats["in_flight"] -= 1
+        content = stub_answer(body["messages"][0]["content"])
+        return web.json_response({
+            "id": "stub", "object": "chat.completion", "created": 0, "model": body["model"],
+            "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": content}}],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+        })
+
+    app = web.Application()
+    app.router.add_post("/openai/v1/chat/completions", completions)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", port).start()
+    return runner, stats
+
+def start_server(port: int, workers: int = 1) -> subprocess.Popen:
+    """Serve the app with uvicorn in a separate process, configured like this one."""
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning", "--no-access-log"],
+        cwd=BACKEND_DIR,
+        env=os.environ.copy()
+    )
+
+async def wait_until_ready(session, path: str, timeout: float = 30.0):
+    """Retry ``path`` on an aiohttp session until the server answers."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            async with session.get(path):
+                return
+        except Exception:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.2)
+
+def percentile(values: Sequence[float], p: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))]
+
+def print_table(headers: List[str], rows: List[Dict[str, object]]):
+    widths = [max(len(header), *(len(str(row[header])) for row in rows)) for header in headers]
+    print("  ".join(header.rjust(width) for header, width in zip(headers, widths)))
+    for row in rows:
+        print("  ".join(str(row[header]).rjust(width) for header, width in zip(headers, widths)))
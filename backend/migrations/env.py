@@ -0,0 +1,100 @@
+from logging.config import fileConfig
+
+from sqlalchemy import create_engine, event, inspect, pool, text
+from sqlalchemy.engine import make_url
+
+from alembic import context
+
+from app import models  # noqa: F401  (registers every table on Base.metadata)
+from app.database import Base, SQLALCHEMY_DATABASE_URL, set_sqlite_pragmas
+
+# this is the Alembic Config object, which provides
+# access to the values within the .ini file in use.
+config = context.config
+
+# Interpret the config file for Python logging, leaving the server's
+# loggers alone when migrations run inside the app process.
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+# Arbitrary key for the Postgres advisory lock that serializes migrations
+MIGRATION_LOCK_KEY = 7243019
+
+def get_url() -> str:
+    return config.get_main_option("sqlalchemy.url") or SQLALCHEMY_DATABASE_URL
+
+def create_migration_engine(url: str):
+    """Create a single-connection engine for running migrations.
+
+    On SQLite the driver's implicit transactions are replaced with
+    ``BEGIN IMMEDIATE`` so DDL is transactional and the database write lock
+    is held for the whole upgrade; a second process waits instead of racing.
+    """
+    engine = create_engine(url, poolclass=pool.NullPool)
+    if make_url(url).get_backend_name() == "sqlite":
+        @event.listens_for(engine, "connect")
+        def on_connect(dbapi_connection, connection_record):
+            set_sqlite_pragmas(dbapi_connection, connection_record)
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine, "begin")
+        def on_begin(connection):
+            connection.exec_driver_sql("BEGIN IMMEDIATE")
+    return engine
+
+def acquire_migration_lock(connection):
+    """Block until no other process is migrating (released at commit)."""
+    if connection.dialect.name == "postgresql":
+        connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": MIGRATION_LOCK_KEY})
+
+def check_not_legacy(connection):
+    """Refuse to migrate a database created by the old create_all startup."""
+    if context.get_context().get_current_revision() is None and inspect(connection).get_table_names():
+        raise RuntimeError(
+            "Database has tables but no migration history (it predates migrations). "
+            "Point DATABASE_URL at a new database, or run `alembic stamp head` once "
+            "the existing schema has been checked against the models."
+        )
+
+def run_migrations_offline() -> None:
+    """Run migrations in 'offline' mode, emitting SQL to the script output."""
+    context.configure(
+        url=get_url(),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+        render_as_batch=make_url(get_url()).get_backend_name() == "sqlite",
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+def run_migrations_online() -> None:
+    """Run migrations against the live database under the migration lock."""
+    connectable = create_migration_engine(get_url())
+
+    with connectable.connect() as connection:
+        is_sqlite = connection.dialect.name == "sqlite"
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            render_as_batch=is_sqlite,
+            # DDL is transactional on SQLite once BEGIN is issued explicitly
+            transactional_ddl=True if is_sqlite else None,
+        )
+
+        with context.begin_transaction():
+            # The current revision is read after the lock is held, so a
+            # process that waited finds the schema already at head
+            acquire_migration_lock(connection)
+            check_not_legacy(connection)
+            context.run_migrations()
+
+    connectable.dispose()
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
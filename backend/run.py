@@ -1,4 +1,7 @@
 import uvicorn
+from app.migrate import upgrade_database
 
 if __name__ == "__main__":
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True) 
\ No newline at end of file
+    # Migrate once here, before uvicorn starts (and forks) any workers
+    upgrade_database()
+    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
@@ -0,0 +1,48 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+TEST_DIR = tempfile.mkdtemp(prefix="backend-tests-")
+
+# Settings are read when the app is imported, so configure a throwaway
+# SQLite database and offline services first
+os.environ.update({
+    "DATABASE_URL": f"sqlite:///{TEST_DIR}/test.db",
+    "SECRET_KEY": "test-secret",
+    "ALGORITHM": "HS256",
+    "ACCESS_TOKEN_EXPIRE_MINUTES": "30",
+    "GOOGLE_CLIENT_ID": "test-client-id",
+    "GOOGLE_CLIENT_SECRET": "test-client-secret",
+    "GROQ_API_KEY": "test-groq-key",
+    "LLM_CACHE_BACKEND": "none",
+    "STORAGE_BACKEND": "local",
+    "STORAGE_LOCAL_ROOT": f"{TEST_DIR}/storage",
+    "JOB_UPLOAD_DIR": f"{TEST_DIR}/job_uploads",
+})
+os.chdir(BACKEND_DIR)
+sys.path.insert(0, str(BACKEND_DIR))
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    return "asyncio"
+
+@pytest.fixture(scope="session")
+def database():
+    """Migrated test database, shared by the whole session."""
+    from app.migrate import upgrade_database
+
+    upgrade_database()
+    from app import database
+    return database
+
+@pytest.fixture
+async def client(database):
+    """HTTP client calling the app in-process, in the test's own context."""
+    import httpx
+    from app.main import app
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        yield client
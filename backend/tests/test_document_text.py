@@ -0,0 +1,127 @@
+"""Extracted-text store: one row per blob version, re-extracted when the blob changes."""
+import asyncio
+import hashlib
+import io
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import func, select, update
+from app import models
+from app.agents.file_agent import FileAgent
+from app.services.document_text import SPOOL_CHUNK_SIZE, DocumentTextStore
+
+pytestmark = pytest.mark.anyio
+
+class StubFileAgent:
+    """Serves one in-memory text blob and counts downloads."""
+
+    def __init__(self, blob: bytes):
+        self.blob = blob
+        self.downloads = 0
+
+    async def download_file(self, url):
+        self.downloads += 1
+        await asyncio.sleep(0.01)
+        return self.blob
+
+    async def parse_file_content(self, content, content_type=None):
+        return content.decode(), True
+
+class ChunkedUpload(io.BytesIO):
+    """An upload that fails if anything tries to read all of it at once."""
+
+    def read(self, size=-1):
+        assert 0 < size <= SPOOL_CHUNK_SIZE, "upload read in one piece"
+        return super().read(size)
+
+class StubResponse:
+    def __init__(self, etag):
+        self.status = 200
+        self.headers = {"ETag": etag}
+
+class StubHTTPClient:
+    def __init__(self, etag):
+        self.etag = etag
+        self.heads = 0
+
+    async def request(self, method, url):
+        self.heads += 1
+        return StubResponse(self.etag)
+
+@pytest.fixture
+async def document_id(database):
+    async with database.AsyncSessionLocal() as db:
+        document = models.Document(filename="notes.txt", firebase_url="https://blobs/notes.txt", content_type="text/plain")
+        db.add(document)
+        await db.commit()
+        return document.id
+
+async def read(database, store, document_id):
+    async with database.AsyncSessionLocal() as db:
+        document = await db.get(models.Document, document_id)
+        content, _ = await store.get_content(db, document)
+        return content
+
+async def stored_rows(database, document_id):
+    async with database.AsyncSessionLocal() as db:
+        return await db.scalar(
+            select(func.count()).select_from(models.DocumentText).where(models.DocumentText.document_id == document_id)
+        )
+
+async def test_concurrent_first_reads_store_one_row(database, document_id):
+    store = DocumentTextStore(StubFileAgent(b"first version"), StubHTTPClient('"v1"'))
+    contents = await asyncio.gather(*[read(database, store, document_id) for _ in range(5)])
+    assert contents == ["first version"] * 5
+    assert await stored_rows(database, document_id) == 1
+
+async def test_reads_within_the_check_interval_skip_storage(database, document_id):
+    file_agent, http = StubFileAgent(b"first version"), StubHTTPClient('"v1"')
+    store = DocumentTextStore(file_agent, http, check_interval_seconds=300)
+    await read(database, store, document_id)
+    heads = http.heads
+    for _ in range(3):
+        assert await read(database, store, document_id) == "first version"
+    assert file_agent.downloads == 1
+    assert http.heads == heads
+
+async def test_replaced_blob_is_re_extracted(database, document_id):
+    file_agent, http = StubFileAgent(b"first version"), StubHTTPClient('"v1"')
+    store = DocumentTextStore(file_agent, http, check_interval_seconds=300)
+    assert await read(database, store, document_id) == "first version"
+
+    # The blob is overwritten in storage; once the check interval passes the change is seen
+    file_agent.blob, http.etag = b"second version", '"v2"'
+    async with database.AsyncSessionLocal() as db:
+        await db.execute(
+            update(models.DocumentText)
+            .where(models.DocumentText.document_id == document_id)
+            .values(verified_at=datetime.utcnow() - timedelta(seconds=301))
+        )
+        await db.commit()
+
+    assert await read(database, store, document_id) == "second version"
+    assert file_agent.downloads == 2
+    assert await stored_rows(database, document_id) == 1
+
+async def test_upload_is_stored_without_reading_it_whole(database, document_id):
+    blob = ("minutes line\n" * 200000).encode()
+    store = DocumentTextStore(FileAgent(llm_client=None), StubHTTPClient('"v1"'))
+    async with database.AsyncSessionLocal() as db:
+        document = await db.get(models.Document, document_id)
+        await store.store_file(db, document, ChunkedUpload(blob))
+        assert document.content_hash == hashlib.sha256(blob).hexdigest()
+
+    file_agent = StubFileAgent(b"never downloaded")
+    assert await read(database, DocumentTextStore(file_agent, StubHTTPClient('"v1"')), document_id) == blob.decode()
+    assert file_agent.downloads == 0
+
+async def test_fallback_insert_ignores_duplicates(database, document_id, monkeypatch):
+    # Dialects without ON CONFLICT insert under a SAVEPOINT instead
+    bind = database.async_engine.sync_engine
+    monkeypatch.setattr(bind.dialect, "name", "other")
+    row = {"document_id": document_id, "content_hash": "abc", "text": "text", "created_at": datetime.utcnow()}
+    async with database.AsyncSessionLocal() as db:
+        for _ in range(2):
+            await database.insert_ignoring_conflicts(db, models.DocumentText, row, ["document_id", "content_hash"])
+        await db.commit()
+    monkeypatch.undo()
+    assert await stored_rows(database, document_id) == 1
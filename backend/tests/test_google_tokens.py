@@ -0,0 +1,144 @@
+"""Local Google ID token verification against a generated keypair and stub JWKS."""
+import json
+import time
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from fastapi import HTTPException
+from jose import jwk, jwt
+from app.auth import google
+from app.config import settings
+
+pytestmark = pytest.mark.anyio
+
+def make_keypair(kid: str):
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    public_jwk = {
+        name: value.decode() if isinstance(value, bytes) else value
+        for name, value in jwk.construct(public_pem, "RS256").to_dict().items()
+    }
+    public_jwk.update(kid=kid, alg="RS256", use="sig")
+    return private_pem, public_jwk
+
+SIGNING_KEY, PUBLIC_JWK = make_keypair("key-1")
+OTHER_SIGNING_KEY, OTHER_PUBLIC_JWK = make_keypair("key-2")
+
+def make_token(private_pem=SIGNING_KEY, kid="key-1", **claims):
+    now = int(time.time())
+    payload = {
+        "iss": "https://accounts.google.com",
+        "aud": settings.GOOGLE_CLIENT_ID,
+        "sub": "1234567890",
+        "email": "someone@example.com",
+        "email_verified": True,
+        "iat": now,
+        "exp": now + 600,
+        **claims
+    }
+    return jwt.encode(payload, private_pem, algorithm="RS256", headers={"kid": kid})
+
+@pytest.fixture
+def keys(tmp_path):
+    path = tmp_path / "jwks.json"
+    path.write_text(json.dumps({"keys": [PUBLIC_JWK]}))
+    return google.GoogleKeySet(client=None, url="", path=str(path))
+
+async def test_valid_token(keys):
+    claims = await google.verify_google_id_token(make_token(), keys)
+    assert claims["email"] == "someone@example.com"
+
+async def test_short_issuer_is_accepted(keys):
+    claims = await google.verify_google_id_token(make_token(iss="accounts.google.com"), keys)
+    assert claims["sub"] == "1234567890"
+
+@pytest.mark.parametrize("claims", [
+    {"aud": "someone-elses-client-id"},
+    {"iss": "https://evil.example.com"},
+    {"exp": int(time.time()) - 60},
+], ids=["wrong-aud", "wrong-iss", "expired"])
+async def test_rejected_claims(keys, claims):
+    with pytest.raises(HTTPException) as error:
+        await google.verify_google_id_token(make_token(**claims), keys)
+    assert error.value.status_code == 400
+
+async def test_unknown_kid_is_rejected(keys):
+    token = make_token(private_pem=OTHER_SIGNING_KEY, kid="key-2")
+    with pytest.raises(HTTPException) as error:
+        await google.verify_google_id_token(token, keys)
+    assert error.value.status_code == 400
+
+async def test_key_id_with_the_wrong_key_is_rejected(keys):
+    token = make_token(private_pem=OTHER_SIGNING_KEY, kid="key-1")
+    with pytest.raises(HTTPException):
+        await google.verify_google_id_token(token, keys)
+
+async def test_malformed_token_is_rejected(keys):
+    with pytest.raises(HTTPException):
+        await google.verify_google_id_token("not-a-jwt", keys)
+
+def test_parse_max_age():
+    assert google.parse_max_age("public, max-age=19405, must-revalidate, no-transform") == 19405
+    assert google.parse_max_age("no-cache") == google.DEFAULT_MAX_AGE_SECONDS
+    assert google.parse_max_age(None) == google.DEFAULT_MAX_AGE_SECONDS
+
+class FakeResponse:
+    def __init__(self, jwks, cache_control):
+        self.status = 200
+        self.headers = {"Cache-Control": cache_control}
+        self._jwks = jwks
+
+    def json(self):
+        return self._jwks
+
+class FakeHTTPClient:
+    """Serves a JWKS with a Cache-Control header and counts the fetches."""
+
+    def __init__(self, jwks, cache_control="public, max-age=300"):
+        self.jwks = jwks
+        self.cache_control = cache_control
+        self.fetches = 0
+
+    async def get(self, url):
+        self.fetches += 1
+        return FakeResponse(self.jwks, self.cache_control)
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [time.time()]
+    monkeypatch.setattr(google.time, "time", lambda: now[0])
+    return now
+
+async def test_keys_are_cached_for_max_age(clock):
+    client = FakeHTTPClient({"keys": [PUBLIC_JWK]}, "public, max-age=300")
+    keys = google.GoogleKeySet(client, "https://keys.example.com")
+
+    await keys.get_key("key-1")
+    clock[0] += 299
+    await keys.get_key("key-1")
+    assert client.fetches == 1
+
+    # Past max-age, the next lookup refetches
+    clock[0] += 2
+    await keys.get_key("key-1")
+    assert client.fetches == 2
+
+async def test_rotated_key_refreshes_at_most_once_a_minute(clock):
+    client = FakeHTTPClient({"keys": [PUBLIC_JWK]}, "public, max-age=3600")
+    keys = google.GoogleKeySet(client, "https://keys.example.com")
+    await keys.get_key("key-1")
+
+    # Unknown key ids within the minute do not hammer the endpoint
+    assert await keys.get_key("key-2") is None
+    assert client.fetches == 1
+
+    # Google rotates in a new key; the next unknown kid after a minute finds it
+    client.jwks = {"keys": [PUBLIC_JWK, OTHER_PUBLIC_JWK]}
+    clock[0] += google.MIN_REFRESH_INTERVAL_SECONDS
+    assert await keys.get_key("key-2") == OTHER_PUBLIC_JWK
+    assert client.fetches == 2
@@ -0,0 +1,41 @@
+"""Startup budget: importing the app must stay cheap and must not pull in SDKs."""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Cumulative `python -X importtime` budget for app.main, in seconds. It is
+# about 1.2s today; override on slow CI machines.
+IMPORT_TIME_BUDGET_SECONDS = float(os.environ.get("IMPORT_TIME_BUDGET_SECONDS", "2.5"))
+
+# Built lazily by the service container, so never imported with the app
+HEAVY_MODULES = (
+    "groq", "google.generativeai", "firebase_admin", "googletrans",
+    "PyPDF2", "aiohttp", "speech_recognition", "pydub", "alembic"
+)
+
+def import_app(code: str = "") -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import app.main\n{code}"],
+        cwd=BACKEND_DIR, env=os.environ.copy(), capture_output=True, text=True, check=True
+    )
+
+def cumulative_import_seconds(importtime_log: str, module: str) -> float:
+    # Lines look like "import time:   self [us] | cumulative | imported package"
+    for line in importtime_log.splitlines():
+        fields = [field.strip() for field in line.removeprefix("import time:").split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1]) / 1_000_000
+    raise AssertionError(f"{module} not found in -X importtime output")
+
+def test_app_import_stays_within_budget():
+    seconds = cumulative_import_seconds(import_app().stderr, "app.main")
+    assert seconds <= IMPORT_TIME_BUDGET_SECONDS, (
+        f"import app.main took {seconds:.2f}s (budget {IMPORT_TIME_BUDGET_SECONDS}s)"
+    )
+
+def test_app_import_skips_heavy_sdks():
+    result = import_app(f"import sys; print([m for m in {HEAVY_MODULES!r} if m in sys.modules])")
+    assert result.stdout.strip() == "[]"
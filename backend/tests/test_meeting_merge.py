@@ -0,0 +1,64 @@
+"""Merging windowed meeting analyses and reading the stored meeting back."""
+import pytest
+from app import models
+from app.agents.meeting_analyzer import merge_analyses
+from app.main import insert_meeting_analysis_rows
+
+pytestmark = pytest.mark.anyio
+
+# The same topic, task and person in every window; only the second window
+# says how important, urgent or who they are
+WINDOWS = [
+    {
+        "key_topics": [{"topic": "Budget", "key_points": ["overrun"]}],
+        "action_items": [{"task": "Audit the budget"}],
+        "participants": [{"name": "Ana", "contributions": ["opened"]}],
+    },
+    {
+        "key_topics": [{"topic": "budget", "key_points": ["cuts"], "importance_level": "high"}],
+        "action_items": [{"task": "audit the budget", "priority": "high"}],
+        "participants": [{"name": "ana", "role": "chair"}],
+    },
+    {
+        "key_topics": [{"topic": "Parks", "key_points": []}, {"topic": "parks", "key_points": ["benches"]}],
+        "action_items": [{"task": "Fix benches"}, {"task": "fix benches", "owner": None}],
+        "participants": [{"name": "Ben"}, {"name": "ben"}],
+    },
+]
+
+def test_merge_keeps_fields_given_by_any_window():
+    merged = merge_analyses(WINDOWS)
+    topics = {topic["topic"]: topic for topic in merged["key_topics"]}
+    items = {item["task"]: item for item in merged["action_items"]}
+    people = {person["name"]: person for person in merged["participants"]}
+
+    assert topics["Budget"]["importance_level"] == "high"
+    assert items["Audit the budget"]["priority"] == "high"
+    assert people["Ana"]["role"] == "chair"
+
+def test_merge_leaves_fields_no_window_gave_unset():
+    merged = merge_analyses(WINDOWS)
+    topics = {topic["topic"]: topic for topic in merged["key_topics"]}
+    items = {item["task"]: item for item in merged["action_items"]}
+    people = {person["name"]: person for person in merged["participants"]}
+
+    assert "importance_level" not in topics["Parks"]
+    assert "priority" not in items["Fix benches"]
+    assert "owner" not in items["Fix benches"]
+    assert "role" not in people["Ben"]
+
+async def test_merged_meeting_reads_back_through_the_api(database, client):
+    async with database.AsyncSessionLocal() as db:
+        meeting = models.Meeting(title="Council")
+        db.add(meeting)
+        await db.flush()
+        await insert_meeting_analysis_rows(db, meeting.id, merge_analyses(WINDOWS))
+        await db.commit()
+        meeting_id = meeting.id
+
+    response = await client.get(f"/meetings/{meeting_id}")
+    assert response.status_code == 200, response.text
+    meeting = response.json()
+    assert {topic["topic"]: topic["importance_level"] for topic in meeting["topics"]} == {"Budget": "high", "Parks": "medium"}
+    assert {item["description"]: item["priority"] for item in meeting["action_items"]} == {"Audit the budget": "high", "Fix benches": "medium"}
+    assert {person["name"]: person["role"] for person in meeting["participants"]} == {"Ana": "chair", "Ben": "participant"}
@@ -0,0 +1,57 @@
+"""Report submission when its analysis job cannot be queued."""
+from datetime import datetime, timedelta
+import pytest
+from sqlalchemy import func, select
+from app import models
+from app.main import job_queue
+from app.services.jobs import QueueFullError
+
+pytestmark = pytest.mark.anyio
+
+async def test_report_is_discarded_when_the_queue_is_full(database, client, monkeypatch):
+    async def submit(kind, payload):
+        raise QueueFullError("Job queue is full, try again later")
+
+    monkeypatch.setattr(job_queue, "is_full", lambda: False)
+    monkeypatch.setattr(job_queue, "submit", submit)
+    content = "Queue-full report"
+
+    response = await client.post("/reports/", json={"content": content, "attachments": ["https://files/1"]})
+
+    assert response.status_code == 503
+    async with database.AsyncSessionLocal() as db:
+        reports = await db.scalar(select(func.count()).select_from(models.Report).where(models.Report.content == content))
+        attachments = await db.scalar(select(func.count()).select_from(models.ReportAttachment).where(
+            models.ReportAttachment.file_url == "https://files/1"
+        ))
+    assert reports == 0
+    assert attachments == 0
+
+async def test_report_of_a_job_that_keeps_dying_is_discarded(database):
+    lapsed = datetime.utcnow() - timedelta(minutes=5)
+    async with database.AsyncSessionLocal() as db:
+        report = models.Report(content="Poison report")
+        db.add(report)
+        await db.flush()
+        db.add_all([
+            models.Job(
+                id="poison", kind="report", status=models.JobStatus.RUNNING, payload={"report_db_id": report.id},
+                attempts=job_queue.max_attempts, lease_expires_at=lapsed
+            ),
+            models.Job(
+                id="retried", kind="report", status=models.JobStatus.RUNNING, payload={"report_db_id": report.id},
+                attempts=1, lease_expires_at=lapsed
+            ),
+        ])
+        await db.commit()
+        report_id = report.id
+
+    await job_queue._fail_exhausted_jobs()
+    pending = await job_queue._pending_job_ids()
+
+    async with database.AsyncSessionLocal() as db:
+        poison = await db.get(models.Job, "poison")
+        assert poison.status == models.JobStatus.FAILED
+        assert await db.get(models.Report, report_id) is None
+    assert "retried" in pending
+    assert "poison" not in pending
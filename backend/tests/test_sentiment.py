@@ -0,0 +1,59 @@
+"""Label handling of the local sentiment backends, with a stubbed model."""
+import pytest
+from app.agents.sentiment_analysis import (
+    FallbackSentimentBackend, LexiconSentimentBackend, SentimentAnalysisAgent,
+    TransformersSentimentBackend, UnknownSentimentLabel, create_sentiment_backend, parse_label_map
+)
+from app.config import Settings
+
+def stub_backend(outputs, **kwargs):
+    backend = TransformersSentimentBackend(**kwargs)
+    backend._pipeline = lambda texts, **_: outputs[:len(texts)]
+    return backend
+
+def test_binary_labels():
+    backend = stub_backend([{"label": "NEGATIVE", "score": 0.99}, {"label": "POSITIVE", "score": 0.99}])
+    negative, positive = backend.analyze_batch(["bad", "good"])
+    assert negative["sentiment_label"] == "negative" and negative["sentiment_score"] < 1
+    assert positive["sentiment_label"] == "positive" and positive["sentiment_score"] > 4
+
+def test_confident_neutral_label_is_neutral():
+    backend = stub_backend([{"label": "neutral", "score": 0.98}])
+    assert backend.analyze_batch(["the meeting is at noon"]) == [{"sentiment_score": 2.5, "sentiment_label": "neutral"}]
+
+def test_generic_labels_use_the_label_map():
+    outputs = [{"label": "LABEL_0", "score": 0.95}, {"label": "LABEL_1", "score": 0.95}, {"label": "LABEL_2", "score": 0.95}]
+    backend = stub_backend(outputs, label_map=parse_label_map("LABEL_0:negative, LABEL_1:neutral, LABEL_2:positive"))
+    labels = [result["sentiment_label"] for result in backend.analyze_batch(["a", "b", "c"])]
+    assert labels == ["negative", "neutral", "positive"]
+
+def test_unmapped_label_is_rejected():
+    backend = stub_backend([{"label": "LABEL_0", "score": 0.95}])
+    with pytest.raises(UnknownSentimentLabel):
+        backend.analyze_batch(["terrible service"])
+
+def test_unmapped_label_falls_back_to_the_lexicon():
+    backend = FallbackSentimentBackend(stub_backend([{"label": "LABEL_1", "score": 0.95}]))
+    assert backend.analyze_batch(["terrible, broken and dirty"])[0]["sentiment_label"] == "negative"
+    assert backend._primary_unavailable
+
+def test_invalid_label_map():
+    with pytest.raises(ValueError):
+        parse_label_map("LABEL_0:angry")
+
+def test_lexicon_is_the_default_backend():
+    assert Settings.model_fields["SENTIMENT_BACKEND"].default == "lexicon"
+    assert isinstance(create_sentiment_backend(), LexiconSentimentBackend)
+
+def test_llm_backend_leaves_sentiment_to_the_llm():
+    assert create_sentiment_backend("llm") is None
+
+class StubTranslator:
+    async def translate(self, text, dest):
+        return type("Translated", (), {"text": f"{dest}:{text}"})()
+
+@pytest.mark.anyio
+async def test_translate_document_awaits_googletrans():
+    agent = SentimentAnalysisAgent(backend=create_sentiment_backend("lexicon"))
+    agent._translator = StubTranslator()
+    assert await agent.translate_document("hola", "en") == "en:hola"
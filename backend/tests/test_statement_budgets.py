@@ -0,0 +1,63 @@
+"""Fixed SQL statement counts for read endpoints, so N+1 regressions fail."""
+from datetime import datetime
+import pytest
+from app import models
+from app.services.container import services
+
+pytestmark = pytest.mark.anyio
+
+# Related rows per parent; the budgets must not depend on these
+ROWS = 5
+
+class StubMeetingAnalyzer:
+    async def generate_meeting_minutes(self, analysis):
+        return "minutes"
+
+@pytest.fixture
+async def meeting_id(database):
+    async with database.AsyncSessionLocal() as db:
+        meeting = models.Meeting(title="Budget review", transcript="text", summary="summary")
+        db.add(meeting)
+        await db.flush()
+        for i in range(ROWS):
+            db.add(models.MeetingTopic(meeting_id=meeting.id, topic=f"topic {i}", key_points=[], decisions_made=[], importance_level="low"))
+            db.add(models.ActionItem(meeting_id=meeting.id, description=f"task {i}", assigned_to=1, priority="low", status="pending"))
+            db.add(models.MeetingParticipant(meeting_id=meeting.id, name=f"person {i}", role="member", contributions=[]))
+        await db.commit()
+        return meeting.id
+
+@pytest.fixture
+async def report_id(database):
+    public_id = f"RPT-TEST-{datetime.utcnow().timestamp()}"
+    async with database.AsyncSessionLocal() as db:
+        report = models.Report(
+            report_id=public_id, content="content", category="bribery", sub_categories=[],
+            severity_level=3, priority_level="high", entities_involved=[], recommended_authorities=[],
+            risk_assessment="risk", potential_evidence=[], summary="summary", credibility_score=50.0
+        )
+        db.add(report)
+        await db.flush()
+        for i in range(ROWS):
+            db.add(models.ReportAttachment(report_id=report.id, file_url=f"https://files/{i}"))
+        await db.commit()
+    return public_id
+
+async def get_counted(database, client, url):
+    with database.count_statements() as counter:
+        response = await client.get(url)
+    assert response.status_code == 200, response.text
+    return counter.count
+
+async def test_meeting_detail_loads_children_in_one_query_each(database, client, meeting_id):
+    # The meeting, then topics, action items and participants
+    assert await get_counted(database, client, f"/meetings/{meeting_id}") <= 4
+
+async def test_meeting_minutes_loads_children_in_one_query_each(database, client, meeting_id, monkeypatch):
+    monkeypatch.setitem(services.__dict__, "meeting_analyzer", StubMeetingAnalyzer())
+    assert await get_counted(database, client, f"/meetings/{meeting_id}/minutes") <= 4
+
+async def test_meeting_action_items_is_one_query(database, client, meeting_id):
+    assert await get_counted(database, client, f"/meetings/{meeting_id}/action-items") <= 1
+
+async def test_report_read_is_one_query(database, client, report_id):
+    assert await get_counted(database, client, f"/reports/{report_id}") <= 1